@@ -19,6 +19,23 @@ from core.resource_models import ResourceDefinition, ResourceResult
 from templates.automation_templates import AutomationTemplates
 
 
+# Resource definitions are static, so build them once at import time
+_APPLESCRIPT_RESOURCES = (
+    ResourceDefinition(
+        uri="applescript://apps",
+        name="Running Applications",
+        description="List of currently running applications",
+        mimeType="application/json"
+    ),
+    ResourceDefinition(
+        uri="applescript://system",
+        name="System Information",
+        description="macOS system information via AppleScript",
+        mimeType="application/json"
+    )
+)
+
+
 class AppleScriptConnector(BaseConnector):
     """AppleScript connector for macOS automation"""
     
@@ -271,20 +288,7 @@ class AppleScriptConnector(BaseConnector):
     
     def get_resources(self) -> List[ResourceDefinition]:
         """Define AppleScript resources"""
-        return [
-            ResourceDefinition(
-                uri="applescript://apps",
-                name="Running Applications",
-                description="List of currently running applications",
-                mimeType="application/json"
-            ),
-            ResourceDefinition(
-                uri="applescript://system",
-                name="System Information",
-                description="macOS system information via AppleScript",
-                mimeType="application/json"
-            )
-        ]
+        return list(_APPLESCRIPT_RESOURCES)
     
     async def read_resource(self, uri: str) -> ResourceResult:
         """Read AppleScript resources"""
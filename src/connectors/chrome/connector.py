@@ -1,29 +1,309 @@
 """
 Chrome Connector for MCP Gateway
 Provides Chrome browser automation and chromeless launching capabilities
+
+App-mode windows are started with --remote-debugging-port=0 so later URLs can
+be opened as tabs in a warm instance. Chrome binds that DevTools endpoint to
+127.0.0.1 only, but it is unauthenticated: any local process can drive those
+windows (and read their temporary profiles) while they are open.
 """
 
+import atexit
+import json
 import logging
+import shutil
+import signal
 import subprocess
 import tempfile
+import threading
+import time
 import os
 import platform
-from typing import Dict, List, Any, Optional
+import urllib.parse
+import urllib.request
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Any, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
 
 from core.base_connector import BaseConnector
 from core.models import ToolDefinition
 from core.resource_models import ResourceDefinition
+from templates.browser_templates import BrowserTemplates
 
 logger = logging.getLogger(__name__)
 
+_IS_MACOS = platform.system() == "Darwin"
+
+# Marker identifying Chrome processes launched with the dashboard user data directory
+DASHBOARD_DIR_MARKER = ".chrome_dashboard"
+DASHBOARD_USER_DATA_DIR = os.path.expanduser(f"~/{DASHBOARD_DIR_MARKER}")
+# Records the process group of the Chrome session launched into the dashboard directory
+DASHBOARD_SESSION_FILE = os.path.join(DASHBOARD_USER_DATA_DIR, ".session")
+
+# How often the background reaper collects exited Chrome children
+REAP_INTERVAL_SECONDS = 1.0
+
+# Bounded wait for terminated dashboard sessions to exit before relaunching
+GROUP_EXIT_TIMEOUT_SECONDS = 1.0
+GROUP_EXIT_POLL_SECONDS = 0.05
+
+# Maximum number of warm app-mode Chrome instances kept for tab reuse. Instances
+# beyond this are only dropped from the pool; their windows stay open
+APP_POOL_SIZE = 4
+# Timeout for DevTools HTTP requests to pooled instances
+DEVTOOLS_TIMEOUT_SECONDS = 2.0
+
+# Invariant flags for app-mode launches
+_APP_BASE_FLAGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-default-apps"
+)
+# Chrome's disk cache is scratch data; keep it on tmpfs where available
+_TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# DevTools endpoints are local; never route them through an HTTP proxy from the environment
+_LOCAL_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+@dataclass
+class ChromeAppInstance:
+    """A running app-mode Chrome that can open further URLs as new tabs."""
+    pid: int
+    user_data_dir: str
+    debug_port: Optional[int] = None
+
+
+def _is_dashboard_chrome(executable: str, cmdline: str) -> bool:
+    """Check whether a process is a Chrome binary running with the dashboard profile."""
+    return "chrome" in os.path.basename(executable).lower() and DASHBOARD_DIR_MARKER in cmdline
+
+
+def _spawn_detached(cmd: List[str]) -> int:
+    """Start a fire-and-forget process in its own session and return its PID.
+
+    Uses posix_spawn so the (potentially large) gateway process is never forked;
+    falls back to subprocess.Popen where posix_spawn or POSIX_SPAWN_SETSID is unavailable.
+    """
+    if hasattr(os, "posix_spawnp"):
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_RDWR, 0)
+            for fd in (0, 1, 2)
+        ]
+        try:
+            return os.posix_spawnp(cmd[0], cmd, os.environ, file_actions=file_actions, setsid=True)
+        except NotImplementedError:
+            pass  # setsid not supported by this platform's posix_spawn
+    
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    return process.pid
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ChromelessLaunchResult:
+    """Result of a successful chromeless launch."""
+    success: bool = True
+    url: str
+    mode: str
+    pid: int
+    user_data_dir: str
+    command: str
+    command_argv: List[str]
+    single_instance: bool
+    message: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AppLaunchResult:
+    """Result of a successful app-mode launch (new process or pooled tab)."""
+    success: bool = True
+    url: str
+    mode: str = "app"
+    pid: int
+    window_size: str
+    window_position: Optional[str]
+    user_data_dir: str
+    reused: bool
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KillResult:
+    """Result of a Chrome termination request; unset optional fields are omitted."""
+    success: bool
+    dashboard_only: bool
+    force: bool
+    message: Optional[str] = None
+    error: Optional[str] = None
+    terminated_pids: Optional[List[int]] = None
+    terminated_pgids: Optional[List[int]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+def _remove_dirs(paths: List[str]) -> None:
+    """Best-effort removal of temporary Chrome directories."""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _read_devtools_port(user_data_dir: str) -> Optional[int]:
+    """Read the DevTools port Chrome chose for --remote-debugging-port=0."""
+    try:
+        with open(os.path.join(user_data_dir, "DevToolsActivePort")) as f:
+            return int(f.readline())
+    except (OSError, ValueError):
+        return None  # Chrome has not finished starting (or failed to)
+
+
+def _pgid_alive(pgid: int) -> bool:
+    """Probe whether any process in a process group is still alive."""
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists but owned by another user
+    return True
+
+
+def _write_dashboard_session(pgid: int) -> None:
+    """Persist the process group of the dashboard Chrome session leader."""
+    try:
+        with open(DASHBOARD_SESSION_FILE, "w") as f:
+            json.dump({"pgid": pgid}, f)
+    except OSError as e:
+        logger.warning(f"Failed to record dashboard Chrome session: {e}")
+
+
+def _read_dashboard_session() -> Optional[int]:
+    """Return the recorded dashboard Chrome process group, if any."""
+    try:
+        with open(DASHBOARD_SESSION_FILE) as f:
+            return int(json.load(f)["pgid"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _clear_dashboard_session() -> None:
+    """Forget the recorded dashboard Chrome session."""
+    try:
+        os.remove(DASHBOARD_SESSION_FILE)
+    except OSError:
+        pass
+
+
+# Live connectors, reaped once at interpreter exit without being kept alive
+_LIVE_CONNECTORS: "weakref.WeakSet[ChromeConnector]" = weakref.WeakSet()
+
+
+def _reap_live_connectors() -> None:
+    """Clean up temp profiles of instances that exited before the gateway; running ones keep theirs"""
+    for connector in list(_LIVE_CONNECTORS):
+        connector._reap_children()
+
+
+atexit.register(_reap_live_connectors)
+
+
+# Tool and resource definitions are static, so build them once at import time
+_CHROME_TOOLS = (
+    ToolDefinition(
+        name="chrome_launch_chromeless",
+        description=BrowserTemplates.TOOL_DESC["chromeless"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                **BrowserTemplates.get_params("launch"),
+                "user_data_dir": {
+                    "type": "string",
+                    "description": "Custom user data directory (optional, uses ~/.chrome_dashboard for single instance)"
+                },
+                "additional_flags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Additional Chrome command line flags"
+                }
+            },
+            "required": []
+        }
+    ),
+    ToolDefinition(
+        name="chrome_launch_app",
+        description=BrowserTemplates.TOOL_DESC["app"],
+        input_schema={
+            "type": "object",
+            "properties": {
+                **BrowserTemplates.get_params("app_launch"),
+                "window_position": {"type": "string", "description": "Window position (e.g., '0,0')"}
+            },
+            "required": ["url"]
+        }
+    ),
+    ToolDefinition(**BrowserTemplates.get_tool_definition("kill", "chrome_kill_processes")),
+    ToolDefinition(**BrowserTemplates.get_tool_definition("list", "chrome_list_dashboard_processes"))
+)
+
+_CHROME_RESOURCES = (
+    ResourceDefinition(
+        uri="chrome://running-processes",
+        name="Chrome Running Processes",
+        description="List of running Chrome processes",
+        mimeType="application/json"
+    ),
+)
+
 
 class ChromeConnector(BaseConnector):
     """Chrome browser automation connector."""
 
     def __init__(self, name: str = "chrome", config: Dict[str, Any] = None):
         super().__init__(name, config or {})
-        self.is_macos = platform.system() == 'Darwin'
+        self.is_macos = _IS_MACOS
         self.chrome_path = self._find_chrome_executable()
+        
+        # Platform-specific process commands, resolved once
+        if self.is_macos:
+            self._pgrep_cmd = ("pgrep", "-f", "Google Chrome")
+            self._kill_cmd_soft = ("killall", "Google Chrome")
+            self._kill_cmd_force = ("killall", "-9", "Google Chrome")
+        else:
+            self._pgrep_cmd = ("pgrep", "-f", "chrome")
+            self._kill_cmd_soft = ("pkill", "-f", "chrome")
+            self._kill_cmd_force = ("pkill", "-9", "-f", "chrome")
+        
+        # PIDs of launched Chrome processes that have not been reaped yet
+        self._children: set[int] = set()
+        # Temporary directories to delete once the owning Chrome PID has exited
+        self._temp_dirs: Dict[int, List[str]] = {}
+        self._children_lock = threading.Lock()
+        self._reaper_thread: Optional[threading.Thread] = None
+        
+        # Warm app-mode instances keyed by window geometry, least recently used first
+        self._app_pool: "OrderedDict[str, ChromeAppInstance]" = OrderedDict()
+        
+        # Tool name -> handler taking the tool arguments
+        self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "chrome_launch_chromeless": self._launch_chromeless,
+            "chrome_launch_app": self._launch_app,
+            "chrome_kill_processes": self._kill_processes,
+            "chrome_list_dashboard_processes": lambda arguments: self._get_dashboard_chrome_processes()
+        }
+        
+        _LIVE_CONNECTORS.add(self)
 
     def _find_chrome_executable(self) -> str:
         """Find the Chrome executable path based on the platform."""
@@ -44,125 +324,19 @@ class ChromeConnector(BaseConnector):
 
     def get_tools(self) -> List[ToolDefinition]:
         """Return the tools provided by this connector."""
-        return [
-            ToolDefinition(
-                name="chrome_launch_chromeless",
-                description="Launch Chrome in chromeless mode for dashboard viewing. Replaces existing Chrome instances by default.",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to open in chromeless mode",
-                            "default": "http://localhost:8090"
-                        },
-                        "mode": {
-                            "type": "string",
-                            "enum": ["kiosk", "app", "fullscreen"],
-                            "description": "Launch mode: 'kiosk' (full kiosk), 'app' (chromeless window - default), 'fullscreen' (fullscreen window)",
-                            "default": "app"
-                        },
-                        "single_instance": {
-                            "type": "boolean",
-                            "description": "Replace existing Chrome instances (default: true)",
-                            "default": True
-                        },
-                        "disable_security": {
-                            "type": "boolean",
-                            "description": "Disable web security for local development (default: true)",
-                            "default": True
-                        },
-                        "user_data_dir": {
-                            "type": "string",
-                            "description": "Custom user data directory (optional, uses ~/.chrome_dashboard for single instance)"
-                        },
-                        "additional_flags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Additional Chrome command line flags"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            ToolDefinition(
-                name="chrome_launch_app",
-                description="Launch Chrome in app mode (chromeless window) for a specific URL",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "URL to open as Chrome app"
-                        },
-                        "window_size": {
-                            "type": "string",
-                            "description": "Window size (e.g., '1920,1080')",
-                            "default": "1920,1080"
-                        },
-                        "window_position": {
-                            "type": "string",
-                            "description": "Window position (e.g., '0,0')"
-                        }
-                    },
-                    "required": ["url"]
-                }
-            ),
-            ToolDefinition(
-                name="chrome_kill_processes",
-                description="Kill all Chrome processes (useful for cleanup)",
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "force": {
-                            "type": "boolean",
-                            "description": "Force kill Chrome processes (default: false)",
-                            "default": False
-                        },
-                        "dashboard_only": {
-                            "type": "boolean", 
-                            "description": "Kill only dashboard Chrome instances (default: false)",
-                            "default": False
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            ToolDefinition(
-                name="chrome_list_dashboard_processes",
-                description="List Chrome processes running with dashboard user data directory",
-                input_schema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            )
-        ]
+        return list(_CHROME_TOOLS)
 
     def get_resources(self) -> List[ResourceDefinition]:
         """Return the resources provided by this connector."""
-        return [
-            ResourceDefinition(
-                uri="chrome://running-processes",
-                name="Chrome Running Processes",
-                description="List of running Chrome processes",
-                mimeType="application/json"
-            )
-        ]
+        return list(_CHROME_RESOURCES)
 
     def execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool with the given arguments."""
         try:
-            if tool_name == "chrome_launch_chromeless":
-                return self._launch_chromeless(arguments)
-            elif tool_name == "chrome_launch_app":
-                return self._launch_app(arguments)
-            elif tool_name == "chrome_kill_processes":
-                return self._kill_processes(arguments)
-            elif tool_name == "chrome_list_dashboard_processes":
-                return self._get_dashboard_chrome_processes()
-            else:
+            handler = self._tool_handlers.get(tool_name)
+            if handler is None:
                 return {"error": f"Unknown tool: {tool_name}"}
+            return handler(arguments)
                 
         except Exception as e:
             logger.error(f"Error executing {tool_name}: {str(e)}")
@@ -179,34 +353,25 @@ class ChromeConnector(BaseConnector):
         additional_flags = arguments.get("additional_flags", [])
         single_instance = arguments.get("single_instance", True)
 
-        # Check for existing dashboard Chrome processes and terminate them if single_instance is True
+        # Terminate existing dashboard Chrome sessions if single_instance is True
         if single_instance:
-            existing_processes = self._get_dashboard_chrome_processes()
-            if existing_processes.get("count", 0) > 0:
-                logger.info(f"Found {existing_processes['count']} existing dashboard Chrome processes, terminating them...")
-                # Kill specific dashboard processes
-                for pid in existing_processes.get("dashboard_processes", []):
-                    try:
-                        import signal
-                        os.kill(pid, signal.SIGTERM)
-                        logger.info(f"Terminated Chrome process PID: {pid}")
-                    except ProcessLookupError:
-                        logger.info(f"Process PID {pid} already terminated")
-                    except Exception as e:
-                        logger.warning(f"Failed to terminate process PID {pid}: {e}")
+            terminated_groups = self._signal_dashboard_chrome(signal.SIGTERM)
+            if terminated_groups:
+                logger.info(f"Terminated {len(terminated_groups)} existing dashboard Chrome process group(s)")
                 
-                # Small delay to ensure processes are fully terminated
-                import time
-                time.sleep(1)
+                # Wait until the old sessions are gone (profile lock released) rather than sleeping blindly
+                self._wait_for_groups_exit(terminated_groups)
 
         # Use a consistent user data directory for single instance mode
+        temp_dirs = []
         if not user_data_dir:
             if single_instance:
                 # Use a consistent directory name for single instance
-                user_data_dir = os.path.expanduser("~/.chrome_dashboard")
+                user_data_dir = DASHBOARD_USER_DATA_DIR
                 os.makedirs(user_data_dir, exist_ok=True)
             else:
                 user_data_dir = tempfile.mkdtemp(prefix="chrome_instance_")
+                temp_dirs.append(user_data_dir)
 
         # Build Chrome command using optimized template
         cmd = BrowserTemplates.get_chrome_command(mode, url, user_data_dir, disable_security)
@@ -217,36 +382,54 @@ class ChromeConnector(BaseConnector):
         
         try:
             # Launch Chrome in the background
-            logger.info(f"Launching single Chrome instance with command: {' '.join(cmd)}")
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                start_new_session=True
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Launching single Chrome instance with command: {' '.join(cmd)}")
+            pid = _spawn_detached(cmd)
+            self._track_child(pid, temp_dirs)
+            if user_data_dir == DASHBOARD_USER_DATA_DIR:
+                # The spawned process leads its own session, so its PID is the group ID
+                _write_dashboard_session(pid)
             
-            return {
-                "success": True,
-                "url": url,
-                "mode": mode,
-                "pid": process.pid,
-                "user_data_dir": user_data_dir,
-                "command": ' '.join(cmd),
-                "single_instance": single_instance,
-                "message": f"Chrome launched in {mode} mode (single instance: {single_instance})"
-            }
+            return asdict(ChromelessLaunchResult(
+                url=url,
+                mode=mode,
+                pid=pid,
+                user_data_dir=user_data_dir,
+                command=" ".join(cmd),
+                command_argv=cmd,
+                single_instance=single_instance,
+                message=f"Chrome launched in {mode} mode (single instance: {single_instance})"
+            ))
             
         except Exception as e:
+            _remove_dirs(temp_dirs)
             return {
                 "success": False,
                 "error": f"Failed to launch Chrome: {str(e)}"
             }
 
     def _launch_app(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Launch Chrome in app mode for a specific URL."""
+        """Launch Chrome in app mode for a specific URL, reusing a pooled instance when possible."""
         url = arguments["url"]
         window_size = arguments.get("window_size", "1920,1080")
         window_position = arguments.get("window_position")
+        pool_key = f"{window_size}@{window_position}"
+        
+        # Open a new tab in a warm instance with the same geometry instead of cold-starting Chrome
+        instance = self._app_pool.get(pool_key)
+        if instance is not None:
+            if self._open_devtools_tab(instance, url):
+                self._app_pool.move_to_end(pool_key)
+                return asdict(AppLaunchResult(
+                    url=url,
+                    pid=instance.pid,
+                    window_size=window_size,
+                    window_position=window_position,
+                    user_data_dir=instance.user_data_dir,
+                    reused=True
+                ))
+            # Instance exited or is unresponsive; replace it
+            del self._app_pool[pool_key]
         
         # Create temporary user data directory
         user_data_dir = tempfile.mkdtemp(prefix="chrome_app_")
@@ -256,39 +439,76 @@ class ChromeConnector(BaseConnector):
             f"--app={url}",
             f"--user-data-dir={user_data_dir}",
             f"--window-size={window_size}",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--disable-default-apps"
+            "--remote-debugging-port=0",
+            *_APP_BASE_FLAGS
         ]
         
+        temp_dirs = [user_data_dir]
+        if _TMPFS_DIR:
+            cache_dir = os.path.join(_TMPFS_DIR, os.path.basename(user_data_dir))
+            cmd.append(f"--disk-cache-dir={cache_dir}")
+            temp_dirs.append(cache_dir)
+        
         if window_position:
             cmd.append(f"--window-position={window_position}")
         
         try:
-            logger.info(f"Launching Chrome app: {' '.join(cmd)}")
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                start_new_session=True
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Launching Chrome app: {' '.join(cmd)}")
+            pid = _spawn_detached(cmd)
+            self._track_child(pid, temp_dirs)
+            self._add_to_app_pool(pool_key, ChromeAppInstance(pid=pid, user_data_dir=user_data_dir))
             
-            return {
-                "success": True,
-                "url": url,
-                "mode": "app",
-                "pid": process.pid,
-                "window_size": window_size,
-                "window_position": window_position,
-                "user_data_dir": user_data_dir
-            }
+            return asdict(AppLaunchResult(
+                url=url,
+                pid=pid,
+                window_size=window_size,
+                window_position=window_position,
+                user_data_dir=user_data_dir,
+                reused=False
+            ))
             
         except Exception as e:
+            _remove_dirs(temp_dirs)
             return {
                 "success": False,
                 "error": f"Failed to launch Chrome app: {str(e)}"
             }
 
+    def _add_to_app_pool(self, key: str, instance: ChromeAppInstance) -> None:
+        """Pool an app-mode instance, forgetting the least recently used one beyond APP_POOL_SIZE.
+
+        Evicted instances are not terminated, since the user may still be working in
+        that window; they are just no longer reused, and are reaped once closed.
+        """
+        self._app_pool[key] = instance
+        self._app_pool.move_to_end(key)
+        while len(self._app_pool) > APP_POOL_SIZE:
+            _, evicted = self._app_pool.popitem(last=False)
+            logger.info(f"Stopped reusing pooled Chrome app PID {evicted.pid}")
+
+    def _open_devtools_tab(self, instance: ChromeAppInstance, url: str) -> bool:
+        """Ask a pooled instance to open url in a new tab via the DevTools HTTP endpoint."""
+        with self._children_lock:
+            if instance.pid not in self._children:
+                return False  # Already exited and reaped
+        
+        if instance.debug_port is None:
+            instance.debug_port = _read_devtools_port(instance.user_data_dir)
+            if instance.debug_port is None:
+                return False
+        
+        target = urllib.parse.quote(url, safe=":/?&=#%@+,;~")
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{instance.debug_port}/json/new?{target}", method="PUT"
+        )
+        try:
+            with _LOCAL_OPENER.open(request, timeout=DEVTOOLS_TIMEOUT_SECONDS) as response:
+                return response.status == 200
+        except (OSError, ValueError) as e:
+            logger.debug(f"DevTools tab request to PID {instance.pid} failed: {e}")
+            return False
+
     def _kill_processes(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Kill Chrome processes."""
         force = arguments.get("force", False)
@@ -296,72 +516,60 @@ class ChromeConnector(BaseConnector):
         
         try:
             if dashboard_only:
-                # Kill only dashboard Chrome processes
-                dashboard_processes = self._get_dashboard_chrome_processes()
-                if dashboard_processes.get("count", 0) == 0:
-                    return {
-                        "success": True,
-                        "message": "No dashboard Chrome processes found to terminate",
-                        "dashboard_only": True
-                    }
-                
-                terminated_pids = []
-                for pid in dashboard_processes.get("dashboard_processes", []):
+                # Note the dashboard PIDs and their groups first so the result can list
+                # the processes, then kill only dashboard Chrome process groups
+                pid_groups = {}
+                for pid in self._get_dashboard_chrome_processes().get("dashboard_processes", []):
                     try:
-                        import signal
-                        if force:
-                            os.kill(pid, signal.SIGKILL)
-                        else:
-                            os.kill(pid, signal.SIGTERM)
-                        terminated_pids.append(pid)
+                        pid_groups[pid] = os.getpgid(pid)
                     except ProcessLookupError:
-                        pass  # Process already terminated
-                    except Exception as e:
-                        logger.warning(f"Failed to terminate dashboard process PID {pid}: {e}")
+                        pass
+                terminated_pgids = self._signal_dashboard_chrome(signal.SIGKILL if force else signal.SIGTERM)
+                if not terminated_pgids:
+                    return KillResult(
+                        success=True,
+                        message="No dashboard Chrome processes found to terminate",
+                        dashboard_only=True,
+                        force=force
+                    ).to_dict()
                 
-                return {
-                    "success": True,
-                    "message": f"Terminated {len(terminated_pids)} dashboard Chrome processes",
-                    "terminated_pids": terminated_pids,
-                    "dashboard_only": True,
-                    "force": force
-                }
+                return KillResult(
+                    success=True,
+                    message=f"Terminated {len(terminated_pgids)} dashboard Chrome process groups",
+                    terminated_pids=[pid for pid, pgid in pid_groups.items() if pgid in terminated_pgids],
+                    terminated_pgids=terminated_pgids,
+                    dashboard_only=True,
+                    force=force
+                ).to_dict()
             else:
                 # Kill all Chrome processes (original behavior)
-                if self.is_macos:
-                    if force:
-                        cmd = ["killall", "-9", "Google Chrome"]
-                    else:
-                        cmd = ["killall", "Google Chrome"]
-                else:
-                    if force:
-                        cmd = ["pkill", "-9", "-f", "chrome"]
-                    else:
-                        cmd = ["pkill", "-f", "chrome"]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                cmd = self._kill_cmd_force if force else self._kill_cmd_soft
+                # Only stderr is reported back, so discard stdout
+                result = subprocess.run(
+                    cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+                )
                 
                 if result.returncode == 0:
-                    return {
-                        "success": True,
-                        "message": "All Chrome processes terminated",
-                        "dashboard_only": False,
-                        "force": force
-                    }
+                    return KillResult(
+                        success=True,
+                        message="All Chrome processes terminated",
+                        dashboard_only=False,
+                        force=force
+                    ).to_dict()
                 elif result.returncode == 1:
-                    return {
-                        "success": True,
-                        "message": "No Chrome processes found to terminate",
-                        "dashboard_only": False,
-                        "force": force
-                    }
+                    return KillResult(
+                        success=True,
+                        message="No Chrome processes found to terminate",
+                        dashboard_only=False,
+                        force=force
+                    ).to_dict()
                 else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to kill Chrome processes: {result.stderr}",
-                        "dashboard_only": False,
-                        "force": force
-                    }
+                    return KillResult(
+                        success=False,
+                        error=f"Failed to kill Chrome processes: {result.stderr}",
+                        dashboard_only=False,
+                        force=force
+                    ).to_dict()
                 
         except Exception as e:
             return {
@@ -369,6 +577,137 @@ class ChromeConnector(BaseConnector):
                 "error": f"Error killing Chrome processes: {str(e)}"
             }
 
+    def _track_child(self, pid: int, temp_dirs: Optional[List[str]] = None) -> None:
+        """Register a launched process so it is reaped (and its temp_dirs removed) once it exits."""
+        with self._children_lock:
+            self._children.add(pid)
+            if temp_dirs:
+                self._temp_dirs[pid] = list(temp_dirs)
+            if self._reaper_thread is None:
+                self._reaper_thread = threading.Thread(
+                    target=self._reaper_loop, name="chrome-reaper", daemon=True
+                )
+                self._reaper_thread.start()
+
+    def _reap_children(self) -> List[int]:
+        """Collect the exit status of finished Chrome children and return their PIDs.
+
+        Only PIDs launched by this connector are waited on, so children owned by
+        subprocess/asyncio elsewhere in the gateway are never stolen.
+        """
+        reaped = []
+        finished_dirs = []
+        with self._children_lock:
+            for pid in list(self._children):
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid  # Already collected elsewhere
+                if done:
+                    self._children.discard(pid)
+                    finished_dirs.extend(self._temp_dirs.pop(pid, ()))
+                    reaped.append(pid)
+        
+        # The dashboard session ended on its own; its group ID may be reused from now on
+        if reaped and _read_dashboard_session() in reaped:
+            _clear_dashboard_session()
+        
+        _remove_dirs(finished_dirs)
+        return reaped
+
+    def _reaper_loop(self) -> None:
+        """Periodically reap exited children; exits once none are left."""
+        while True:
+            time.sleep(REAP_INTERVAL_SECONDS)
+            self._reap_children()
+            with self._children_lock:
+                if not self._children:
+                    self._reaper_thread = None
+                    return
+
+    def _signal_dashboard_chrome(self, sig: int) -> List[int]:
+        """Signal every dashboard Chrome process group with one killpg each.
+
+        Returns the IDs of the process groups that were signalled.
+        """
+        pgids = set()
+        session_pgid = _read_dashboard_session()
+        if session_pgid is not None and self._is_dashboard_group(session_pgid):
+            pgids.add(session_pgid)
+        else:
+            # No usable session record (e.g. Chrome started outside the gateway); derive groups from a scan
+            for pid in self._get_dashboard_chrome_processes().get("dashboard_processes", []):
+                try:
+                    pgids.add(os.getpgid(pid))
+                except ProcessLookupError:
+                    pass
+        
+        # Never signal our own process group
+        pgids.discard(os.getpgrp())
+        
+        signalled = []
+        for pgid in pgids:
+            try:
+                os.killpg(pgid, sig)
+                signalled.append(pgid)
+                logger.info(f"Signalled dashboard Chrome process group {pgid}")
+            except ProcessLookupError:
+                logger.info(f"Process group {pgid} already terminated")
+            except Exception as e:
+                logger.warning(f"Failed to signal process group {pgid}: {e}")
+        
+        _clear_dashboard_session()
+        return signalled
+
+    def _wait_for_groups_exit(self, pgids: List[int]) -> bool:
+        """Poll until every process group has exited, up to GROUP_EXIT_TIMEOUT_SECONDS.
+
+        Returns True if all groups exited in time.
+        """
+        deadline = time.monotonic() + GROUP_EXIT_TIMEOUT_SECONDS
+        while True:
+            # Our own children stay visible as zombies until they are reaped
+            self._reap_children()
+            if not any(_pgid_alive(pgid) for pgid in pgids):
+                return True
+            if time.monotonic() >= deadline:
+                logger.warning(f"Chrome process groups {pgids} still running after {GROUP_EXIT_TIMEOUT_SECONDS}s")
+                return False
+            time.sleep(GROUP_EXIT_POLL_SECONDS)
+
+    def _is_dashboard_group(self, pgid: int) -> bool:
+        """Check that a recorded process group still belongs to dashboard Chrome.
+
+        Fails closed: a group whose membership cannot be verified is never signalled,
+        since the recorded ID may have been reused by an unrelated process group.
+        """
+        try:
+            with open(f"/proc/{pgid}/cmdline", "rb") as f:
+                argv = f.read().decode(errors="replace").split("\0")
+        except OSError:
+            # Leader exited or no procfs (macOS): check the group's members instead
+            return self._group_has_dashboard_chrome(pgid)
+        return _is_dashboard_chrome(argv[0], " ".join(argv))
+
+    def _group_has_dashboard_chrome(self, pgid: int) -> bool:
+        """Check whether any live member of a process group is dashboard Chrome."""
+        try:
+            result = subprocess.run(["ps", "-axo", "pgid=,command="], capture_output=True, text=True)
+        except OSError as e:
+            logger.warning(f"Cannot verify Chrome process group {pgid}: {e}")
+            return False
+        if result.returncode != 0:
+            return False
+        
+        for line in result.stdout.splitlines():
+            pgid_str, _, command = line.strip().partition(" ")
+            if pgid_str != str(pgid):
+                continue
+            command = command.strip()
+            if _is_dashboard_chrome(command.split(" -", 1)[0], command):
+                return True
+        return False
+
     def read_resource(self, uri: str) -> Dict[str, Any]:
         """Read a resource by URI."""
         try:
@@ -386,12 +725,7 @@ class ChromeConnector(BaseConnector):
     def _get_running_processes(self) -> Dict[str, Any]:
         """Get list of running Chrome processes."""
         try:
-            if self.is_macos:
-                cmd = ["pgrep", "-f", "Google Chrome"]
-            else:
-                cmd = ["pgrep", "-f", "chrome"]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(self._pgrep_cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
                 pids = [int(pid.strip()) for pid in result.stdout.split() if pid.strip()]
@@ -411,31 +745,14 @@ class ChromeConnector(BaseConnector):
     def _get_dashboard_chrome_processes(self) -> Dict[str, Any]:
         """Get list of Chrome processes specifically running with our dashboard user data directory."""
         try:
-            dashboard_dir = r"\.chrome_dashboard"  # Escape the dot for grep
-            
-            # Use ps and grep to find processes with our dashboard user data directory
-            cmd = ["ps", "aux"]
-            ps_result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if ps_result.returncode != 0:
-                return {"error": "Failed to get process list"}
-            
-            # Filter for Chrome processes with our dashboard directory
-            grep_cmd = ["grep", "-E", f"Google Chrome.*{dashboard_dir}"]
-            grep_process = subprocess.Popen(grep_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            grep_output, _ = grep_process.communicate(input=ps_result.stdout)
-            
-            # Extract PIDs from the grep output
-            pids = []
-            for line in grep_output.strip().split('\n'):
-                if line and 'grep' not in line:  # Exclude the grep process itself
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        try:
-                            pid = int(parts[1])  # PID is typically the second column in ps aux
-                            pids.append(pid)
-                        except ValueError:
-                            continue
+            if PSUTIL_AVAILABLE:
+                pids = self._scan_dashboard_pids_psutil()
+            elif os.path.isdir("/proc"):
+                pids = self._scan_dashboard_pids_procfs()
+            else:
+                pids = self._scan_dashboard_pids_ps()
+                if pids is None:
+                    return {"error": "Failed to get process list"}
             
             return {
                 "dashboard_processes": pids,
@@ -443,4 +760,56 @@ class ChromeConnector(BaseConnector):
             }
                 
         except Exception as e:
-            return {"error": f"Failed to get dashboard Chrome processes: {str(e)}"}
\ No newline at end of file
+            return {"error": f"Failed to get dashboard Chrome processes: {str(e)}"}
+
+    def _scan_dashboard_pids_psutil(self) -> List[int]:
+        """Find dashboard Chrome PIDs via psutil without spawning a subprocess."""
+        own_pid = os.getpid()
+        pids = []
+        for proc in psutil.process_iter(["pid", "cmdline"]):
+            cmdline = proc.info.get("cmdline")
+            if proc.info["pid"] == own_pid or not cmdline:
+                continue
+            if _is_dashboard_chrome(cmdline[0], " ".join(cmdline)):
+                pids.append(proc.info["pid"])
+        return pids
+
+    def _scan_dashboard_pids_procfs(self) -> List[int]:
+        """Find dashboard Chrome PIDs by reading /proc/<pid>/cmdline directly (Linux)."""
+        own_pid = os.getpid()
+        pids = []
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            pid = int(entry)
+            if pid == own_pid:
+                continue
+            try:
+                with open(f"/proc/{entry}/cmdline", "rb") as f:
+                    argv = f.read().decode(errors="replace").split("\0")
+            except OSError:
+                continue  # Process exited or is not readable
+            if _is_dashboard_chrome(argv[0], " ".join(argv)):
+                pids.append(pid)
+        return pids
+
+    def _scan_dashboard_pids_ps(self) -> Optional[List[int]]:
+        """Find dashboard Chrome PIDs from a single ps listing, filtered in-process."""
+        result = subprocess.run(["ps", "-axo", "pid=,command="], capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        
+        own_pid = os.getpid()
+        pids = []
+        for line in result.stdout.splitlines():
+            pid_str, _, command = line.strip().partition(" ")
+            # The executable path may contain spaces ("Google Chrome"), so take everything before the first flag
+            if not _is_dashboard_chrome(command.split(" -", 1)[0], command):
+                continue
+            try:
+                pid = int(pid_str)
+            except ValueError:
+                continue
+            if pid != own_pid:
+                pids.append(pid)
+        return pids
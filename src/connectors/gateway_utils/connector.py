@@ -17,6 +17,29 @@ from core.models import (
 from core.resource_models import ResourceDefinition, ResourceResult
 
 
+# Resource definitions are static, so build them once at import time
+_GATEWAY_UTILS_RESOURCES = (
+    ResourceDefinition(
+        uri="gateway://utils/config",
+        name="Gateway Configuration",
+        description="Current gateway configuration",
+        mimeType="application/json"
+    ),
+    ResourceDefinition(
+        uri="gateway://utils/environment",
+        name="Environment Variables",
+        description="Gateway-related environment variables",
+        mimeType="application/json"
+    ),
+    ResourceDefinition(
+        uri="gateway://utils/manifest",
+        name="Gateway Manifest",
+        description="Complete gateway manifest with all tools, resources, and prompts",
+        mimeType="application/json"
+    )
+)
+
+
 class GatewayUtilsConnector(BaseConnector):
     """Built-in utilities for MCP Gateway"""
     
@@ -142,26 +165,7 @@ class GatewayUtilsConnector(BaseConnector):
     
     def get_resources(self) -> List[ResourceDefinition]:
         """Define utility resources"""
-        return [
-            ResourceDefinition(
-                uri="gateway://utils/config",
-                name="Gateway Configuration",
-                description="Current gateway configuration",
-                mimeType="application/json"
-            ),
-            ResourceDefinition(
-                uri="gateway://utils/environment",
-                name="Environment Variables",
-                description="Gateway-related environment variables",
-                mimeType="application/json"
-            ),
-            ResourceDefinition(
-                uri="gateway://utils/manifest",
-                name="Gateway Manifest",
-                description="Complete gateway manifest with all tools, resources, and prompts",
-                mimeType="application/json"
-            )
-        ]
+        return list(_GATEWAY_UTILS_RESOURCES)
     
     async def read_resource(self, uri: str) -> ResourceResult:
         """Read utility resources"""
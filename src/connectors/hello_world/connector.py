@@ -16,6 +16,29 @@ from core.models import (
 from core.resource_models import ResourceDefinition, ResourceResult
 
 
+# Resource definitions are static, so build them once at import time
+_HELLO_WORLD_RESOURCES = (
+    ResourceDefinition(
+        uri="gateway://hello/config",
+        name="Hello World Configuration",
+        description="Current hello world connector configuration",
+        mimeType="application/json"
+    ),
+    ResourceDefinition(
+        uri="gateway://hello/status",
+        name="Connector Status",
+        description="Hello world connector status and metrics",
+        mimeType="application/json"
+    ),
+    ResourceDefinition(
+        uri="gateway://hello/logs",
+        name="Activity Logs",
+        description="Recent hello world connector activity",
+        mimeType="text/plain"
+    )
+)
+
+
 class HelloWorldConnector(BaseConnector):
     """Hello World connector demonstrating MCP Gateway capabilities"""
     
@@ -117,26 +140,7 @@ Requests: {self.request_count}"""
     
     def get_resources(self) -> List[ResourceDefinition]:
         """Define available resources"""
-        return [
-            ResourceDefinition(
-                uri="gateway://hello/config",
-                name="Hello World Configuration",
-                description="Current hello world connector configuration",
-                mimeType="application/json"
-            ),
-            ResourceDefinition(
-                uri="gateway://hello/status",
-                name="Connector Status",
-                description="Hello world connector status and metrics",
-                mimeType="application/json"
-            ),
-            ResourceDefinition(
-                uri="gateway://hello/logs",
-                name="Activity Logs",
-                description="Recent hello world connector activity",
-                mimeType="text/plain"
-            )
-        ]
+        return list(_HELLO_WORLD_RESOURCES)
     
     async def read_resource(self, uri: str) -> ResourceResult:
         """Read the requested resource"""
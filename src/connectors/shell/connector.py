@@ -40,6 +40,23 @@ DANGEROUS_PATTERNS: Final[list[str]] = [
 ]
 
 
+# Resource definitions are static, so build them once at import time
+_SHELL_RESOURCES = (
+    ResourceDefinition(
+        uri="shell://env",
+        name="Environment Variables",
+        description="Current environment variables",
+        mimeType="application/json"
+    ),
+    ResourceDefinition(
+        uri="shell://cwd",
+        name="Current Working Directory",
+        description="Current working directory information",
+        mimeType="application/json"
+    )
+)
+
+
 class CommandRequest(BaseModel):
     """Pydantic model for shell command requests."""
     
@@ -367,20 +384,7 @@ class ShellConnector(BaseConnector):
     
     def get_resources(self) -> List[ResourceDefinition]:
         """Define shell resources"""
-        return [
-            ResourceDefinition(
-                uri="shell://env",
-                name="Environment Variables",
-                description="Current environment variables",
-                mimeType="application/json"
-            ),
-            ResourceDefinition(
-                uri="shell://cwd",
-                name="Current Working Directory",
-                description="Current working directory information",
-                mimeType="application/json"
-            )
-        ]
+        return list(_SHELL_RESOURCES)
     
     async def read_resource(self, uri: str) -> ResourceResult:
         """Read shell resources"""
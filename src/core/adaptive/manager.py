@@ -1,13 +1,168 @@
 """Simple Adaptive Manager for py-mcp-bridge"""
+import atexit
 import json
+import logging
 import sqlite3
+import threading
 import uuid
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Ints wider than 64 bits and other values orjson rejects
+            return json.dumps(obj)
+except ImportError:
+    _dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+
+# How often queued executions/feedback are written to the database
+FLUSH_INTERVAL_SECONDS = 0.1
+
+# Flushes a row may fail with a transient error before it is dropped
+MAX_WRITE_ATTEMPTS = 5
+
+# Result payload recorded for every successful execution
+_SUCCESS_JSON = _dumps({"success": True})
+
+INSERT_EXECUTION_SQL = """
+    INSERT INTO prompt_executions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_FEEDBACK_SQL = """
+    INSERT INTO user_feedback (feedback_id, execution_id, feedback_type, rating, text_feedback, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+def _drain(queue: deque) -> list:
+    """Pop everything currently queued (safe against concurrent appends)"""
+    items = []
+    while True:
+        try:
+            items.append(queue.popleft())
+        except IndexError:
+            return items
+
 class SimpleAdaptiveManager:
     def __init__(self, db_path: str = "prompt_performance.db"):
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        
+        # Rows waiting for the background flush, written in one transaction per batch
+        self._pending_executions: deque = deque()
+        self._pending_feedback: deque = deque()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_thread_lock = threading.Lock()
+        self._stop_flushing = threading.Event()
+        # Failed write attempts per row id, for rows re-queued after a transient error
+        self._retry_counts: Dict[str, int] = {}
+        
+        # Write anything still queued and close the connection at interpreter exit
+        atexit.register(self.close)
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it in WAL mode on first use (call with _lock held)"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn = conn
+        return self._conn
+    
+    def close(self):
+        """Flush queued rows and close the shared database connection"""
+        self._stop_flushing.set()
+        with self._flush_thread_lock:
+            flush_thread, self._flush_thread = self._flush_thread, None
+        if flush_thread is not None:
+            flush_thread.join()
+        # Give re-queued rows their remaining attempts before the connection goes away
+        for _ in range(MAX_WRITE_ATTEMPTS):
+            if not self._pending_executions and not self._pending_feedback:
+                break
+            self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _ensure_flush_thread(self):
+        """Start the background flush thread on first use"""
+        with self._flush_thread_lock:
+            if self._flush_thread is None:
+                self._stop_flushing.clear()
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="adaptive-flush", daemon=True
+                )
+                self._flush_thread.start()
+    
+    def _flush_loop(self):
+        while not self._stop_flushing.wait(FLUSH_INTERVAL_SECONDS):
+            self.flush()
+    
+    def flush(self):
+        """Write all queued executions and feedback in a single transaction"""
+        executions = _drain(self._pending_executions)
+        feedback = _drain(self._pending_feedback)
+        if not executions and not feedback:
+            return
+        
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                conn.execute("BEGIN")
+                # Executions first so feedback rows never precede the execution they reference
+                if executions:
+                    conn.executemany(INSERT_EXECUTION_SQL, executions)
+                if feedback:
+                    conn.executemany(INSERT_FEEDBACK_SQL, feedback)
+                conn.execute("COMMIT")
+                if self._retry_counts:
+                    for row in executions + feedback:
+                        self._retry_counts.pop(row[0], None)
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.warning(
+                    f"Batch write of {len(executions)} executions and {len(feedback)} feedback rows "
+                    f"failed ({e}), retrying row by row"
+                )
+                # One bad row must not discard the rest of the batch
+                self._write_rows(conn, INSERT_EXECUTION_SQL, executions, self._pending_executions)
+                self._write_rows(conn, INSERT_FEEDBACK_SQL, feedback, self._pending_feedback)
+    
+    def _write_rows(self, conn: sqlite3.Connection, sql: str, rows: list, queue: deque):
+        """Insert rows one at a time, re-queueing those that hit a transient error (call with _lock held)"""
+        retry = []
+        for row in rows:
+            row_id = row[0]
+            try:
+                conn.execute(sql, row)
+            except sqlite3.OperationalError as e:
+                # Locked/busy database and similar: try again on the next flush
+                attempts = self._retry_counts.get(row_id, 0) + 1
+                if attempts < MAX_WRITE_ATTEMPTS:
+                    self._retry_counts[row_id] = attempts
+                    retry.append(row)
+                else:
+                    self._retry_counts.pop(row_id, None)
+                    logger.error(f"Dropping row {row_id} after {attempts} failed writes: {e}")
+            except sqlite3.Error as e:
+                # Constraint violations and the like will never succeed
+                self._retry_counts.pop(row_id, None)
+                logger.error(f"Dropping row {row_id}: {e}")
+            else:
+                self._retry_counts.pop(row_id, None)
+        # Put retries back at the front, in their original order
+        queue.extendleft(reversed(retry))
     
     async def execute_adaptive_prompt(self, connector_name: str, prompt_name: str, 
                                     arguments: Dict[str, Any], user_context: Dict[str, Any],
@@ -17,18 +172,13 @@ class SimpleAdaptiveManager:
         try:
             result = await base_prompt_func(prompt_name, arguments)
             
-            # Record execution
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO prompt_executions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            # Record execution (written by the background flush)
+            self._pending_executions.append((
                 execution_id, connector_name, prompt_name, "v1.0",
-                json.dumps(arguments), result.content, datetime.now().isoformat(),
-                json.dumps(user_context), json.dumps({"success": True})
+                _dumps(arguments), result.content, datetime.now().isoformat(),
+                _dumps(user_context), _SUCCESS_JSON
             ))
-            conn.commit()
-            conn.close()
+            self._ensure_flush_thread()
             
             # Add feedback UI
             result.content += f"""
@@ -46,14 +196,10 @@ class SimpleAdaptiveManager:
             raise
     
     def record_feedback(self, execution_id: str, feedback_type: str, rating: Optional[int] = None, text: Optional[str] = None):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO user_feedback (feedback_id, execution_id, feedback_type, rating, text_feedback, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (str(uuid.uuid4()), execution_id, feedback_type, rating, text, datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        self._pending_feedback.append((
+            str(uuid.uuid4()), execution_id, feedback_type, rating, text, datetime.now().isoformat()
+        ))
+        self._ensure_flush_thread()
         return f"✅ Feedback recorded for {execution_id[-8:]}"
 
 # Global instance
@@ -7,24 +7,58 @@ breaking the JSON-RPC communication.
 """
 
 import asyncio
+import base64
+import functools
+import html
 import json
 import logging
 import os
 import pickle
-import secrets
+import string
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from urllib.parse import unquote_plus
 
+import aiohttp
+from aiohttp import web
 from pydantic import BaseModel
 
+try:
+    import orjson
+
+    _dumps_bytes = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Set to 1 to keep the default asyncio event loop even when uvloop is installed
+DISABLE_UVLOOP_ENV = "MCP_DISABLE_UVLOOP"
+
+# Entropy per OAuth state token (same as secrets.token_urlsafe(32)), and how
+# much is read from the OS per os.urandom call
+STATE_BYTES = 32
+_RANDOM_BUFFER_SIZE = 4096
+
+# Set to 1 to allow reading legacy .pickle credential files (migrated to JSON on load)
+ALLOW_PICKLE_ENV = "MCP_ALLOW_PICKLE_CREDENTIALS"
+
 
 class AuthStatus(Enum):
     """Authentication status states"""
@@ -43,6 +77,7 @@ class AuthRequest(BaseModel):
     callback_uri: Optional[str] = None
     state: Optional[str] = None
     expires_at: Optional[datetime] = None
+    expires_at_iso: Optional[str] = None
 
 
 class AuthResult(BaseModel):
@@ -52,95 +87,71 @@ class AuthResult(BaseModel):
     credentials: Optional[Dict[str, Any]] = None
 
 
-class OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """Handle OAuth callbacks"""
-    
-    def do_GET(self):
-        """Handle GET request with auth code"""
-        parsed_url = urlparse(self.path)
-        query_params = parse_qs(parsed_url.query)
-        
-        if "code" in query_params:
-            self.server.auth_code = query_params["code"][0]
-            self.server.state = query_params.get("state", [None])[0]
-            
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            
-            success_html = f"""
-            <html>
-            <head>
-                <title>Authentication Successful</title>
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-                        text-align: center;
-                        padding: 50px;
-                        background: #f8f9fa;
-                    }}
-                    .container {{
-                        max-width: 500px;
-                        margin: 0 auto;
-                        background: white;
-                        padding: 40px;
-                        border-radius: 12px;
-                        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-                    }}
-                    h1 {{ color: #2563eb; margin-bottom: 20px; }}
-                    .code-box {{
-                        background: #f3f4f6;
-                        padding: 15px;
-                        border-radius: 8px;
-                        font-family: monospace;
-                        word-break: break-all;
-                        margin: 20px 0;
-                    }}
-                    .instructions {{
-                        color: #6b7280;
-                        font-size: 16px;
-                        line-height: 1.5;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h1>✅ Authentication Successful!</h1>
-                    <p class="instructions">
-                        {self.server.service_name} has been authenticated successfully.
-                    </p>
-                    <div class="code-box">
-                        Authorization Code: {query_params["code"][0][:20]}...
-                    </div>
-                    <p class="instructions">
-                        You can close this window and return to Claude Desktop.
-                    </p>
-                </div>
-            </body>
-            </html>
-            """
-            self.wfile.write(success_html.encode())
-            
-        elif "error" in query_params:
-            self.server.auth_error = query_params["error"][0]
-            self.send_response(400)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            
-            error_html = f"""
-            <html>
-            <body style="font-family: sans-serif; text-align: center; padding: 50px;">
-                <h1>❌ Authentication Failed</h1>
-                <p>Error: {query_params.get("error_description", ["Unknown error"])[0]}</p>
-                <p>Please try again in Claude Desktop.</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(error_html.encode())
+# The only callback query parameters we read
+_WANTED = frozenset({"code", "state", "error", "error_description"})
+
+
+def _parse_callback_query(raw_query: str) -> Dict[str, str]:
+    """Decode just the OAuth callback fields from a raw query string (first value wins)"""
+    fields: Dict[str, str] = {}
+    for pair in raw_query.split("&"):
+        key, _, value = pair.partition("=")
+        if key in _WANTED and key not in fields:
+            fields[key] = unquote_plus(value)
+    return fields
+
+
+@dataclass(slots=True)
+class _AuthStateEntry:
+    """An in-flight auth flow and the future its callback resolves"""
+    request: AuthRequest
+    future: Optional[asyncio.Future] = None
     
-    def log_message(self, format, *args):
-        """Suppress request logging"""
-        pass
+    def get_future(self) -> asyncio.Future:
+        """Return the result future, creating it on the running loop on first use"""
+        if self.future is None:
+            self.future = asyncio.get_running_loop().create_future()
+        return self.future
+
+
+# Callback pages, compiled once with whitespace collapsed
+_SUCCESS_TPL = string.Template(
+    "<html><head><title>Authentication Successful</title><style>"
+    "body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',sans-serif;"
+    "text-align:center;padding:50px;background:#f8f9fa}"
+    ".container{max-width:500px;margin:0 auto;background:white;padding:40px;"
+    "border-radius:12px;box-shadow:0 4px 20px rgba(0,0,0,0.1)}"
+    "h1{color:#2563eb;margin-bottom:20px}"
+    ".code-box{background:#f3f4f6;padding:15px;border-radius:8px;font-family:monospace;"
+    "word-break:break-all;margin:20px 0}"
+    ".instructions{color:#6b7280;font-size:16px;line-height:1.5}"
+    "</style></head><body><div class=\"container\">"
+    "<h1>✅ Authentication Successful!</h1>"
+    "<p class=\"instructions\">${service} has been authenticated successfully.</p>"
+    "<div class=\"code-box\">Authorization Code: ${code_preview}...</div>"
+    "<p class=\"instructions\">You can close this window and return to Claude Desktop.</p>"
+    "</div></body></html>"
+)
+_ERROR_TPL = string.Template(
+    "<html><body style=\"font-family:sans-serif;text-align:center;padding:50px\">"
+    "<h1>❌ Authentication Failed</h1>"
+    "<p>Error: ${error}</p>"
+    "<p>Please try again in Claude Desktop.</p>"
+    "</body></html>"
+)
+
+
+def _success_html(service_name: str, code: str) -> bytes:
+    """Render the page shown after a successful OAuth redirect"""
+    return _SUCCESS_TPL.substitute(
+        service=html.escape(service_name),
+        code_preview=html.escape(code[:20])
+    ).encode()
+
+
+def _error_html(error_description: str) -> bytes:
+    """Render the page shown after a failed OAuth redirect"""
+    return _ERROR_TPL.substitute(error=html.escape(error_description)).encode()
 
 
 class AuthenticationManager:
@@ -155,9 +166,19 @@ class AuthenticationManager:
         self.base_path = base_path or Path.home() / ".mcp-bridge" / "auth"
         self.base_path.mkdir(parents=True, exist_ok=True)
         
-        self._auth_servers: Dict[str, HTTPServer] = {}
-        self._auth_states: Dict[str, AuthRequest] = {}
+        self._auth_servers: Dict[int, web.AppRunner] = {}
+        self._auth_states: Dict[str, _AuthStateEntry] = {}
         self._callbacks: Dict[str, Callable] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Blocking work for async callers (credential file I/O, auth
+        # completion callbacks), kept off the event loop
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="auth-io")
+        # os.urandom pool sliced into state tokens
+        self._rnd_buf = b""
+        self._rnd_pos = 0
+        self._rnd_lock = threading.Lock()
+        # Shared HTTP session for token endpoints, created on first use
+        self._http: Optional[aiohttp.ClientSession] = None
         
     def create_auth_request(
         self,
@@ -177,7 +198,7 @@ class AuthenticationManager:
         Returns:
             AuthRequest object
         """
-        state = secrets.token_urlsafe(32)
+        state = self._new_state()
         
         if not instructions:
             instructions = (
@@ -191,18 +212,30 @@ class AuthenticationManager:
         if callback_port:
             callback_uri = f"http://localhost:{callback_port}/callback"
             
+        expires_at = datetime.now() + timedelta(minutes=10)
         request = AuthRequest(
             service_name=service_name,
             auth_url=auth_url,
             instructions=instructions,
             callback_uri=callback_uri,
             state=state,
-            expires_at=datetime.now() + timedelta(minutes=10)
+            expires_at=expires_at,
+            expires_at_iso=expires_at.isoformat()
         )
         
-        self._auth_states[state] = request
+        self._auth_states[state] = _AuthStateEntry(request)
         return request
     
+    def _new_state(self) -> str:
+        """Generate a URL-safe state token from the pooled OS randomness"""
+        with self._rnd_lock:
+            if len(self._rnd_buf) - self._rnd_pos < STATE_BYTES:
+                self._rnd_buf = os.urandom(_RANDOM_BUFFER_SIZE)
+                self._rnd_pos = 0
+            chunk = self._rnd_buf[self._rnd_pos:self._rnd_pos + STATE_BYTES]
+            self._rnd_pos += STATE_BYTES
+        return base64.urlsafe_b64encode(chunk).rstrip(b"=").decode("ascii")
+    
     async def start_oauth_server(
         self,
         service_name: str,
@@ -211,42 +244,91 @@ class AuthenticationManager:
     ) -> None:
         """Start OAuth callback server
         
+        The listener runs on the current event loop and is accepting
+        connections when this coroutine returns. It shuts itself down after
+        handling the first callback carrying a code or an error.
+        
         Args:
             service_name: Service name for display
             port: Port to listen on
-            callback: Callback function when auth completes
+            callback: Callback function when auth completes; runs on the
+                shared worker pool so it may block
         """
         if port in self._auth_servers:
             logger.warning(f"OAuth server already running on port {port}")
             return
+        
+        loop = asyncio.get_running_loop()
+        
+        async def handle_callback(request: web.Request) -> web.Response:
+            query = _parse_callback_query(request.rel_url.raw_query_string)
+            state = query.get("state")
             
-        def run_server():
-            server = HTTPServer(("localhost", port), OAuthCallbackHandler)
-            server.service_name = service_name
-            server.auth_code = None
-            server.auth_error = None
-            server.state = None
-            
-            self._auth_servers[port] = server
-            
-            # Handle single request
-            server.handle_request()
-            
-            # Call callback with results
-            if server.auth_code:
-                callback(server.auth_code, server.state)
-            elif server.auth_error:
-                callback(None, server.auth_error)
-                
-            # Cleanup
-            del self._auth_servers[port]
+            if "code" in query:
+                code = query["code"]
+                callback_args = (code, state)
+                result = AuthResult(success=True, credentials={"code": code, "state": state})
+                response = web.Response(body=_success_html(service_name, code), content_type="text/html", charset="utf-8")
+            elif "error" in query:
+                error = query["error"]
+                callback_args = (None, error)
+                result = AuthResult(success=False, error=error)
+                response = web.Response(
+                    status=400,
+                    body=_error_html(query.get("error_description", "Unknown error")),
+                    content_type="text/html",
+                    charset="utf-8"
+                )
+            else:
+                return web.Response(status=400, text="Missing code or error parameter")
             
-        # Run server in background thread
-        thread = threading.Thread(target=run_server, daemon=True)
-        thread.start()
+            try:
+                await loop.run_in_executor(self._io_pool, callback, *callback_args)
+            except Exception as e:
+                logger.error(f"OAuth completion callback for {service_name} failed: {e}")
+                result = AuthResult(success=False, error=f"Completion callback failed: {e}")
+                response = web.Response(
+                    status=500,
+                    body=_error_html("Could not complete authentication"),
+                    content_type="text/html",
+                    charset="utf-8"
+                )
+            finally:
+                # Never leave wait_for_auth hanging or the listener running
+                self._resolve_auth(state, result)
+                # Single-shot server: stop once this response has been sent
+                task = loop.create_task(self._stop_oauth_server(port))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return response
         
-        # Give server time to start
-        await asyncio.sleep(0.1)
+        app = web.Application()
+        app.router.add_get("/callback", handle_callback)
+        
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        self._auth_servers[port] = runner
+        try:
+            await web.TCPSite(runner, "localhost", port).start()
+        except Exception:
+            del self._auth_servers[port]
+            await runner.cleanup()
+            raise
+    
+    async def _stop_oauth_server(self, port: int) -> None:
+        """Stop the OAuth callback server listening on port"""
+        runner = self._auth_servers.pop(port, None)
+        if runner is not None:
+            await runner.cleanup()
+    
+    def _resolve_auth(self, state: Optional[str], result: AuthResult) -> None:
+        """Hand a callback result to whoever is waiting on state"""
+        entry = self._auth_states.get(state) if state is not None else None
+        if entry is None:
+            return  # Not a flow we started
+        future = entry.get_future()
+        if not future.done():
+            future.set_result(result)
         
     def format_auth_response(self, request: AuthRequest) -> Dict[str, Any]:
         """Format authentication request for MCP response
@@ -263,21 +345,21 @@ class AuthenticationManager:
             "auth_url": request.auth_url,
             "instructions": request.instructions,
             "state": request.state,
-            "expires_at": request.expires_at.isoformat() if request.expires_at else None
+            "expires_at": request.expires_at_iso or (request.expires_at.isoformat() if request.expires_at else None)
         }
     
     def save_credentials(
         self,
         service_name: str,
         credentials: Any,
-        format: str = "pickle"
+        format: str = "json"
     ) -> Path:
         """Save credentials securely
         
         Args:
             service_name: Service name
             credentials: Credentials to save
-            format: Storage format (pickle or json)
+            format: Storage format (json or pickle)
             
         Returns:
             Path to saved credentials
@@ -285,51 +367,92 @@ class AuthenticationManager:
         filename = f"{service_name}_token.{format}"
         filepath = self.base_path / filename
         
-        if format == "pickle":
+        if format == "json":
+            filepath.write_bytes(_dumps_bytes(credentials))
+        elif format == "pickle":
             with open(filepath, "wb") as f:
                 pickle.dump(credentials, f)
-        elif format == "json":
-            with open(filepath, "w") as f:
-                json.dump(credentials, f)
         else:
             raise ValueError(f"Unknown format: {format}")
             
-        logger.info(f"Saved {service_name} credentials to {filepath}")
+        logger.info("Saved %s credentials to %s", service_name, filepath)
         return filepath
     
     def load_credentials(
         self,
         service_name: str,
-        format: str = "pickle"
+        format: str = "json"
     ) -> Optional[Any]:
         """Load saved credentials
         
+        Pickle files are only read when MCP_ALLOW_PICKLE_CREDENTIALS=1. With it
+        set, a legacy pickle found in place of missing JSON credentials is
+        migrated to JSON.
+        
         Args:
             service_name: Service name
-            format: Storage format (pickle or json)
+            format: Storage format (json or pickle)
             
         Returns:
             Credentials if found, None otherwise
         """
-        filename = f"{service_name}_token.{format}"
-        filepath = self.base_path / filename
+        if format not in ("json", "pickle"):
+            raise ValueError(f"Unknown format: {format}")
+        
+        filepath = self.base_path / f"{service_name}_token.{format}"
         
-        if not filepath.exists():
-            return None
-            
         try:
-            if format == "pickle":
-                with open(filepath, "rb") as f:
-                    return pickle.load(f)
-            elif format == "json":
-                with open(filepath, "r") as f:
-                    return json.load(f)
-            else:
-                raise ValueError(f"Unknown format: {format}")
+            if format == "json":
+                if filepath.exists():
+                    return _loads(filepath.read_bytes())
+                return self._migrate_legacy_pickle(service_name)
+            if filepath.exists():
+                return self._load_legacy_pickle(filepath)
+            return None
         except Exception as e:
             logger.error(f"Failed to load {service_name} credentials: {e}")
             return None
     
+    async def asave_credentials(
+        self,
+        service_name: str,
+        credentials: Any,
+        format: str = "json"
+    ) -> Path:
+        """Async save_credentials; the file write runs on the I/O pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, self.save_credentials, service_name, credentials, format)
+    
+    async def aload_credentials(
+        self,
+        service_name: str,
+        format: str = "json"
+    ) -> Optional[Any]:
+        """Async load_credentials; the file read runs on the I/O pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, self.load_credentials, service_name, format)
+    
+    def _load_legacy_pickle(self, filepath: Path) -> Optional[Any]:
+        """Unpickle credentials if explicitly allowed (pickle can execute code)"""
+        if os.environ.get(ALLOW_PICKLE_ENV) != "1":
+            logger.warning(f"Ignoring pickle credentials {filepath}; set {ALLOW_PICKLE_ENV}=1 to load them")
+            return None
+        with open(filepath, "rb") as f:
+            return pickle.load(f)
+    
+    def _migrate_legacy_pickle(self, service_name: str) -> Optional[Any]:
+        """Load a legacy pickle token and rewrite it as JSON"""
+        legacy = self.base_path / f"{service_name}_token.pickle"
+        if not legacy.exists():
+            return None
+        credentials = self._load_legacy_pickle(legacy)
+        if credentials is not None:
+            try:
+                self.save_credentials(service_name, credentials)
+            except TypeError as e:
+                logger.warning(f"Could not migrate {service_name} credentials to JSON: {e}")
+        return credentials
+    
     def check_auth_status(self, service_name: str) -> AuthStatus:
         """Check authentication status for a service
         
@@ -348,6 +471,49 @@ class AuthenticationManager:
         # For now, assume valid if they exist
         return AuthStatus.AUTHENTICATED
     
+    async def acheck_auth_status(self, service_name: str) -> AuthStatus:
+        """Async check_auth_status that loads credentials on the I/O pool"""
+        creds = await self.aload_credentials(service_name)
+        return AuthStatus.AUTHENTICATED if creds else AuthStatus.NEEDS_AUTH
+    
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on the running loop if needed"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            )
+        return self._http
+    
+    async def refresh_token(self, token_url: str, data: Dict[str, str]) -> Dict[str, Any]:
+        """Exchange a refresh token (or other grant) at an OAuth token endpoint
+        
+        Reuses the manager's pooled session so repeated refreshes keep their
+        TCP/TLS connections alive.
+        
+        Args:
+            token_url: OAuth token endpoint
+            data: Form fields, e.g. grant_type, refresh_token, client_id
+            
+        Returns:
+            Decoded JSON token response
+            
+        Raises:
+            aiohttp.ClientResponseError: If the endpoint returns an error status
+        """
+        async with self._get_http().post(token_url, data=data) as response:
+            response.raise_for_status()
+            return await response.json(loads=_loads, content_type=None)
+    
+    async def aclose(self) -> None:
+        """Stop callback servers and release the HTTP session and I/O pool"""
+        for port in list(self._auth_servers):
+            await self._stop_oauth_server(port)
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        self._io_pool.shutdown(wait=False)
+    
     async def wait_for_auth(
         self,
         state: str,
@@ -362,18 +528,35 @@ class AuthenticationManager:
         Returns:
             Authentication result or None if timeout
         """
-        # This would be implemented to wait for OAuth callback
-        # For now, return None
-        return None
+        entry = self._auth_states.get(state)
+        if entry is None:
+            return None
+        
+        future = entry.get_future()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if future.done():
+                # Flow finished; forget it
+                self._auth_states.pop(state, None)
 
 
-# Global instance
-_auth_manager: Optional[AuthenticationManager] = None
+def _install_uvloop() -> bool:
+    """Make new event loops use uvloop when it is installed and not disabled"""
+    if not UVLOOP_AVAILABLE or os.environ.get(DISABLE_UVLOOP_ENV) == "1":
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
+@functools.cache
 def get_auth_manager() -> AuthenticationManager:
-    """Get global authentication manager instance"""
-    global _auth_manager
-    if _auth_manager is None:
-        _auth_manager = AuthenticationManager()
-    return _auth_manager
\ No newline at end of file
+    """Get global authentication manager instance
+    
+    Installs the uvloop event loop policy first when uvloop is available
+    (set MCP_DISABLE_UVLOOP=1 to opt out); loops created afterwards use it.
+    """
+    _install_uvloop()
+    return AuthenticationManager()
@@ -7,6 +7,7 @@ exception groups, and comprehensive type hints.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Final
@@ -16,6 +17,35 @@ from .resource_models import ResourceDefinition, ResourceResult, ResourceError
 
 logger = logging.getLogger(__name__)
 
+# Python 3.12+: tasks start running immediately and only hit the event loop's
+# ready queue if they actually suspend. None on older interpreters.
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+
+@functools.lru_cache(maxsize=64)
+def _auth_required_prefix(service_name: str, instructions: str | None) -> str:
+    """Text of an auth-required result up to the (per-call) authentication URL"""
+    if not instructions:
+        instructions = (
+            f"To use {service_name} tools, authentication is required:\n\n"
+            f"1. Click the link below to authenticate\n"
+            f"2. Sign in and authorize access\n"
+            f"3. Return to Claude Desktop and try your request again\n"
+        )
+    return f"🔐 Authentication Required for {service_name}\n\n{instructions}\n\n🔗 Authentication URL:\n"
+
+
+def _install_eager_task_factory() -> None:
+    """Start tasks eagerly on the running loop (Python 3.12+ only).
+
+    Leaves loops that already have a custom task factory untouched.
+    """
+    if _EAGER_TASK_FACTORY is None:
+        return
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(_EAGER_TASK_FACTORY)
+
 
 class BaseConnector(ABC):
     """Base class for all MCP Bridge connectors with resource support.
@@ -43,13 +73,19 @@ class BaseConnector(ABC):
         self.logger = logging.getLogger(f"connector.{name}")
         self.usage_stats = UsageStats()  # Track cumulative usage
         self.version = self.DEFAULT_VERSION
+        self._tool_name_index: frozenset[str] | None = None
+        self._resource_uri_index: frozenset[str] | None = None
 
     async def initialize(self) -> None:
         """Initialize the connector asynchronously.
         
         Override this method to implement connector-specific initialization.
-        Uses Python 3.11+ structured concurrency when needed.
+        Uses Python 3.11+ structured concurrency when needed. On Python 3.12+
+        the running loop is switched to eager task start, so tool calls that
+        complete without suspending skip the event loop round trip.
         """
+        _install_eager_task_factory()
+        self.invalidate_tools()
         self.initialized = True
         self.logger.info("Connector %s initialized", self.name)
 
@@ -117,14 +153,33 @@ class BaseConnector(ABC):
 
     def validate_resource_exists(self, uri: str) -> bool:
         """Check if a resource exists in this connector"""
-        resources = self.get_resources()
-        return any(resource.uri == uri for resource in resources)
+        return uri in self._get_resource_index()
 
     # ===== HELPER METHODS =====
     def validate_tool_exists(self, tool_name: str) -> bool:
         """Check if a tool exists in this connector"""
-        tools = self.get_tools()
-        return any(tool.name == tool_name for tool in tools)
+        return tool_name in self._get_tool_index()
+
+    def _get_tool_index(self) -> frozenset[str]:
+        """Return the cached set of tool names, building it on first use"""
+        if self._tool_name_index is None:
+            self._tool_name_index = frozenset(tool.name for tool in self.get_tools())
+        return self._tool_name_index
+
+    def _get_resource_index(self) -> frozenset[str]:
+        """Return the cached set of resource URIs, building it on first use"""
+        if self._resource_uri_index is None:
+            self._resource_uri_index = frozenset(resource.uri for resource in self.get_resources())
+        return self._resource_uri_index
+
+    def invalidate_tools(self) -> None:
+        """Drop cached tool/resource lookups after the definitions change
+
+        Called by initialize(); connectors with dynamic tool lists should call
+        it whenever their tools change.
+        """
+        self._tool_name_index = None
+        self._resource_uri_index = None
 
     def create_text_result(self, text: str, is_error: bool = False) -> ToolResult:
         """Helper to create a text result"""
@@ -158,22 +213,11 @@ class BaseConnector(ABC):
         """
         if not service_name:
             service_name = self.name.title()
-            
-        if not instructions:
-            instructions = (
-                f"To use {service_name} tools, authentication is required:\n\n"
-                f"1. Click the link below to authenticate\n"
-                f"2. Sign in and authorize access\n"
-                f"3. Return to Claude Desktop and try your request again\n"
-            )
         
+        text = _auth_required_prefix(service_name, instructions) + auth_url
         return ToolResult(
-            content=[
-                ToolContent(
-                    type=ToolResultType.TEXT, 
-                    text=f"🔐 Authentication Required for {service_name}\n\n{instructions}\n\n🔗 Authentication URL:\n{auth_url}"
-                )
-            ],
+            # Text is built from trusted parts, so skip re-validating the content model
+            content=[ToolContent.model_construct(type=ToolResultType.TEXT, text=text)],
             is_error=False  # Not an error, just needs auth
         )
 
@@ -195,10 +239,14 @@ class BaseConnector(ABC):
         """Track usage statistics from a tool execution"""
         if usage:
             self.usage_stats = self.usage_stats.add(usage)
-            self.log_usage_stats(usage, cumulative=False)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.log_usage_stats(usage, cumulative=False)
 
     def log_usage_stats(self, usage: UsageStats, cumulative: bool = True) -> None:
         """Log usage statistics"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         if cumulative:
             stats = self.usage_stats
             prefix = "Cumulative"
@@ -208,11 +256,9 @@ class BaseConnector(ABC):
 
         if stats.total_tokens > 0 or stats.api_calls > 0:
             self.logger.info(
-                f"{prefix} usage for {self.name}: "
-                f"Tokens: {stats.total_tokens} "
-                f"(in: {stats.input_tokens}, out: {stats.output_tokens}) | "
-                f"API calls: {stats.api_calls} | "
-                f"Cost: ${stats.estimated_cost:.4f}"
+                "%s usage for %s: Tokens: %s (in: %s, out: %s) | API calls: %s | Cost: $%.4f",
+                prefix, self.name, stats.total_tokens, stats.input_tokens,
+                stats.output_tokens, stats.api_calls, stats.estimated_cost
             )
 
     def reset_usage_stats(self) -> None:
@@ -221,7 +267,8 @@ class BaseConnector(ABC):
         self.usage_stats = UsageStats()
         if old_stats.total_tokens > 0 or old_stats.api_calls > 0:
             self.logger.info(
-                f"Reset usage stats for {self.name} (was: {old_stats.total_tokens} tokens, ${old_stats.estimated_cost:.4f})"
+                "Reset usage stats for %s (was: %s tokens, $%.4f)",
+                self.name, old_stats.total_tokens, old_stats.estimated_cost
             )
 
     def __str__(self) -> str:
@@ -315,7 +315,7 @@ class EntitiesMemoryIntegration:
                             'extraction_date': datetime.utcnow().isoformat()
                         }
                     })
-                    logger.info(f"Created relationship: {from_name} {rel_type.value} {to_name}")
+                    logger.debug("Created relationship", from_name=from_name, relationship_type=rel_type.value, to_name=to_name)
                 except Exception as e:
                     logger.error(f"Failed to create relationship: {e}")
     
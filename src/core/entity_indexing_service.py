@@ -4,20 +4,43 @@ Background service for maintaining entity vector embeddings and relationships
 """
 
 import asyncio
+import hashlib
+import os
 import signal
 import sys
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
+from itertools import combinations
 from typing import Any, Dict, List, Optional, Set
 
 import structlog
 from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
+from pymongo import UpdateOne
 
 from ..connectors.entities.enhanced_connector import EnhancedEntitiesConnector
 from .entities_memory_integration import EntitiesMemoryIntegration
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = structlog.get_logger()
 
+# Minimum normalized co-occurrence strength for creating an inferred relationship
+INFERRED_RELATIONSHIP_THRESHOLD = 0.5
+
+# Seconds between health checks
+HEALTH_CHECK_INTERVAL = 60
+
+# Documents per round trip when streaming cursors
+CURSOR_BATCH_SIZE = 500
+
+# Orphaned embedding ids deleted per delete_many call
+ORPHAN_DELETE_CHUNK_SIZE = 1000
+
 
 class EntityIndexingService:
     """Background service for entity indexing and maintenance"""
@@ -31,6 +54,15 @@ class EntityIndexingService:
         
         # Configuration
         self.batch_size = config.get("batch_size", 10)
+        self.index_concurrency = config.get("index_concurrency", 5)
+        self.embedding_model = config.get("embedding_model", "text-embedding-3-small")
+        
+        # Extraction results by description hash (LRU)
+        self._extract_cache: OrderedDict[str, Any] = OrderedDict()
+        self._extract_cache_max = config.get("extract_cache_size", 1024)
+        
+        # Activity since the last health check, reported in one log line per tick
+        self._cycle_counts: Counter = Counter()
         self.index_interval = config.get("index_interval", 60)  # seconds
         self.relationship_analysis_interval = config.get("relationship_interval", 300)  # 5 minutes
         self.cleanup_interval = config.get("cleanup_interval", 3600)  # 1 hour
@@ -48,12 +80,37 @@ class EntityIndexingService:
             # Initialize memory integration
             self.memory_integration = EntitiesMemoryIntegration(self.entities_connector)
             
+            await self._ensure_indexes()
+            
             logger.info("Entity indexing service initialized")
             
         except Exception as e:
             logger.error(f"Failed to initialize indexing service: {e}")
             raise
     
+    async def _ensure_indexes(self):
+        """Create the indexes the maintenance queries rely on (idempotent)"""
+        index_specs = [
+            # Upserts of inferred relationships match on the entity pair
+            (self.entities_connector.relationships_collection,
+             [("from_entity_id", 1), ("to_entity_id", 1)], {}),
+        ]
+        # Motor/PyMongo collections can't be truth-tested; compare with None
+        if self.entities_connector.embeddings_collection is not None:
+            index_specs += [
+                # Stale embedding scan: IXSCAN with the limit pushed down
+                (self.entities_connector.embeddings_collection, [("indexed_at", 1)], {}),
+                # One embedding per entity; orphan deletes and hash updates by entity_id
+                (self.entities_connector.embeddings_collection, [("entity_id", 1)], {"unique": True}),
+            ]
+            
+        for collection, keys, options in index_specs:
+            try:
+                await collection.create_index(keys, background=True, **options)
+            except Exception as e:
+                # e.g. existing duplicates block a unique index; queries still work
+                logger.warning(f"Could not create index {keys} on {collection.name}: {e}")
+    
     async def start(self):
         """Start the background indexing service"""
         if self.running:
@@ -95,48 +152,74 @@ class EntityIndexingService:
             
         logger.info("Entity indexing service stopped")
     
+    async def _sleep_until_next_run(self, next_run: float, interval: float) -> float:
+        """Sleep until the next fixed-rate run and return its scheduled time
+        
+        Runs start every interval regardless of how long the work took; a run
+        that overshot its slot starts the next one immediately instead of
+        queueing up the missed ones.
+        """
+        now = asyncio.get_running_loop().time()
+        next_run = max(next_run + interval, now)
+        await asyncio.sleep(next_run - now)
+        return next_run
+    
     async def _index_entities_loop(self):
         """Main loop for indexing entities"""
+        next_run = asyncio.get_running_loop().time()
         while self.running:
             try:
                 # Get unindexed entities
                 unindexed = await self.entities_connector.get_unindexed_entities(self.batch_size)
                 
                 if unindexed:
-                    logger.info(f"Indexing {len(unindexed)} entities")
+                    logger.debug("Indexing entities", count=len(unindexed))
                     
-                    for entity in unindexed:
-                        try:
-                            # Generate embedding
-                            await self.entities_connector._generate_entity_embedding(
-                                entity["id"],
-                                entity
-                            )
-                            
-                            # Extract additional relationships from description
-                            if entity.get("description"):
-                                extraction = await self.memory_integration.extract_entities_from_text(
-                                    entity["description"]
-                                )
-                                
-                                # Create any new relationships found
-                                entity_map = {entity["name"]: entity["id"]}
-                                await self.memory_integration.create_relationships_from_extraction(
-                                    extraction,
-                                    entity_map
-                                )
-                                
-                        except Exception as e:
-                            logger.error(f"Failed to index entity {entity.get('id')}: {e}")
-                            
-                await asyncio.sleep(self.index_interval)
+                    # Embedding/extraction calls are I/O bound; run the batch
+                    # concurrently, bounded by index_concurrency
+                    semaphore = asyncio.Semaphore(self.index_concurrency)
+                    await asyncio.gather(
+                        *(self._index_one_bounded(semaphore, entity) for entity in unindexed)
+                    )
                 
             except Exception as e:
                 logger.error(f"Error in indexing loop: {e}")
-                await asyncio.sleep(self.index_interval)
+                
+            next_run = await self._sleep_until_next_run(next_run, self.index_interval)
+    
+    async def _index_one_bounded(self, semaphore: asyncio.Semaphore, entity: Dict[str, Any]):
+        """Index one entity once the batch's semaphore admits it"""
+        async with semaphore:
+            await self._index_one(entity)
+    
+    async def _index_one(self, entity: Dict[str, Any]):
+        """Embed one entity and create relationships found in its description"""
+        try:
+            # Generate embedding
+            await self.entities_connector._generate_entity_embedding(
+                entity["id"],
+                entity
+            )
+            await self._store_content_hash(entity["id"], self._content_hash(entity))
+            self._cycle_counts["indexed"] += 1
+            
+            # Extract additional relationships from description
+            if entity.get("description"):
+                extraction = await self._extract_entities(entity["description"])
+                
+                # Create any new relationships found
+                entity_map = {entity["name"]: entity["id"]}
+                await self.memory_integration.create_relationships_from_extraction(
+                    extraction,
+                    entity_map
+                )
+                
+        except Exception as e:
+            logger.error(f"Failed to index entity {entity.get('id')}: {e}")
     
     async def _analyze_relationships_loop(self):
         """Analyze entity co-occurrences and create relationships"""
+        next_run = asyncio.get_running_loop().time()
         while self.running:
             try:
                 # This would analyze memories to find entity co-occurrences
@@ -145,26 +228,21 @@ class EntityIndexingService:
                 # Get recent memories with entity references
                 recent_memories = await self._get_recent_memories_with_entities()
                 
-                # Analyze co-occurrences
+                # Analyze co-occurrences (CPU bound; yield to the other loops afterwards)
                 cooccurrences = self._analyze_cooccurrences(recent_memories)
+                await asyncio.sleep(0)
                 
                 # Create inferred relationships
-                for (entity1_id, entity2_id), strength in cooccurrences.items():
-                    if strength > 0.5:  # Threshold for relationship creation
-                        await self._create_inferred_relationship(
-                            entity1_id,
-                            entity2_id,
-                            strength
-                        )
-                        
-                await asyncio.sleep(self.relationship_analysis_interval)
+                await self._create_inferred_relationships(cooccurrences)
                 
             except Exception as e:
                 logger.error(f"Error in relationship analysis: {e}")
-                await asyncio.sleep(self.relationship_analysis_interval)
+                
+            next_run = await self._sleep_until_next_run(next_run, self.relationship_analysis_interval)
     
     async def _cleanup_loop(self):
         """Clean up old or invalid data"""
+        next_run = asyncio.get_running_loop().time()
         while self.running:
             try:
                 # Clean up orphaned embeddings
@@ -176,36 +254,43 @@ class EntityIndexingService:
                 # Remove duplicate entities
                 await self._merge_duplicate_entities()
                 
-                await asyncio.sleep(self.cleanup_interval)
-                
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
-                await asyncio.sleep(self.cleanup_interval)
+                
+            next_run = await self._sleep_until_next_run(next_run, self.cleanup_interval)
     
     async def _monitor_health(self):
         """Monitor service health and metrics"""
+        next_run = asyncio.get_running_loop().time()
         while self.running:
             try:
                 # Get indexing statistics
                 stats = await self._get_indexing_stats()
                 
+                counts = self._cycle_counts
                 logger.info(
                     "Indexing service health",
                     total_entities=stats["total_entities"],
                     indexed_entities=stats["indexed_entities"],
                     total_relationships=stats["total_relationships"],
-                    pending_index=stats["pending_index"]
+                    pending_index=stats["pending_index"],
+                    indexed=counts["indexed"],
+                    relationships_created=counts["relationships_created"],
+                    stale_reembedded=counts["stale_reembedded"],
+                    stale_unchanged=counts["stale_unchanged"],
+                    extract_cache_hits=counts["extract_cache_hits"],
+                    extract_cache_misses=counts["extract_cache_misses"]
                 )
+                counts.clear()
                 
                 # Check for issues
                 if stats["pending_index"] > 100:
                     logger.warning(f"High indexing backlog: {stats['pending_index']} entities")
-                    
-                await asyncio.sleep(60)  # Check every minute
                 
             except Exception as e:
                 logger.error(f"Error in health monitoring: {e}")
-                await asyncio.sleep(60)
+                
+            next_run = await self._sleep_until_next_run(next_run, HEALTH_CHECK_INTERVAL)
     
     async def _get_recent_memories_with_entities(self) -> List[Dict[str, Any]]:
         """Get recent memories that have entity references"""
@@ -214,104 +299,196 @@ class EntityIndexingService:
         return []
     
     def _analyze_cooccurrences(self, memories: List[Dict[str, Any]]) -> Dict[tuple, float]:
-        """Analyze entity co-occurrences in memories"""
-        cooccurrences = {}
+        """Analyze entity co-occurrences in memories
+        
+        Returns normalized strengths for the pairs strong enough to become
+        inferred relationships.
+        """
+        counts = Counter()
         
         for memory in memories:
-            entity_refs = memory.get("entity_refs", [])
+            # Sorted unique ids, so each pair comes out once and already ordered
+            entity_ids = sorted({ref["entity_id"] for ref in memory.get("entity_refs", [])})
+            counts.update(combinations(entity_ids, 2))
             
-            # Count co-occurrences
-            for i, ref1 in enumerate(entity_refs):
-                for ref2 in entity_refs[i+1:]:
-                    key = tuple(sorted([ref1["entity_id"], ref2["entity_id"]]))
-                    cooccurrences[key] = cooccurrences.get(key, 0) + 1
-                    
-        # Normalize to get strength scores
-        if cooccurrences:
-            max_count = max(cooccurrences.values())
-            for key in cooccurrences:
-                cooccurrences[key] = cooccurrences[key] / max_count
-                
-        return cooccurrences
+        if not counts:
+            return {}
+        # strength = count / max_count, so apply the threshold in count space
+        # and only normalize the pairs that pass it
+        max_count = max(counts.values())
+        threshold_count = max_count * INFERRED_RELATIONSHIP_THRESHOLD
+        return {
+            pair: count / max_count
+            for pair, count in counts.items()
+            if count > threshold_count
+        }
     
-    async def _create_inferred_relationship(self, entity1_id: str, entity2_id: str, strength: float):
-        """Create an inferred relationship between entities"""
-        try:
-            # Check if relationship already exists
-            existing = await self.entities_connector.get_relationships({
-                "from_entity_id": entity1_id,
-                "to_entity_id": entity2_id
-            })
-            
-            if not existing:
-                await self.entities_connector.create_relationship({
-                    "from_entity_id": entity1_id,
-                    "to_entity_id": entity2_id,
+    async def _create_inferred_relationships(self, cooccurrences: Dict[tuple, float]):
+        """Create inferred relationships for the given co-occurrences in a single bulk write"""
+        created_at = datetime.utcnow().isoformat()
+        
+        # Upserts with $setOnInsert only create missing relationships, so no
+        # per-pair existence lookup is needed
+        operations = [
+            UpdateOne(
+                {"from_entity_id": entity1_id, "to_entity_id": entity2_id},
+                {"$setOnInsert": {
                     "relationship_type": "collaborates_on",  # Generic relationship
                     "metadata": {
                         "inferred": True,
                         "strength": strength,
                         "created_by": "indexing_service",
-                        "created_at": datetime.utcnow().isoformat()
+                        "created_at": created_at
                     }
-                })
-                
-                logger.info(f"Created inferred relationship between {entity1_id} and {entity2_id}")
+                }},
+                upsert=True
+            )
+            for (entity1_id, entity2_id), strength in cooccurrences.items()
+        ]
+        if not operations:
+            return
+            
+        try:
+            result = await self.entities_connector.relationships_collection.bulk_write(
+                operations, ordered=False
+            )
+            self._cycle_counts["relationships_created"] += result.upserted_count
+            logger.debug("Created inferred relationships", count=result.upserted_count)
                 
         except Exception as e:
-            logger.error(f"Failed to create inferred relationship: {e}")
+            logger.error(f"Failed to create inferred relationships: {e}")
     
     async def _cleanup_orphaned_embeddings(self):
         """Remove embeddings for deleted entities"""
-        if not self.entities_connector.embeddings_collection:
+        if self.entities_connector.embeddings_collection is None:
             return
             
+        embeddings_collection = self.entities_connector.embeddings_collection
+        
+        # Let the server find embeddings whose entity no longer exists and
+        # stream back just their ids. Embeddings whose entity_id is not an
+        # ObjectId string can't be checked this way, so they are never treated
+        # as orphans
+        pipeline = [
+            {"$project": {"_id": 0, "entity_id": 1, "eid": {"$convert": {
+                "input": "$entity_id", "to": "objectId", "onError": None, "onNull": None
+            }}}},
+            {"$match": {"eid": {"$ne": None}}},
+            {"$lookup": {
+                "from": self.entities_connector.entities_collection.name,
+                "let": {"eid": "$eid"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$eid"]}}},
+                    {"$project": {"_id": 1}}
+                ],
+                "as": "entity"
+            }},
+            {"$match": {"entity": []}},
+            {"$project": {"entity_id": 1}}
+        ]
+        
         try:
-            # Get all embedding entity IDs
-            embeddings = await self.entities_connector.embeddings_collection.find(
-                {}, {"entity_id": 1}
-            ).to_list(length=None)
-            
-            embedding_ids = {e["entity_id"] for e in embeddings}
-            
-            # Check which entities still exist
-            existing_entities = await self.entities_connector.entities_collection.find(
-                {"_id": {"$in": [ObjectId(eid) for eid in embedding_ids]}},
-                {"_id": 1}
-            ).to_list(length=None)
-            
-            existing_ids = {str(e["_id"]) for e in existing_entities}
-            
-            # Delete orphaned embeddings
-            orphaned = embedding_ids - existing_ids
+            deleted = 0
+            orphaned = []
+            async for doc in embeddings_collection.aggregate(pipeline, batchSize=CURSOR_BATCH_SIZE):
+                if not ObjectId.is_valid(doc["entity_id"]):
+                    continue
+                orphaned.append(doc["entity_id"])
+                if len(orphaned) >= ORPHAN_DELETE_CHUNK_SIZE:
+                    result = await embeddings_collection.delete_many({"entity_id": {"$in": orphaned}})
+                    deleted += result.deleted_count
+                    orphaned = []
+                    
             if orphaned:
-                result = await self.entities_connector.embeddings_collection.delete_many(
-                    {"entity_id": {"$in": list(orphaned)}}
-                )
-                logger.info(f"Cleaned up {result.deleted_count} orphaned embeddings")
+                result = await embeddings_collection.delete_many({"entity_id": {"$in": orphaned}})
+                deleted += result.deleted_count
+                
+            if deleted:
+                logger.info(f"Cleaned up {deleted} orphaned embeddings")
                 
         except Exception as e:
             logger.error(f"Failed to cleanup orphaned embeddings: {e}")
     
+    async def _extract_entities(self, text: str) -> Any:
+        """Extract entities from text, reusing results for previously seen text"""
+        key = hashlib.sha256(text.encode()).hexdigest()
+        extraction = self._extract_cache.get(key)
+        if extraction is not None:
+            self._extract_cache.move_to_end(key)
+            self._cycle_counts["extract_cache_hits"] += 1
+            return extraction
+            
+        self._cycle_counts["extract_cache_misses"] += 1
+        extraction = await self.memory_integration.extract_entities_from_text(text)
+        self._extract_cache[key] = extraction
+        if len(self._extract_cache) > self._extract_cache_max:
+            self._extract_cache.popitem(last=False)
+        return extraction
+    
+    def _content_hash(self, entity: Dict[str, Any]) -> str:
+        """Hash of the text an entity's embedding is computed from, plus the model"""
+        text = (entity.get("name") or "") + (entity.get("description") or "") + self.embedding_model
+        return hashlib.sha256(text.encode()).hexdigest()
+    
+    async def _store_content_hash(self, entity_id: str, content_hash: str):
+        """Record which content an entity's embedding was generated from"""
+        if self.entities_connector.embeddings_collection is None:
+            return
+        await self.entities_connector.embeddings_collection.update_one(
+            {"entity_id": entity_id},
+            {"$set": {"content_hash": content_hash}}
+        )
+    
     async def _update_stale_embeddings(self):
         """Update embeddings that are older than threshold"""
-        if not self.entities_connector.embeddings_collection:
+        if self.entities_connector.embeddings_collection is None:
             return
             
+        embeddings_collection = self.entities_connector.embeddings_collection
+        
         try:
             # Find embeddings older than 7 days
             threshold = datetime.utcnow() - timedelta(days=7)
             
-            stale = await self.entities_connector.embeddings_collection.find(
+            stale = await embeddings_collection.find(
                 {"indexed_at": {"$lt": threshold}},
-                {"entity_id": 1}
+                {"_id": 0, "entity_id": 1, "content_hash": 1}
             ).limit(self.batch_size).to_list(length=None)
             
+            if not stale:
+                return
+                
+            # Hash the current entity text to spot embeddings that are still valid
+            entities = await self.entities_connector.entities_collection.find(
+                {"_id": {"$in": [ObjectId(doc["entity_id"]) for doc in stale if ObjectId.is_valid(doc["entity_id"])]}},
+                {"name": 1, "description": 1}
+            ).to_list(length=None)
+            current_hashes = {str(entity["_id"]): self._content_hash(entity) for entity in entities}
+            
+            unchanged = []
+            updated = 0
             for embedding_doc in stale:
-                await self.entities_connector.update_entity_embedding(embedding_doc["entity_id"])
+                entity_id = embedding_doc["entity_id"]
+                content_hash = current_hashes.get(entity_id)
+                if content_hash is not None and content_hash == embedding_doc.get("content_hash"):
+                    unchanged.append(entity_id)
+                    continue
+                    
+                await self.entities_connector.update_entity_embedding(entity_id)
+                if content_hash is not None:
+                    await self._store_content_hash(entity_id, content_hash)
+                updated += 1
+                
+            # Same text and model: keep the embedding, just mark it fresh
+            if unchanged:
+                await embeddings_collection.update_many(
+                    {"entity_id": {"$in": unchanged}},
+                    {"$set": {"indexed_at": datetime.utcnow()}}
+                )
                 
-            if stale:
-                logger.info(f"Updated {len(stale)} stale embeddings")
+            self._cycle_counts["stale_reembedded"] += updated
+            self._cycle_counts["stale_unchanged"] += len(unchanged)
+            logger.debug("Updated stale embeddings", updated=updated, unchanged=len(unchanged))
                 
         except Exception as e:
             logger.error(f"Failed to update stale embeddings: {e}")
@@ -333,17 +510,17 @@ class EntityIndexingService:
         
         try:
             # Count total entities
-            stats["total_entities"] = await self.entities_connector.entities_collection.count_documents({})
+            stats["total_entities"] = await self.entities_connector.entities_collection.estimated_document_count()
             
             # Count indexed entities
-            if self.entities_connector.embeddings_collection:
-                stats["indexed_entities"] = await self.entities_connector.embeddings_collection.count_documents({})
+            if self.entities_connector.embeddings_collection is not None:
+                stats["indexed_entities"] = await self.entities_connector.embeddings_collection.estimated_document_count()
                 
             # Count relationships
-            stats["total_relationships"] = await self.entities_connector.relationships_collection.count_documents({})
+            stats["total_relationships"] = await self.entities_connector.relationships_collection.estimated_document_count()
             
             # Calculate pending
-            stats["pending_index"] = stats["total_entities"] - stats["indexed_entities"]
+            stats["pending_index"] = max(0, stats["total_entities"] - stats["indexed_entities"])
             
         except Exception as e:
             logger.error(f"Failed to get indexing stats: {e}")
@@ -353,15 +530,21 @@ class EntityIndexingService:
 
 async def run_indexing_service(config: Dict[str, Any]):
     """Run the entity indexing service"""
+    loop = asyncio.get_running_loop()
+    # Python 3.12+: start tasks eagerly so coroutines that finish without
+    # suspending skip the scheduler round trip
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    
     service = EntityIndexingService(config)
     
-    # Setup signal handlers
-    def signal_handler(sig, frame):
-        logger.info(f"Received signal {sig}")
+    # Setup signal handlers; the loop dispatches them as regular callbacks
+    def signal_handler(sig):
+        logger.info(f"Received signal {sig.name}")
         asyncio.create_task(service.stop())
         
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler, sig)
     
     try:
         await service.initialize()
@@ -387,5 +570,12 @@ if __name__ == "__main__":
         }
     }
     
-    # Run service
-    asyncio.run(run_indexing_service(config))
\ No newline at end of file
+    # Run service, on uvloop when installed (MCP_DISABLE_UVLOOP=1 opts out)
+    if UVLOOP_AVAILABLE and os.environ.get("MCP_DISABLE_UVLOOP") != "1":
+        if sys.version_info >= (3, 12):
+            asyncio.run(run_indexing_service(config), loop_factory=uvloop.new_event_loop)
+        else:
+            uvloop.install()
+            asyncio.run(run_indexing_service(config))
+    else:
+        asyncio.run(run_indexing_service(config))
\ No newline at end of file
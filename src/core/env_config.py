@@ -52,10 +52,24 @@ class EnvironmentConfig:
     MONGODB_PORT: int = int(os.getenv("MONGODB_PORT", "27017"))
     MONGODB_DATABASE: str = os.getenv("MONGODB_DATABASE", "eva_agent")
 
+    # MongoDB connection pool (sized for the indexing service's concurrent loops)
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "5"))
+    MONGODB_MAX_IDLE_MS: int = int(os.getenv("MONGODB_MAX_IDLE_MS", "30000"))
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "10000"))
+    MONGODB_WRITE_CONCERN: str = os.getenv("MONGODB_WRITE_CONCERN", "1")
+
     @property
     def mongodb_url(self) -> str:
-        """Get MongoDB connection URL"""
-        return f"mongodb://{self.MONGODB_HOST}:{self.MONGODB_PORT}/"
+        """Get MongoDB connection URL with connection pool options"""
+        return (
+            f"mongodb://{self.MONGODB_HOST}:{self.MONGODB_PORT}/"
+            f"?maxPoolSize={self.MONGODB_MAX_POOL_SIZE}"
+            f"&minPoolSize={self.MONGODB_MIN_POOL_SIZE}"
+            f"&maxIdleTimeMS={self.MONGODB_MAX_IDLE_MS}"
+            f"&waitQueueTimeoutMS={self.MONGODB_WAIT_QUEUE_TIMEOUT_MS}"
+            f"&retryWrites=true&w={self.MONGODB_WRITE_CONCERN}"
+        )
 
     # Qdrant Configuration
     QDRANT_HOST: str = os.getenv("QDRANT_HOST", "localhost")
@@ -87,9 +101,23 @@ class EnvironmentConfig:
     )
     ENABLE_DEBUG_LOGGING: bool = os.getenv("ENABLE_DEBUG_LOGGING", "false").lower() == "true"
 
+    # Result of the first validate() call; the config is static after startup
+    _validation: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def validate(cls, refresh: bool = False) -> Dict[str, Any]:
+        """Validate configuration and return missing required variables
+
+        The result (including the credentials file stat() checks) is computed
+        once and reused; pass refresh=True to re-check the filesystem.
+        """
+        if cls._validation is None or refresh:
+            cls._validation = cls._run_validation()
+        return {key: dict(value) for key, value in cls._validation.items()}
+
     @classmethod
-    def validate(cls) -> Dict[str, Any]:
-        """Validate configuration and return missing required variables"""
+    def _run_validation(cls) -> Dict[str, Any]:
+        """Run the configuration checks behind validate()"""
         missing = {}
         warnings = {}
 
@@ -117,15 +145,11 @@ class EnvironmentConfig:
     def get_safe_dict(cls) -> Dict[str, Any]:
         """Get configuration as dictionary with sensitive values masked"""
         config = {}
-        for key in dir(cls):
-            if key.startswith("_") or key in ["validate", "get_safe_dict", "mongodb_url"]:
-                continue
+        for key, sensitive in _SAFE_KEYS:
             value = getattr(cls, key)
-            if callable(value):
-                continue
 
             # Mask sensitive values
-            if "KEY" in key or "TOKEN" in key or "SECRET" in key:
+            if sensitive:
                 if value:
                     config[key] = f"***{value[-4:]}" if len(str(value)) > 4 else "***"
                 else:
@@ -136,5 +160,15 @@ class EnvironmentConfig:
         return config
 
 
+# Public config keys and whether to mask them, resolved once instead of
+# reflecting over dir() on every get_safe_dict() call
+_SAFE_KEYS = tuple(
+    (key, "KEY" in key or "TOKEN" in key or "SECRET" in key)
+    for key in sorted(vars(EnvironmentConfig))
+    if not key.startswith("_")
+    and key not in ("validate", "get_safe_dict", "mongodb_url")
+    and not callable(getattr(EnvironmentConfig, key))
+)
+
 # Create a singleton instance
 config = EnvironmentConfig()
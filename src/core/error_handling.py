@@ -8,12 +8,18 @@ import logging
 import random
 import time
 from enum import Enum
-from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Literal, Optional, Tuple, Type, TypeVar, Union
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Errors ErrorContext reports as ExternalServiceError. asyncio.TimeoutError is
+# an alias of TimeoutError on 3.11+, so de-duplicate while keeping order
+_EXTERNAL_ERRORS: Tuple[Type[BaseException], ...] = tuple(
+    dict.fromkeys((ConnectionError, TimeoutError, asyncio.TimeoutError))
+)
+
 
 class ErrorSeverity(Enum):
     """Error severity levels"""
@@ -68,6 +74,45 @@ class ResourceError(MCPError):
     pass
 
 
+# Returned by _handle_error when the wrapper should re-raise the exception
+_RERAISE = object()
+
+
+def _handle_error(
+    e: Exception,
+    func: Callable,
+    default_return: Any,
+    log_errors: bool,
+    raise_on: Optional[Tuple[Type[Exception], ...]],
+) -> Any:
+    """Shared except-clause logic for handle_errors wrappers.
+
+    Returns ``_RERAISE`` if the wrapper's ``except`` block should re-raise
+    the exception, otherwise ``default_return``.
+    """
+    if raise_on and isinstance(e, raise_on):
+        return _RERAISE
+
+    # Skip building the record and formatting the traceback when ERROR is off
+    if log_errors and logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            f"Error in {func.__name__}: {str(e)}",
+            exc_info=True,
+            extra={
+                "function": func.__name__,
+                "func_module": func.__module__,
+                "error_type": type(e).__name__,
+            },
+        )
+
+    if isinstance(e, MCPError):
+        # Handle our custom errors specially
+        if e.severity == ErrorSeverity.CRITICAL:
+            return _RERAISE
+
+    return default_return
+
+
 def handle_errors(
     *exceptions: Type[Exception],
     default_return: Any = None,
@@ -90,52 +135,20 @@ def handle_errors(
             try:
                 return func(*args, **kwargs)
             except exceptions as e:
-                if raise_on and isinstance(e, raise_on):
+                result = _handle_error(e, func, default_return, log_errors, raise_on)
+                if result is _RERAISE:
                     raise
-
-                if log_errors:
-                    logger.error(
-                        f"Error in {func.__name__}: {str(e)}",
-                        exc_info=True,
-                        extra={
-                            "function": func.__name__,
-                            "module": func.__module__,
-                            "error_type": type(e).__name__,
-                        },
-                    )
-
-                if isinstance(e, MCPError):
-                    # Handle our custom errors specially
-                    if e.severity == ErrorSeverity.CRITICAL:
-                        raise
-
-                return default_return
+                return result
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             try:
                 return await func(*args, **kwargs)
             except exceptions as e:
-                if raise_on and isinstance(e, raise_on):
+                result = _handle_error(e, func, default_return, log_errors, raise_on)
+                if result is _RERAISE:
                     raise
-
-                if log_errors:
-                    logger.error(
-                        f"Error in {func.__name__}: {str(e)}",
-                        exc_info=True,
-                        extra={
-                            "function": func.__name__,
-                            "module": func.__module__,
-                            "error_type": type(e).__name__,
-                        },
-                    )
-
-                if isinstance(e, MCPError):
-                    # Handle our custom errors specially
-                    if e.severity == ErrorSeverity.CRITICAL:
-                        raise
-
-                return default_return
+                return result
 
         return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
 
@@ -147,7 +160,7 @@ def retry_with_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
-    jitter: bool = True,
+    jitter: Union[bool, Literal["half", "full"]] = True,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
 ) -> Callable:
     """
@@ -158,9 +171,20 @@ def retry_with_backoff(
         base_delay: Initial delay between retries
         max_delay: Maximum delay between retries
         exponential_base: Base for exponential backoff
-        jitter: Add random jitter to prevent thundering herd
+        jitter: Add random jitter to prevent thundering herd. True or "half"
+            scales each delay by a random factor in [0.5, 1.5); "full" sleeps a
+            random time in [0, delay], which spreads competing clients out
+            further but halves the mean delay (consider a larger base_delay)
         exceptions: Exception types to retry on
     """
+    if jitter not in (True, False, "half", "full"):
+        raise ValueError(f"Invalid jitter mode: {jitter!r}")
+
+    # Exponential backoff schedule, computed once per decorator
+    delays = tuple(
+        min(base_delay * (exponential_base**attempt), max_delay)
+        for attempt in range(max_attempts - 1)
+    )
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
@@ -174,23 +198,32 @@ def retry_with_backoff(
                     last_exception = e
 
                     if attempt == max_attempts - 1:
-                        logger.error(
-                            f"Max retries ({max_attempts}) reached for {func.__name__}",
-                            extra={"last_error": str(e)},
-                        )
+                        if logger.isEnabledFor(logging.ERROR):
+                            logger.error(
+                                "Max retries (%d) reached for %s",
+                                max_attempts,
+                                func.__name__,
+                                extra={"last_error": str(e)},
+                            )
                         raise
 
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
+                    delay = delays[attempt]
 
                     # Add jitter
-                    if jitter:
+                    if jitter == "full":
+                        delay = random.uniform(0, delay)
+                    elif jitter:
                         delay *= 0.5 + random.random()
 
-                    logger.warning(
-                        f"Retry {attempt + 1}/{max_attempts} for {func.__name__} after {delay:.2f}s",
-                        extra={"error": str(e)},
-                    )
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Retry %d/%d for %s after %.2fs",
+                            attempt + 1,
+                            max_attempts,
+                            func.__name__,
+                            delay,
+                            extra={"error": str(e)},
+                        )
 
                     await asyncio.sleep(delay)
 
@@ -207,23 +240,32 @@ def retry_with_backoff(
                     last_exception = e
 
                     if attempt == max_attempts - 1:
-                        logger.error(
-                            f"Max retries ({max_attempts}) reached for {func.__name__}",
-                            extra={"last_error": str(e)},
-                        )
+                        if logger.isEnabledFor(logging.ERROR):
+                            logger.error(
+                                "Max retries (%d) reached for %s",
+                                max_attempts,
+                                func.__name__,
+                                extra={"last_error": str(e)},
+                            )
                         raise
 
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
+                    delay = delays[attempt]
 
                     # Add jitter
-                    if jitter:
+                    if jitter == "full":
+                        delay = random.uniform(0, delay)
+                    elif jitter:
                         delay *= 0.5 + random.random()
 
-                    logger.warning(
-                        f"Retry {attempt + 1}/{max_attempts} for {func.__name__} after {delay:.2f}s",
-                        extra={"error": str(e)},
-                    )
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Retry %d/%d for %s after %.2fs",
+                            attempt + 1,
+                            max_attempts,
+                            func.__name__,
+                            delay,
+                            extra={"error": str(e)},
+                        )
 
                     time.sleep(delay)
 
@@ -237,6 +279,8 @@ def retry_with_backoff(
 class ErrorContext:
     """Context manager for structured error handling"""
 
+    __slots__ = ("default_return", "operation", "reraise", "service", "start_time")
+
     def __init__(
         self,
         operation: str,
@@ -258,25 +302,24 @@ class ErrorContext:
         if exc_type is None:
             return False
 
-        duration = time.time() - self.start_time
-
-        logger.error(
-            f"Error in {self.operation}",
-            exc_info=True,
-            extra={
-                "operation": self.operation,
-                "service": self.service,
-                "duration": duration,
-                "error_type": exc_type.__name__,
-                "error_message": str(exc_val),
-            },
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                f"Error in {self.operation}",
+                exc_info=True,
+                extra={
+                    "operation": self.operation,
+                    "service": self.service,
+                    "duration": time.time() - self.start_time,
+                    "error_type": exc_type.__name__,
+                    "error_message": str(exc_val),
+                },
+            )
 
         if not self.reraise:
             return True
 
         # Convert to our custom error types if needed
-        if issubclass(exc_type, (ConnectionError, TimeoutError)):
+        if issubclass(exc_type, _EXTERNAL_ERRORS):
             raise ExternalServiceError(
                 f"Failed to connect to {self.service or 'external service'}: {exc_val}",
                 details={"original_error": exc_type.__name__},
@@ -308,12 +351,20 @@ def validate_required_fields(**fields: Any) -> None:
                 f"Required field '{field_name}' is None", field=field_name, value=value
             )
 
-        if isinstance(value, str) and not value.strip():
-            raise ValidationError(
-                f"Required field '{field_name}' is empty", field=field_name, value=value
-            )
-
-        if isinstance(value, (list, dict)) and not value:
+        # Exact type checks first (the common case), isinstance for subclasses
+        value_type = type(value)
+        if value_type is str:
+            empty = not value.strip()
+        elif value_type is list or value_type is dict:
+            empty = not value
+        elif isinstance(value, str):
+            empty = not value.strip()
+        elif isinstance(value, (list, dict)):
+            empty = not value
+        else:
+            continue
+
+        if empty:
             raise ValidationError(
                 f"Required field '{field_name}' is empty", field=field_name, value=value
             )
@@ -90,6 +90,23 @@ class EventBus:
         self.handlers[event_type].append(handler)
         logger.debug(f"Subscribed handler to {event_type}")
     
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """Check whether any local handler would receive events of this type."""
+        return bool(self.handlers.get(event_type) or self.global_handlers)
+    
+    def unsubscribe(self, event_type: EventType, handler: Callable) -> None:
+        """
+        Remove a handler previously registered with subscribe.
+        
+        Args:
+            event_type: The event type the handler was subscribed to
+            handler: The handler to remove
+        """
+        handlers = self.handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            logger.debug(f"Unsubscribed handler from {event_type}")
+    
     def subscribe_all(self, handler: Callable) -> None:
         """
         Subscribe to all events.
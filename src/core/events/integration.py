@@ -1,7 +1,9 @@
 """Integration helpers for transitioning to event-driven architecture."""
 
 import asyncio
+import functools
 import logging
+import time
 from typing import Any, Dict, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -215,29 +217,43 @@ class SlackEventAdapter:
         ))
 
 
-def create_event_driven_wrapper(original_function):
+def create_event_driven_wrapper(original_function=None, *, emit_start: bool = False):
     """
     Decorator to make synchronous functions event-driven.
     
+    Each call publishes a single completion event with the result and
+    duration. Pass emit_start=True to also publish a start event carrying
+    the call arguments.
+    
     Usage:
         @create_event_driven_wrapper
         async def my_function(data):
             # Original function logic
             return result
+            
+        @create_event_driven_wrapper(emit_start=True)
+        async def my_traced_function(data):
+            return result
     """
+    if original_function is None:
+        return functools.partial(create_event_driven_wrapper, emit_start=emit_start)
+    
+    @functools.wraps(original_function)
     async def wrapper(event_bus: EventBus, *args, **kwargs):
-        # Create event for function call
-        await event_bus.publish(Event(
-            event_type=EventType.INTEGRATION_EVENT,
-            source="wrapper",
-            data={
-                "function": original_function.__name__,
-                "args": args,
-                "kwargs": kwargs
-            }
-        ))
+        if emit_start:
+            # Create event for function call
+            await event_bus.publish(Event(
+                event_type=EventType.INTEGRATION_EVENT,
+                source="wrapper",
+                data={
+                    "function": original_function.__name__,
+                    "args": args,
+                    "kwargs": kwargs
+                }
+            ))
         
         # Call original function
+        start = time.monotonic()
         result = await original_function(*args, **kwargs)
         
         # Publish completion event
@@ -247,10 +263,11 @@ def create_event_driven_wrapper(original_function):
             data={
                 "function": original_function.__name__,
                 "status": "completed",
+                "duration_ms": (time.monotonic() - start) * 1000,
                 "result": result
             }
         ))
         
         return result
     
-    return wrapper
\ No newline at end of file
+    return wrapper
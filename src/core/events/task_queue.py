@@ -1,8 +1,11 @@
 """Task Queue implementation for asynchronous task management."""
 
 import asyncio
+import itertools
 import logging
-from typing import Any, Callable, Dict, Optional, Set
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 
@@ -11,8 +14,18 @@ from .models import Event, EventType, Priority, TaskEvent, EventStatus
 
 logger = logging.getLogger(__name__)
 
+# Dispatch order for queued tasks (lowest first)
+_PRIORITY_RANK = {
+    Priority.CRITICAL: 0,
+    Priority.HIGH: 1,
+    Priority.MEDIUM: 2,
+    Priority.LOW: 3,
+}
+# Rank of the sentinel that retires a worker; sorts after every real task
+_STOP_RANK = len(_PRIORITY_RANK)
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskResult:
     """Result of a task execution."""
     
@@ -39,16 +52,37 @@ class TaskQueue:
         self,
         event_bus: EventBus,
         max_concurrent_tasks: int = 10,
-        task_timeout: float = 300.0  # 5 minutes default
+        task_timeout: float = 300.0,  # 5 minutes default
+        max_results: int = 10_000,
+        result_ttl: float = 3600.0,  # 1 hour default
+        emit_started: bool = False
     ):
         self.event_bus = event_bus
         self.max_concurrent = max_concurrent_tasks
         self.task_timeout = task_timeout
+        # Publish TASK_STARTED even without local subscribers (e.g. for
+        # consumers in other processes watching the events collection)
+        self.emit_started = emit_started
         self.task_handlers: Dict[str, Callable] = {}
+        # Handler names for get_queue_stats, refreshed on registration
+        self._handler_names: Tuple[str, ...] = ()
         self.active_tasks: Set[str] = set()
-        self.task_results: Dict[str, TaskResult] = {}
+        # Completed results in completion order, bounded by max_results and
+        # result_ttl so a long-running queue doesn't keep every result forever
+        self.max_results = max_results
+        self.result_ttl = result_ttl
+        self.task_results: Dict[str, TaskResult] = OrderedDict()
+        self._result_expiry: Dict[str, float] = {}
+        # One future per wait_for_task call still waiting, resolved when the
+        # result is stored; each waiter removes its own on timeout
+        self._task_waiters: Dict[str, Set[asyncio.Future]] = {}
         self._running = False
-        self._processor_task: Optional[asyncio.Task] = None
+        
+        # Ready tasks as (priority rank, sequence, event); the sequence keeps
+        # FIFO order within a priority and avoids comparing events
+        self._pending: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._workers: List[asyncio.Task] = []
         
     def register_task_handler(self, task_type: str, handler: Callable) -> None:
         """
@@ -59,6 +93,7 @@ class TaskQueue:
             handler: Async function to execute the task
         """
         self.task_handlers[task_type] = handler
+        self._handler_names = tuple(self.task_handlers)
         logger.info(f"Registered handler for task type: {task_type}")
     
     async def queue_task(
@@ -103,26 +138,44 @@ class TaskQueue:
         # Subscribe to task events
         self.event_bus.subscribe(EventType.TASK_QUEUED, self._handle_task_event)
         
-        # Start the processor
-        self._processor_task = asyncio.create_task(self._process_tasks())
+        # Start the workers; at most max_concurrent tasks run at once
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(max(self.max_concurrent, 1))
+        ]
         
         logger.info("Task queue started")
     
     async def stop(self):
-        """Stop the task queue processor."""
+        """Stop the task queue processor.
+        
+        Running tasks are allowed to finish. Tasks still waiting in the queue
+        are failed, so anyone waiting on them gets a result instead of a timeout.
+        """
         self._running = False
+        self.event_bus.unsubscribe(EventType.TASK_QUEUED, self._handle_task_event)
         
-        if self._processor_task:
-            self._processor_task.cancel()
-            try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
+        # Fail the tasks that never started
+        while not self._pending.empty():
+            _, _, event = self._pending.get_nowait()
+            self._pending.task_done()
+            await self._handle_task_failure(event, "Task queue stopped before the task ran")
         
-        # Wait for active tasks to complete
+        # Retire each worker once its current task is done
         if self.active_tasks:
             logger.info(f"Waiting for {len(self.active_tasks)} active tasks to complete")
-            await asyncio.sleep(1)  # Give tasks a chance to complete
+        for _ in self._workers:
+            self._pending.put_nowait((_STOP_RANK, next(self._sequence), None))
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
+        # Nothing is left to complete tasks this queue never received
+        for task_id, waiters in self._task_waiters.items():
+            stopped = TaskResult(task_id=task_id, success=False, error="Task queue stopped")
+            for future in waiters:
+                if not future.done():
+                    future.set_result(stopped)
+        self._task_waiters.clear()
         
         logger.info("Task queue stopped")
     
@@ -131,59 +184,46 @@ class TaskQueue:
         if event.event_type != EventType.TASK_QUEUED:
             return
             
-        # Check if we can process this task
-        if len(self.active_tasks) >= self.max_concurrent:
-            # Re-queue the event with a delay
-            logger.debug(f"Task queue full, delaying task {event.event_id}")
-            await asyncio.sleep(0.1)
-            return
-        
-        # Process the task
-        asyncio.create_task(self._execute_task(event))
+        rank = _PRIORITY_RANK.get(event.priority, _PRIORITY_RANK[Priority.MEDIUM])
+        self._pending.put_nowait((rank, next(self._sequence), event))
     
-    async def _process_tasks(self):
-        """Main task processing loop."""
-        while self._running:
+    async def _worker(self):
+        """Run queued tasks, highest priority first."""
+        while True:
+            _, _, event = await self._pending.get()
+            if event is None:
+                # Stop sentinel from stop()
+                self._pending.task_done()
+                return
             try:
-                # Clean up completed tasks
-                completed_tasks = []
-                for task_id in self.active_tasks:
-                    if task_id in self.task_results:
-                        completed_tasks.append(task_id)
-                
-                for task_id in completed_tasks:
-                    self.active_tasks.remove(task_id)
-                
-                # Log queue status periodically
-                if len(self.active_tasks) > 0:
-                    logger.debug(f"Active tasks: {len(self.active_tasks)}/{self.max_concurrent}")
-                
-                await asyncio.sleep(1)
-                
+                await self._execute_task(event)
             except Exception as e:
-                logger.error(f"Error in task processor: {e}")
-                await asyncio.sleep(5)
+                logger.error(f"Error executing task {event.event_id}: {e}")
+            finally:
+                self._pending.task_done()
     
     async def _execute_task(self, event: Event):
         """Execute a single task."""
         task_id = event.event_id
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         
         # Mark task as active
         self.active_tasks.add(task_id)
         
         try:
-            # Publish task started event
-            await self.event_bus.publish(Event(
-                event_type=EventType.TASK_STARTED,
-                source="task_queue",
-                data={
-                    "task_id": task_id,
-                    "task_type": event.data.get("task_type"),
-                    "started_at": start_time
-                },
-                correlation_id=event.correlation_id
-            ))
+            # Publish task started event; skipped when nobody consumes it,
+            # since every publish is a Mongo insert plus subscriber dispatch
+            if self.emit_started or self.event_bus.has_subscribers(EventType.TASK_STARTED):
+                await self.event_bus.publish(Event(
+                    event_type=EventType.TASK_STARTED,
+                    source="task_queue",
+                    data={
+                        "task_id": task_id,
+                        "task_type": event.data.get("task_type"),
+                        "started_at": datetime.utcnow()
+                    },
+                    correlation_id=event.correlation_id
+                ))
             
             # Get task handler
             task_type = event.data.get("task_type")
@@ -200,15 +240,15 @@ class TaskQueue:
             )
             
             # Calculate duration
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.monotonic_ns() - start_ns) / 1e6
             
             # Store result
-            self.task_results[task_id] = TaskResult(
+            self._complete_task(TaskResult(
                 task_id=task_id,
                 success=True,
                 result=result,
                 duration_ms=duration_ms
-            )
+            ))
             
             # Publish completion event
             await self.event_bus.publish(Event(
@@ -242,11 +282,11 @@ class TaskQueue:
         task_id = event.event_id
         
         # Store failure result
-        self.task_results[task_id] = TaskResult(
+        self._complete_task(TaskResult(
             task_id=task_id,
             success=False,
             error=error
-        )
+        ))
         
         # Publish failure event
         await self.event_bus.publish(Event(
@@ -262,6 +302,29 @@ class TaskQueue:
         
         logger.error(f"Task {task_id} failed: {error}")
     
+    def _complete_task(self, task_result: TaskResult) -> None:
+        """Store a task's result and wake anyone waiting on it."""
+        task_id = task_result.task_id
+        self.task_results.pop(task_id, None)
+        self.task_results[task_id] = task_result
+        self._result_expiry[task_id] = time.monotonic() + self.result_ttl
+        self._evict_results()
+        
+        for future in self._task_waiters.pop(task_id, ()):
+            if not future.done():
+                future.set_result(task_result)
+    
+    def _evict_results(self) -> None:
+        """Drop the oldest results once over max_results or past result_ttl."""
+        # Every result gets the same TTL, so the oldest entry expires first
+        now = time.monotonic()
+        while self.task_results:
+            task_id = next(iter(self.task_results))
+            if len(self.task_results) <= self.max_results and self._result_expiry[task_id] > now:
+                break
+            del self.task_results[task_id]
+            del self._result_expiry[task_id]
+    
     async def wait_for_task(self, task_id: str, timeout: float = 60.0) -> TaskResult:
         """
         Wait for a task to complete and return its result.
@@ -276,15 +339,24 @@ class TaskQueue:
         Raises:
             TimeoutError: If task doesn't complete within timeout
         """
-        start_time = datetime.utcnow()
+        # Results are stored synchronously, so nothing can complete between
+        # this check and registering the waiter below
+        task_result = self.task_results.get(task_id)
+        if task_result is not None:
+            return task_result
         
-        while (datetime.utcnow() - start_time).total_seconds() < timeout:
-            if task_id in self.task_results:
-                return self.task_results[task_id]
-            
-            await asyncio.sleep(0.1)
-        
-        raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
+        future = asyncio.get_running_loop().create_future()
+        waiters = self._task_waiters.setdefault(task_id, set())
+        waiters.add(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Task {task_id} did not complete within {timeout}s") from None
+        finally:
+            # Unknown, evicted or never-finishing ids must not pin entries
+            waiters.discard(future)
+            if not waiters and self._task_waiters.get(task_id) is waiters:
+                del self._task_waiters[task_id]
     
     async def wait_for_workflow(
         self,
@@ -303,37 +375,46 @@ class TaskQueue:
         Returns:
             Dictionary of task results by task ID
         """
-        # Query completed tasks for this workflow
-        completed_events = await self.event_bus.query_events(
-            event_type=EventType.TASK_COMPLETED,
-            correlation_id=correlation_id
-        )
-        
-        failed_events = await self.event_bus.query_events(
-            event_type=EventType.TASK_FAILED,
-            correlation_id=correlation_id
-        )
+        finished: Set[str] = set()
+        done = asyncio.Event()
         
-        all_events = completed_events + failed_events
+        def record(event: Event) -> None:
+            finished.add(event.data.get("task_id"))
+            if len(finished) >= expected_tasks:
+                done.set()
         
-        if len(all_events) >= expected_tasks:
-            # All tasks completed
-            results = {}
-            for event in all_events:
-                task_id = event.data.get("task_id")
-                if task_id in self.task_results:
-                    results[task_id] = self.task_results[task_id]
-            return results
+        async def on_task_finished(event: Event):
+            if event.correlation_id == correlation_id:
+                record(event)
         
-        # Not all tasks completed yet
-        await asyncio.sleep(0.5)
+        # Subscribe first, then pick up tasks that finished before we did
+        finish_types = (EventType.TASK_COMPLETED, EventType.TASK_FAILED)
+        for event_type in finish_types:
+            self.event_bus.subscribe(event_type, on_task_finished)
         
-        # Recursive call with reduced timeout
-        new_timeout = timeout - 0.5
-        if new_timeout <= 0:
-            raise TimeoutError(f"Workflow {correlation_id} did not complete within timeout")
+        try:
+            for event_type in finish_types:
+                for event in await self.event_bus.query_events(
+                    event_type=event_type,
+                    correlation_id=correlation_id
+                ):
+                    record(event)
+            
+            if len(finished) < expected_tasks:
+                await asyncio.wait_for(done.wait(), timeout)
+            
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Workflow {correlation_id} did not complete within timeout") from None
+            
+        finally:
+            for event_type in finish_types:
+                self.event_bus.unsubscribe(event_type, on_task_finished)
         
-        return await self.wait_for_workflow(correlation_id, expected_tasks, new_timeout)
+        return {
+            task_id: self.task_results[task_id]
+            for task_id in finished
+            if task_id in self.task_results
+        }
     
     def get_queue_stats(self) -> Dict[str, Any]:
         """Get current queue statistics."""
@@ -341,6 +422,6 @@ class TaskQueue:
             "active_tasks": len(self.active_tasks),
             "max_concurrent": self.max_concurrent,
             "completed_tasks": len(self.task_results),
-            "task_handlers": list(self.task_handlers.keys()),
-            "queue_utilization": len(self.active_tasks) / self.max_concurrent
+            "task_handlers": self._handler_names,
+            "queue_utilization": len(self.active_tasks) / max(self.max_concurrent, 1)
         }
\ No newline at end of file
@@ -2,15 +2,58 @@
 Centralized logging configuration for MCP Bridge
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .env_config import config as env_config
+from .timestamps import format_timestamp
+
+
+def _json_default(obj: Any) -> str:
+    if isinstance(obj, datetime):
+        return obj.isoformat().replace("+00:00", "Z")
+    return str(obj)
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, default=_json_default)
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        # Datetimes are formatted in C, UTC with a "Z" suffix
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # orjson never calls default= for e.g. ints wider than 64 bits
+            return _json_dumps(obj)
+
+except ImportError:
+    _dumps = _json_dumps
+
+
+# Whether stdin/stdout are terminals, checked once per process. A non-tty
+# stdin means we're running as an MCP stdio server
+_STDIN_TTY = bool(sys.stdin and sys.stdin.isatty())
+_STDOUT_TTY = bool(sys.stdout and sys.stdout.isatty())
+
+# Attributes every LogRecord carries; anything else came from extra=
+_STD_RECORD_FIELDS = frozenset(
+    logging.LogRecord("", logging.NOTSET, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
 
 
 class StructuredFormatter(logging.Formatter):
@@ -19,7 +62,9 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # Reuse the time logging captured for the record instead of
+            # reading the clock again
+            "timestamp": format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -28,17 +73,16 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add extra fields
-        if hasattr(record, "extra"):
-            for key, value in record.extra.items():
-                if key not in ["message", "asctime"]:
-                    log_data[key] = value
+        # Add extra fields (logging sets extra={...} keys as record attributes)
+        for key, value in record.__dict__.items():
+            if key not in _STD_RECORD_FIELDS:
+                log_data[key] = value
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -55,10 +99,75 @@ class ColoredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors"""
+        colored = _COLORED_LEVELNAMES.get(record.levelname)
+        if colored is None:
+            return super().format(record)
+
+        # Color only this handler's output; other handlers (e.g. the JSON
+        # file handler) format the same record afterwards
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.RESET}"
-        return super().format(record)
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+# Pre-rendered colored level names, so format() does a single lookup
+_COLORED_LEVELNAMES = {
+    name: f"{color}{name}{ColoredFormatter.RESET}" for name, color in ColoredFormatter.COLORS.items()
+}
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that only stats the log file when a rollover is due"""
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check the size first; the base class stats the file on every emit"""
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+
+        msg = "%s\n" % self.format(record)
+        self.stream.seek(0, 2)
+        if self.stream.tell() + len(msg) < self.maxBytes:
+            return False
+
+        # Never roll over anything other than a regular file (bpo-45401)
+        return not (os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename))
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the handlers behind the listener
+
+    The stock prepare() formats the record into a plain message and drops
+    exc_info, which would lose the structured fields and the separate
+    "exception" entry in the JSON log. The queue is in-process, so records
+    only need their message merged with its args before being handed off.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Writes file log records on a background thread; replaced on each setup
+_queue_listeners: List[logging.handlers.QueueListener] = []
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records to the file handler and close it"""
+    while _queue_listeners:
+        listener = _queue_listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(
@@ -99,9 +208,10 @@ def setup_logging(
 
     # Remove existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Console handler
-    if console_enabled and sys.stdin.isatty():  # Only enable console if NOT in MCP mode
+    if console_enabled and _STDIN_TTY:  # Only enable console if NOT in MCP mode
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
 
@@ -109,7 +219,7 @@ def setup_logging(
             console_handler.setFormatter(StructuredFormatter())
         else:
             # Use colored formatter for console if not JSON
-            if sys.stdout.isatty():  # Check if output is terminal
+            if _STDOUT_TTY:  # Check if output is terminal
                 formatter = ColoredFormatter(
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
                     datefmt="%Y-%m-%d %H:%M:%S",
@@ -125,14 +235,25 @@ def setup_logging(
 
     # File handler with rotation
     if file_enabled:
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"  # 10MB
         )
         file_handler.setLevel(numeric_level)
 
         # Always use structured format for files
         file_handler.setFormatter(StructuredFormatter())
-        root_logger.addHandler(file_handler)
+
+        # Format and write on a listener thread so logging callers never
+        # block on file I/O
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _RecordQueueHandler(log_queue)
+        queue_handler.setLevel(numeric_level)
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        _queue_listeners.append(listener)
+        root_logger.addHandler(queue_handler)
 
     # Configure specific loggers
     configure_module_loggers(numeric_level)
@@ -153,22 +274,25 @@ def setup_logging(
 
 def configure_module_loggers(default_level: int) -> None:
     """Configure logging levels for specific modules"""
-    # Quiet down noisy libraries
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("googleapiclient").setLevel(logging.WARNING)
-    logging.getLogger("google.auth").setLevel(logging.WARNING)
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
-
-    # Set custom levels for our modules
     module_levels = {
+        # Quiet down noisy libraries
+        "urllib3": logging.WARNING,
+        "googleapiclient": logging.WARNING,
+        "google.auth": logging.WARNING,
+        "asyncio": logging.WARNING,
+        # Set custom levels for our modules
         "src.connectors": default_level,
         "src.core": default_level,
         "eva-agent": default_level,
         "src.mcp_server": default_level,
     }
 
+    # setLevel clears every logger's cached effective level, so only call it
+    # when the level actually changes (e.g. not on a repeated setup_logging)
     for module, level in module_levels.items():
-        logging.getLogger(module).setLevel(level)
+        module_logger = logging.getLogger(module)
+        if module_logger.level != level:
+            module_logger.setLevel(level)
 
 
 class LoggerAdapter(logging.LoggerAdapter):
@@ -2,14 +2,43 @@ from mem0 import Memory
 from typing import Dict, List, Optional, Any
 import logging
 import os
-from datetime import datetime
+import re
+import time
 from dotenv import load_dotenv
 
+from .timestamps import format_timestamp
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# A config value that is exactly "${VAR}" is replaced by that environment variable
+_ENV_RE = re.compile(r"^\$\{([^}]+)\}$")
+
+
+def _substitute_env(config: Any) -> None:
+    """Replace "${VAR}" string values anywhere in a nested config, in place."""
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                match = _ENV_RE.match(value)
+                if match:
+                    node[key] = os.environ.get(match.group(1), "")
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+
+
+def _extract_results(result: Any) -> Optional[List[Dict]]:
+    """Return the results list from a mem0 response ({'results': [...]}), or None."""
+    if isinstance(result, dict):
+        return result.get('results')
+    return None
+
+
 class Mem0Service:
     """Simplified memory service using mem0."""
     
@@ -34,20 +63,8 @@ class Mem0Service:
         if "llm" in mem0_config and mem0_config["llm"] is None:
             del mem0_config["llm"]
         
-        # Set up API keys from environment if needed
-        if "embedder" in mem0_config and mem0_config["embedder"]:
-            if mem0_config["embedder"].get("provider") == "openai":
-                api_key = mem0_config["embedder"]["config"].get("api_key", "")
-                if api_key.startswith("${") and api_key.endswith("}"):
-                    env_var = api_key[2:-1]
-                    mem0_config["embedder"]["config"]["api_key"] = os.getenv(env_var, "")
-        
-        if "llm" in mem0_config and mem0_config["llm"]:
-            if mem0_config["llm"].get("provider") == "openai":
-                api_key = mem0_config["llm"]["config"].get("api_key", "")
-                if api_key.startswith("${") and api_key.endswith("}"):
-                    env_var = api_key[2:-1]
-                    mem0_config["llm"]["config"]["api_key"] = os.getenv(env_var, "")
+        # Resolve ${VAR} references (e.g. API keys) from the environment
+        _substitute_env(mem0_config)
         
         try:
             # Validate configuration
@@ -63,22 +80,15 @@ class Mem0Service:
                 }
             
             # Log final configuration
-            logger.info(f"Initializing mem0 with config: {mem0_config}")
+            logger.info("Initializing mem0 with config: %s", mem0_config)
             
             self.memory = Memory.from_config(mem0_config)
             self.default_user_id = "bob_matsuoka"
             logger.info("Mem0Service initialized successfully")
-            
-            # Test connection
-            try:
-                test_result = self.memory.add("test", user_id="test_init")
-                logger.debug(f"mem0 test result: {test_result}")
-            except Exception as test_error:
-                logger.warning(f"mem0 test failed (non-fatal): {test_error}")
                 
         except Exception as e:
             logger.error(f"Failed to initialize mem0: {e}")
-            logger.error(f"Config was: {mem0_config}")
+            logger.error("Config was: %s", mem0_config)
             raise
         
     async def add_memory(
@@ -97,8 +107,8 @@ class Mem0Service:
             
             # Handle mem0's response format
             # mem0 returns: {'results': [{'id': 'xxx', 'memory': 'text', 'event': 'ADD'}, ...]}
-            if isinstance(result, dict) and 'results' in result:
-                results = result.get('results', [])
+            results = _extract_results(result)
+            if results is not None:
                 if results:
                     # Return the first memory ID
                     first_result = results[0]
@@ -106,10 +116,11 @@ class Mem0Service:
                     logger.info(f"Added {len(results)} memory chunk(s), returning first ID: {memory_id}")
                     return memory_id
                 else:
-                    logger.warning(f"mem0 returned empty results for text: {text[:100]}...")
-                    logger.debug(f"Full mem0 response: {result}")
-                    # Log configuration for debugging
-                    logger.debug(f"mem0 config: {self.config.get('mem0_config', {})}")
+                    logger.warning("mem0 returned empty results for text: %s...", text[:100])
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Full mem0 response: %s", result)
+                        # Log configuration for debugging
+                        logger.debug("mem0 config: %s", self.config.get('mem0_config', {}))
                     return ""
             elif isinstance(result, dict) and 'error' in result:
                 logger.error(f"mem0 error: {result.get('error')}")
@@ -141,8 +152,8 @@ class Mem0Service:
             
             # Handle mem0's response format
             # mem0 returns: {'results': [...]}
-            if isinstance(result, dict) and 'results' in result:
-                memories = result.get('results', [])
+            memories = _extract_results(result)
+            if memories is not None:
                 logger.info(f"Found {len(memories)} memories for query: {query}")
                 return memories
             elif isinstance(result, list):
@@ -165,8 +176,8 @@ class Mem0Service:
             
             # Handle mem0's response format
             # mem0 returns: {'results': [...]}
-            if isinstance(result, dict) and 'results' in result:
-                memories = result.get('results', [])
+            memories = _extract_results(result)
+            if memories is not None:
                 logger.info(f"Retrieved {len(memories)} memories")
                 return memories
             elif isinstance(result, list):
@@ -215,5 +226,5 @@ class Mem0Service:
             return False
     
     def get_timestamp(self) -> str:
-        """Get current timestamp."""
-        return datetime.utcnow().isoformat()
\ No newline at end of file
+        """Get current UTC timestamp (naive ISO 8601, microsecond precision)."""
+        return format_timestamp(time.time(), suffix="")
@@ -2,6 +2,7 @@
 Core models for MCP Bridge
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -23,8 +24,13 @@ class ToolContent(BaseModel):
     mimeType: Optional[str] = None
 
 
-class UsageStats(BaseModel):
-    """Token usage and cost statistics"""
+@dataclass(slots=True, frozen=True)
+class UsageStats:
+    """Token usage and cost statistics
+
+    A plain dataclass so per-call accumulation is just field arithmetic;
+    pydantic still validates it where it is embedded (e.g. ToolResult.usage).
+    """
 
     input_tokens: int = 0
     output_tokens: int = 0
@@ -35,11 +41,11 @@ class UsageStats(BaseModel):
     def add(self, other: "UsageStats") -> "UsageStats":
         """Add another UsageStats to this one"""
         return UsageStats(
-            input_tokens=self.input_tokens + other.input_tokens,
-            output_tokens=self.output_tokens + other.output_tokens,
-            total_tokens=self.total_tokens + other.total_tokens,
-            estimated_cost=self.estimated_cost + other.estimated_cost,
-            api_calls=self.api_calls + other.api_calls,
+            self.input_tokens + other.input_tokens,
+            self.output_tokens + other.output_tokens,
+            self.total_tokens + other.total_tokens,
+            self.estimated_cost + other.estimated_cost,
+            self.api_calls + other.api_calls,
         )
 
 
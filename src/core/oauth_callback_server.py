@@ -11,6 +11,18 @@ from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Success page served for every callback, encoded once at import
+_OK_HTML = b"""
+<html>
+<head><title>OAuth Success</title></head>
+<body>
+    <h1>Authorization Complete</h1>
+    <p>You can now close this window and return to Claude Desktop.</p>
+    <script>window.close();</script>
+</body>
+</html>
+"""
+
 
 class OAuthCallbackResult(BaseModel):
     """Result from OAuth callback"""
@@ -34,24 +46,25 @@ async def run_oauth_callback_server(port: int = 8080, timeout: int = 300) -> Opt
     """
     
     result = None
+    done = asyncio.Event()
     
     async def callback_handler(request):
         nonlocal result
         
-        # Extract query parameters
-        query_params = dict(request.query)
+        # Read the callback fields straight from the query MultiDict
+        query = request.query
         
-        if 'error' in query_params:
+        if 'error' in query:
             result = OAuthCallbackResult(
                 success=False,
-                error=query_params.get('error'),
-                error_description=query_params.get('error_description')
+                error=query.get('error'),
+                error_description=query.get('error_description')
             )
-        elif 'code' in query_params:
+        elif 'code' in query:
             result = OAuthCallbackResult(
                 success=True,
-                code=query_params.get('code'),
-                state=query_params.get('state')
+                code=query.get('code'),
+                state=query.get('state')
             )
         else:
             result = OAuthCallbackResult(
@@ -59,21 +72,10 @@ async def run_oauth_callback_server(port: int = 8080, timeout: int = 300) -> Opt
                 error="invalid_request",
                 error_description="No code or error parameter received"
             )
+        done.set()
         
         # Return success page
-        return web.Response(
-            text="""
-            <html>
-            <head><title>OAuth Success</title></head>
-            <body>
-                <h1>Authorization Complete</h1>
-                <p>You can now close this window and return to Claude Desktop.</p>
-                <script>window.close();</script>
-            </body>
-            </html>
-            """,
-            content_type='text/html'
-        )
+        return web.Response(body=_OK_HTML, content_type='text/html')
     
     # Create web application
     app = web.Application()
@@ -91,17 +93,14 @@ async def run_oauth_callback_server(port: int = 8080, timeout: int = 300) -> Opt
     
     try:
         # Wait for callback or timeout
-        start_time = asyncio.get_event_loop().time()
-        while result is None:
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                result = OAuthCallbackResult(
-                    success=False,
-                    error="timeout",
-                    error_description=f"OAuth callback not received within {timeout} seconds"
-                )
-                break
-            
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            result = OAuthCallbackResult(
+                success=False,
+                error="timeout",
+                error_description=f"OAuth callback not received within {timeout} seconds"
+            )
         
         return result.code if result and result.success else None
         
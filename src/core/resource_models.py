@@ -3,11 +3,23 @@
 Resource models for MCP Bridge - extends core models with resource support
 """
 
+import json
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps_indented(obj: Any) -> str:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, default=str, indent=2)
+
 
 class ResourceContentType(str, Enum):
     """Types of resource content"""
@@ -26,6 +38,12 @@ class ResourceContent(BaseModel):
     encoding: Optional[str] = None  # base64, utf-8, etc.
     mimeType: Optional[str] = None
 
+    def as_text(self) -> str:
+        """Render the content as text for an MCP resources/read response"""
+        if self.type == ResourceContentType.JSON:
+            return _dumps_indented(self.data)
+        return str(self.data)
+
 
 class ResourceDefinition(BaseModel):
     """Definition of a resource that can be read"""
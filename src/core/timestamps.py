@@ -0,0 +1,19 @@
+"""
+Cached ISO 8601 timestamp formatting shared by logging and services
+"""
+
+import time
+
+# [epoch second, formatted "YYYY-mm-ddTHH:MM:SS"] for the last timestamp;
+# timestamps within the same second only format the microseconds
+_TS_CACHE = [-1, ""]
+
+
+def format_timestamp(created: float, suffix: str = "Z") -> str:
+    """Format an epoch time as an ISO 8601 UTC timestamp with microseconds"""
+    second = int(created)
+    cached_second, prefix = _TS_CACHE
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _TS_CACHE[:] = (second, prefix)
+    return f"{prefix}.{int((created - second) * 1e6):06d}{suffix}"
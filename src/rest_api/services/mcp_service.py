@@ -264,10 +264,7 @@ class MCPService:
                     resource_result = await connector.read_resource(uri)
                     
                     # Format content
-                    if resource_result.content.type.value == "json":
-                        content_str = json.dumps(resource_result.content.data, indent=2)
-                    else:
-                        content_str = str(resource_result.content.data)
+                    content_str = resource_result.content.as_text()
                         
                     return {
                         "jsonrpc": "2.0",
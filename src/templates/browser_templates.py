@@ -3,35 +3,41 @@ Browser Automation Templates
 Optimized templates for Chrome browser control
 """
 
+import copy
 from typing import Dict, Any, List
 
 
 class BrowserTemplates:
     """Templates for browser automation operations"""
     
-    # Tool descriptions compressed
+    # Tool descriptions
     TOOL_DESC = {
-        "chromeless": "Launch Chrome in chromeless mode for dashboards",
-        "app": "Launch Chrome app mode for specific URL",
-        "kill": "Kill Chrome processes",
-        "list": "List Chrome dashboard processes"
+        "chromeless": "Launch Chrome in chromeless mode for dashboard viewing. Replaces existing Chrome instances by default.",
+        "app": "Launch Chrome in app mode (chromeless window) for a specific URL",
+        "kill": "Kill all Chrome processes (useful for cleanup)",
+        "list": "List Chrome processes running with dashboard user data directory"
     }
     
-    # Parameter sets compressed
+    # Shared parameter sets; copy them (get_params) before building a schema
     PARAMS = {
         "launch": {
-            "url": {"type": "string", "description": "URL to open", "default": "http://localhost:8090"},
-            "mode": {"type": "string", "enum": ["kiosk", "app", "fullscreen"], "description": "Launch mode", "default": "app"},
-            "single_instance": {"type": "boolean", "description": "Replace existing instances", "default": True},
-            "disable_security": {"type": "boolean", "description": "Disable web security", "default": True}
+            "url": {"type": "string", "description": "URL to open in chromeless mode", "default": "http://localhost:8090"},
+            "mode": {
+                "type": "string",
+                "enum": ["kiosk", "app", "fullscreen"],
+                "description": "Launch mode: 'kiosk' (full kiosk), 'app' (chromeless window - default), 'fullscreen' (fullscreen window)",
+                "default": "app"
+            },
+            "single_instance": {"type": "boolean", "description": "Replace existing Chrome instances (default: true)", "default": True},
+            "disable_security": {"type": "boolean", "description": "Disable web security for local development (default: true)", "default": True}
         },
         "app_launch": {
-            "url": {"type": "string", "description": "URL for Chrome app"},
-            "window_size": {"type": "string", "description": "Window size", "default": "1920,1080"}
+            "url": {"type": "string", "description": "URL to open as Chrome app"},
+            "window_size": {"type": "string", "description": "Window size (e.g., '1920,1080')", "default": "1920,1080"}
         },
         "kill": {
-            "force": {"type": "boolean", "description": "Force kill", "default": False},
-            "dashboard_only": {"type": "boolean", "description": "Kill dashboard only", "default": False}
+            "force": {"type": "boolean", "description": "Force kill Chrome processes (default: false)", "default": False},
+            "dashboard_only": {"type": "boolean", "description": "Kill only dashboard Chrome instances (default: false)", "default": False}
         }
     }
     
@@ -70,24 +76,31 @@ class BrowserTemplates:
         "unknown_resource": "Unknown resource URI"
     }
     
+    @classmethod
+    def get_params(cls, param_set: str) -> Dict[str, Any]:
+        """Get a private copy of a parameter set, safe to extend or modify"""
+        return copy.deepcopy(cls.PARAMS.get(param_set, {}))
+    
     @classmethod
     def get_tool_definition(cls, tool_type: str, name: str) -> Dict[str, Any]:
         """Get optimized tool definition"""
         param_map = {
             "chromeless": "launch",
             "app": "app_launch", 
-            "kill": "kill",
-            "list": {}
+            "kill": "kill"
+        }
+        required_map = {
+            "app": ["url"]
         }
-        
-        schema = {"type": "object", "properties": param_map.get(tool_type, {})}
-        if tool_type in ["chromeless", "app"]:
-            schema["required"] = ["url"] if tool_type == "app" else []
         
         return {
             "name": name,
             "description": cls.TOOL_DESC[tool_type],
-            "input_schema": schema
+            "input_schema": {
+                "type": "object",
+                "properties": cls.get_params(param_map.get(tool_type)),
+                "required": required_map.get(tool_type, [])
+            }
         }
     
     @classmethod
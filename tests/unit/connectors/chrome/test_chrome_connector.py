@@ -0,0 +1,304 @@
+"""
+Tests for Chrome connector.
+"""
+import gc
+import os
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from unittest.mock import patch, Mock
+
+from connectors.chrome import connector as chrome_module
+from connectors.chrome.connector import ChromeConnector
+
+
+@pytest.mark.connector
+class TestChromeConnector:
+    """Test Chrome connector functionality."""
+
+    @pytest.fixture
+    def connector(self):
+        """Create Chrome connector instance."""
+        return ChromeConnector("chrome", {})
+
+    def test_is_dashboard_chrome(self):
+        """Test dashboard process matching requires a Chrome executable and the profile marker."""
+        mac_chrome = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+        assert chrome_module._is_dashboard_chrome(mac_chrome, f"{mac_chrome} --user-data-dir=/Users/me/.chrome_dashboard")
+        assert chrome_module._is_dashboard_chrome("/usr/bin/google-chrome", "--user-data-dir=/home/me/.chrome_dashboard")
+        assert not chrome_module._is_dashboard_chrome("/bin/bash", "bash -c 'ls ~/.chrome_dashboard'")
+        assert not chrome_module._is_dashboard_chrome("/usr/bin/google-chrome", "--user-data-dir=/tmp/other")
+
+    @pytest.mark.skipif(not os.path.isdir("/proc"), reason="requires procfs")
+    def test_scan_dashboard_pids_procfs_no_subprocess(self, connector):
+        """Test the procfs scan finds no dashboard processes without spawning subprocesses."""
+        with patch("subprocess.run") as mock_run, patch("subprocess.Popen") as mock_popen:
+            pids = connector._scan_dashboard_pids_procfs()
+
+        assert os.getpid() not in pids
+        mock_run.assert_not_called()
+        mock_popen.assert_not_called()
+
+    def test_scan_dashboard_pids_ps(self, connector):
+        """Test the ps fallback parses PIDs in-process."""
+        ps_output = (
+            "  101 /Applications/Google Chrome.app/Contents/MacOS/Google Chrome --user-data-dir=/Users/me/.chrome_dashboard\n"
+            "  102 /Applications/Google Chrome.app/Contents/MacOS/Google Chrome --user-data-dir=/tmp/other\n"
+            "  103 /bin/zsh -c ls /Users/me/.chrome_dashboard\n"
+        )
+        with patch("subprocess.run", return_value=Mock(returncode=0, stdout=ps_output)):
+            assert connector._scan_dashboard_pids_ps() == [101]
+
+    def test_get_dashboard_chrome_processes_ps_failure(self, connector):
+        """Test ps failure is reported as an error."""
+        with patch.object(chrome_module, "PSUTIL_AVAILABLE", False), \
+             patch("os.path.isdir", return_value=False), \
+             patch("subprocess.run", return_value=Mock(returncode=1, stdout="")):
+            result = connector._get_dashboard_chrome_processes()
+
+        assert result == {"error": "Failed to get process list"}
+
+    def test_spawn_detached_new_session(self):
+        """Test detached processes are started as their own session leader."""
+        pid = chrome_module._spawn_detached(["sleep", "5"])
+        try:
+            assert os.getsid(pid) == pid
+        finally:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+
+    def test_launch_app_missing_executable(self, connector):
+        """Test launch failures are reported instead of raised."""
+        connector.chrome_path = "/nonexistent/chrome"
+        result = connector._launch_app({"url": "http://localhost:8090"})
+
+        assert result["success"] is False
+        assert "Failed to launch Chrome app" in result["error"]
+
+    def test_signal_dashboard_chrome_uses_session_group(self, connector, tmp_path):
+        """Test recorded dashboard sessions are terminated with a single killpg."""
+        pid = chrome_module._spawn_detached(["sleep", "5"])
+        session_file = tmp_path / ".session"
+        with patch.object(chrome_module, "DASHBOARD_SESSION_FILE", str(session_file)), \
+             patch.object(connector, "_is_dashboard_group", return_value=True), \
+             patch.object(connector, "_get_dashboard_chrome_processes") as mock_scan:
+            chrome_module._write_dashboard_session(pid)
+            signalled = connector._signal_dashboard_chrome(chrome_module.signal.SIGTERM)
+
+        _, status = os.waitpid(pid, 0)
+        assert signalled == [pid]
+        assert os.WIFSIGNALED(status)
+        assert not session_file.exists()
+        mock_scan.assert_not_called()
+
+    def test_reap_children(self, connector):
+        """Test exited children are reaped and untracked."""
+        pid = chrome_module._spawn_detached(["true"])
+        with patch.object(chrome_module.threading, "Thread"):
+            connector._track_child(pid)
+
+        for _ in range(50):
+            if connector._reap_children():
+                break
+            chrome_module.time.sleep(0.05)
+
+        assert pid not in connector._children
+        with pytest.raises(ChildProcessError):
+            os.waitpid(pid, os.WNOHANG)
+
+    def test_launch_app_reuses_pooled_instance(self, connector, tmp_path):
+        """Test a pooled instance opens the URL as a new DevTools tab instead of spawning Chrome."""
+        requests = []
+
+        class DevToolsHandler(BaseHTTPRequestHandler):
+            def do_PUT(self):
+                requests.append(self.path)
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), DevToolsHandler)
+        threading.Thread(target=server.handle_request, daemon=True).start()
+        (tmp_path / "DevToolsActivePort").write_text(f"{server.server_port}\n/devtools/browser/x\n")
+
+        connector._children.add(4242)
+        connector._app_pool["1920,1080@None"] = chrome_module.ChromeAppInstance(4242, str(tmp_path))
+        try:
+            with patch.object(chrome_module, "_spawn_detached") as mock_spawn:
+                result = connector._launch_app({"url": "http://localhost:8090/page"})
+        finally:
+            server.server_close()
+
+        assert result["reused"] is True
+        assert result["pid"] == 4242
+        assert requests == ["/json/new?http://localhost:8090/page"]
+        mock_spawn.assert_not_called()
+
+    def test_app_pool_evicts_least_recently_used(self, connector):
+        """Test the app pool is capped and leaves the evicted window running."""
+        with patch.object(chrome_module.os, "killpg") as mock_killpg:
+            for pid in range(100, 100 + chrome_module.APP_POOL_SIZE + 1):
+                connector._add_to_app_pool(str(pid), chrome_module.ChromeAppInstance(pid, "/tmp/x"))
+
+        assert len(connector._app_pool) == chrome_module.APP_POOL_SIZE
+        assert "100" not in connector._app_pool
+        mock_killpg.assert_not_called()
+
+    def test_exit_hook_holds_connectors_weakly(self):
+        """Test the shared atexit hook reaps live connectors without keeping them alive."""
+        connector = ChromeConnector("chrome", {})
+        assert connector in chrome_module._LIVE_CONNECTORS
+
+        with patch.object(connector, "_reap_children") as reap:
+            chrome_module._reap_live_connectors()
+        reap.assert_called_once_with()
+
+        ref = weakref.ref(connector)
+        del connector
+        gc.collect()
+        assert ref() is None
+
+    def test_reap_children_removes_temp_dirs(self, connector, tmp_path):
+        """Test temp profiles are deleted once their Chrome process has exited."""
+        profile = tmp_path / "chrome_app_profile"
+        profile.mkdir()
+        (profile / "Preferences").write_text("{}")
+        pid = chrome_module._spawn_detached(["true"])
+        with patch.object(chrome_module.threading, "Thread"):
+            connector._track_child(pid, [str(profile)])
+
+        for _ in range(50):
+            if connector._reap_children():
+                break
+            chrome_module.time.sleep(0.05)
+
+        assert not profile.exists()
+        assert pid not in connector._temp_dirs
+
+    def test_launch_app_failure_removes_temp_dirs(self, connector):
+        """Test the temp profile is removed when Chrome fails to start."""
+        connector.chrome_path = "/nonexistent/chrome"
+        with patch.object(chrome_module, "_remove_dirs") as mock_remove:
+            result = connector._launch_app({"url": "http://localhost:8090"})
+
+        assert result["success"] is False
+        removed = mock_remove.call_args[0][0]
+        chrome_module._remove_dirs(removed)
+        assert os.path.basename(removed[0]).startswith("chrome_app_")
+
+    def test_get_tools_and_resources(self, connector):
+        """Test tool and resource definitions are returned as fresh lists of the shared definitions."""
+        tools = connector.get_tools()
+        assert [tool.name for tool in tools] == [
+            "chrome_launch_chromeless",
+            "chrome_launch_app",
+            "chrome_kill_processes",
+            "chrome_list_dashboard_processes"
+        ]
+        assert tools is not connector.get_tools()
+        assert tools[0] is connector.get_tools()[0]
+
+        kill_schema = tools[2].input_schema
+        assert set(kill_schema["properties"]) == {"force", "dashboard_only"}
+        assert tools[1].input_schema["required"] == ["url"]
+
+        # Shared fragments keep their full descriptions but are copied per tool
+        launch_props = tools[0].input_schema["properties"]
+        assert "'kiosk' (full kiosk)" in launch_props["mode"]["description"]
+        assert "(default: false)" in kill_schema["properties"]["force"]["description"]
+        assert launch_props["url"] is not chrome_module.BrowserTemplates.PARAMS["launch"]["url"]
+        assert kill_schema["properties"]["force"] is not chrome_module.BrowserTemplates.PARAMS["kill"]["force"]
+
+        resources = connector.get_resources()
+        assert [resource.uri for resource in resources] == ["chrome://running-processes"]
+
+    def test_execute_tool_dispatch(self, connector):
+        """Test tool names dispatch to their handlers and unknown tools are reported."""
+        with patch.object(connector, "_get_dashboard_chrome_processes", return_value={"count": 0}):
+            assert connector.execute_tool("chrome_list_dashboard_processes", {}) == {"count": 0}
+
+        assert connector.execute_tool("chrome_unknown", {}) == {"error": "Unknown tool: chrome_unknown"}
+
+    def test_wait_for_groups_exit(self, connector):
+        """Test terminated sessions are detected as gone without a fixed sleep."""
+        pid = chrome_module._spawn_detached(["sleep", "5"])
+        with patch.object(chrome_module.threading, "Thread"):
+            connector._track_child(pid)
+
+        assert chrome_module._pgid_alive(pid)
+        os.killpg(pid, chrome_module.signal.SIGTERM)
+        start = chrome_module.time.monotonic()
+
+        assert connector._wait_for_groups_exit([pid]) is True
+        assert chrome_module.time.monotonic() - start < chrome_module.GROUP_EXIT_TIMEOUT_SECONDS
+        assert not chrome_module._pgid_alive(pid)
+
+    def test_kill_processes_dashboard_only_none_found(self, connector):
+        """Test kill results omit unset fields."""
+        with patch.object(connector, "_signal_dashboard_chrome", return_value=[]):
+            result = connector._kill_processes({"dashboard_only": True})
+
+        assert result == {
+            "success": True,
+            "dashboard_only": True,
+            "force": False,
+            "message": "No dashboard Chrome processes found to terminate"
+        }
+
+    def test_is_dashboard_group_checks_members_without_procfs(self, connector):
+        """Test an unreadable leader falls back to the group's members and fails closed."""
+        ps_output = (
+            "  4242 /Applications/Google Chrome.app/Contents/MacOS/Google Chrome Helper --user-data-dir=/Users/me/.chrome_dashboard\n"
+            "  4343 /bin/zsh -c ls /Users/me/.chrome_dashboard\n"
+        )
+        with patch("builtins.open", side_effect=OSError), \
+             patch("subprocess.run", return_value=Mock(returncode=0, stdout=ps_output)):
+            assert connector._is_dashboard_group(4242) is True
+            assert connector._is_dashboard_group(4343) is False
+            assert connector._is_dashboard_group(4444) is False
+
+        with patch("builtins.open", side_effect=OSError), \
+             patch("subprocess.run", return_value=Mock(returncode=1, stdout="")):
+            assert connector._is_dashboard_group(4242) is False
+
+    def test_reap_clears_dashboard_session(self, connector, tmp_path):
+        """Test the session record is dropped once its leader exits and is reaped."""
+        session_file = tmp_path / ".session"
+        pid = chrome_module._spawn_detached(["true"])
+        with patch.object(chrome_module, "DASHBOARD_SESSION_FILE", str(session_file)), \
+             patch.object(chrome_module.threading, "Thread"):
+            chrome_module._write_dashboard_session(pid)
+            connector._track_child(pid)
+            for _ in range(50):
+                if connector._reap_children():
+                    break
+                chrome_module.time.sleep(0.05)
+
+        assert not session_file.exists()
+
+    def test_kill_processes_dashboard_only_reports_pids_and_groups(self, connector):
+        """Test the kill result lists the dashboard PIDs as well as the signalled groups."""
+        pid = chrome_module._spawn_detached(["sleep", "5"])
+        try:
+            with patch.object(connector, "_get_dashboard_chrome_processes", return_value={"dashboard_processes": [pid]}), \
+                 patch.object(connector, "_signal_dashboard_chrome", return_value=[pid]):
+                result = connector._kill_processes({"dashboard_only": True})
+        finally:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+
+        assert result["terminated_pids"] == [pid]
+        assert result["terminated_pgids"] == [pid]
+
+    def test_launch_chromeless_result_keeps_command(self, connector, tmp_path):
+        """Test the launch result keeps the command string alongside the argv list."""
+        with patch.object(chrome_module, "_spawn_detached", return_value=4242), \
+             patch.object(connector, "_track_child"):
+            result = connector._launch_chromeless({"single_instance": False, "user_data_dir": str(tmp_path)})
+
+        assert result["command"] == " ".join(result["command_argv"])
+        assert result["pid"] == 4242
@@ -0,0 +1,67 @@
+"""
+Tests for the event-driven integration helpers.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("motor")
+
+from core.events.integration import create_event_driven_wrapper
+from core.events.models import EventType
+
+
+@create_event_driven_wrapper
+async def add(a, b=0):
+    """Add two numbers."""
+    return a + b
+
+
+@create_event_driven_wrapper(emit_start=True)
+async def traced_add(a, b=0):
+    """Add two numbers, announcing the call."""
+    return a + b
+
+
+@create_event_driven_wrapper()
+async def called_add(a, b=0):
+    """Add two numbers using the call form without options."""
+    return a + b
+
+
+class TestCreateEventDrivenWrapper:
+    """Test the event-publishing function decorator."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("func", [add, called_add])
+    async def test_publishes_completion_only_by_default(self, func):
+        """Test one completion event with the result and duration is published."""
+        bus = AsyncMock()
+
+        assert await func(bus, 2, b=3) == 5
+
+        [event] = [call.args[0] for call in bus.publish.await_args_list]
+        assert event.event_type == EventType.INTEGRATION_EVENT
+        assert event.data["function"] == func.__name__
+        assert event.data["status"] == "completed"
+        assert event.data["result"] == 5
+        assert event.data["duration_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_emit_start_publishes_call_and_completion(self):
+        """Test emit_start=True adds a start event carrying the call arguments."""
+        bus = AsyncMock()
+
+        assert await traced_add(bus, 2, b=3) == 5
+
+        start, done = [call.args[0] for call in bus.publish.await_args_list]
+        assert start.data == {"function": "traced_add", "args": (2,), "kwargs": {"b": 3}}
+        assert done.data["status"] == "completed"
+        assert done.data["result"] == 5
+        assert done.data["duration_ms"] >= 0
+
+    @pytest.mark.parametrize("func, name", [(add, "add"), (called_add, "called_add"), (traced_add, "traced_add")])
+    def test_preserves_function_metadata(self, func, name):
+        """Test both decorator forms keep the wrapped function's name and docstring."""
+        assert func.__name__ == name
+        assert func.__doc__.startswith("Add two numbers")
@@ -0,0 +1,282 @@
+"""
+Tests for TaskQueue.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("motor")
+
+from core.events import task_queue
+from core.events.models import Event, EventType, Priority
+from core.events.task_queue import TaskQueue, TaskResult
+
+
+class FakeEventBus:
+    """In-process stand-in for EventBus that dispatches published events directly."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.published = []
+
+    def subscribe(self, event_type, handler):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        handlers = self.handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def has_subscribers(self, event_type):
+        return bool(self.handlers.get(event_type))
+
+    async def publish(self, event):
+        self.published.append(event)
+        for handler in list(self.handlers.get(event.event_type, [])):
+            await handler(event)
+        return event.event_id
+
+    async def query_events(self, event_type=None, correlation_id=None, **kwargs):
+        return [
+            event for event in self.published
+            if event.event_type == event_type and event.correlation_id == correlation_id
+        ]
+
+
+@pytest.fixture
+def bus():
+    """Create an in-process event bus."""
+    return FakeEventBus()
+
+
+class TestTaskQueue:
+    """Test TaskQueue scheduling, completion and result tracking."""
+
+    @pytest.mark.asyncio
+    async def test_queue_and_wait_for_task(self, bus):
+        """Test a queued task runs and its result is returned to waiters."""
+        queue = TaskQueue(bus)
+
+        async def double(data):
+            return data["value"] * 2
+
+        queue.register_task_handler("double", double)
+        await queue.start()
+        try:
+            task_id = await queue.queue_task("double", {"value": 21})
+            result = await queue.wait_for_task(task_id, timeout=1)
+        finally:
+            await queue.stop()
+
+        assert result.success is True
+        assert result.result == 42
+        assert await queue.wait_for_task(task_id, timeout=0) is result
+        assert [event.event_type for event in bus.published] == [EventType.TASK_QUEUED, EventType.TASK_COMPLETED]
+
+    @pytest.mark.asyncio
+    async def test_failed_task_result(self, bus):
+        """Test handler errors and unknown task types complete as failures."""
+        queue = TaskQueue(bus)
+        await queue.start()
+        try:
+            task_id = await queue.queue_task("missing", {})
+            result = await queue.wait_for_task(task_id, timeout=1)
+        finally:
+            await queue.stop()
+
+        assert result.success is False
+        assert "No handler registered" in result.error
+        assert bus.published[-1].event_type == EventType.TASK_FAILED
+
+    @pytest.mark.asyncio
+    async def test_tasks_run_by_priority(self, bus):
+        """Test waiting tasks are dispatched highest priority first."""
+        queue = TaskQueue(bus, max_concurrent_tasks=1)
+        release = asyncio.Event()
+        order = []
+
+        async def record(data):
+            if data["name"] == "blocker":
+                await release.wait()
+            order.append(data["name"])
+
+        queue.register_task_handler("record", record)
+        await queue.start()
+        try:
+            await queue.queue_task("record", {"name": "blocker"})
+            await asyncio.sleep(0)
+            await queue.queue_task("record", {"name": "low"}, priority=Priority.LOW)
+            last = await queue.queue_task("record", {"name": "high"}, priority=Priority.HIGH)
+            release.set()
+            await queue.wait_for_task(last, timeout=1)
+            await queue._pending.join()
+        finally:
+            await queue.stop()
+
+        assert order == ["blocker", "high", "low"]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_task_timeout_releases_waiter(self, bus):
+        """Test a timed-out wait on an unknown task leaves no waiter behind."""
+        queue = TaskQueue(bus)
+
+        with pytest.raises(TimeoutError) as exc_info:
+            await queue.wait_for_task("unknown", timeout=0.01)
+
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.__suppress_context__ is True
+        assert queue._task_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_share_completion(self, bus):
+        """Test one waiter timing out does not stop another from getting the result."""
+        queue = TaskQueue(bus)
+        patient = asyncio.create_task(queue.wait_for_task("t1", timeout=1))
+        with pytest.raises(TimeoutError):
+            await queue.wait_for_task("t1", timeout=0.01)
+
+        queue._complete_task(TaskResult(task_id="t1", success=True))
+
+        assert (await patient).task_id == "t1"
+        assert queue._task_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_leaves_no_state(self, bus):
+        """Test a task whose publish fails does not leave bookkeeping behind."""
+        queue = TaskQueue(bus)
+
+        async def failing_publish(event):
+            raise ConnectionError("mongo down")
+
+        bus.publish = failing_publish
+        with pytest.raises(ConnectionError):
+            await queue.queue_task("double", {})
+
+        assert queue._task_waiters == {}
+        assert not queue.task_results
+
+    def test_results_evicted_by_size_and_ttl(self, bus):
+        """Test stored results are capped by max_results and expire after result_ttl."""
+        queue = TaskQueue(bus, max_results=2)
+        for task_id in ("a", "b", "c"):
+            queue._complete_task(TaskResult(task_id=task_id, success=True))
+
+        assert list(queue.task_results) == ["b", "c"]
+
+        queue = TaskQueue(bus, result_ttl=10)
+        with patch.object(task_queue.time, "monotonic", side_effect=[0, 0, 20, 20]):
+            queue._complete_task(TaskResult(task_id="a", success=True))
+            queue._complete_task(TaskResult(task_id="b", success=True))
+
+        assert list(queue.task_results) == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_stop_finishes_running_and_fails_queued_tasks(self, bus):
+        """Test stop lets running tasks finish and fails the queued ones for their waiters."""
+        queue = TaskQueue(bus, max_concurrent_tasks=1)
+        release = asyncio.Event()
+
+        async def slow(data):
+            await release.wait()
+            return "done"
+
+        queue.register_task_handler("slow", slow)
+        await queue.start()
+        running = await queue.queue_task("slow", {})
+        await asyncio.sleep(0)
+        queued = await queue.queue_task("slow", {})
+        waiters = [
+            asyncio.create_task(queue.wait_for_task(task_id, timeout=5))
+            for task_id in (running, queued, "never-queued")
+        ]
+        await asyncio.sleep(0)
+
+        stopping = asyncio.create_task(queue.stop())
+        await asyncio.sleep(0.01)
+        assert not stopping.done()
+        release.set()
+        await asyncio.wait_for(stopping, 1)
+
+        running_result, queued_result, unknown_result = await asyncio.gather(*waiters)
+        assert running_result.success is True
+        assert running_result.result == "done"
+        assert queued_result.success is False
+        assert queued_result.error == "Task queue stopped before the task ran"
+        assert unknown_result.success is False
+        assert queue._workers == [] and queue._task_waiters == {}
+        assert not bus.has_subscribers(EventType.TASK_QUEUED)
+
+
+def _finished(queue, task_id, correlation_id, success=True):
+    """Record a task result and build the event announcing it."""
+    queue.task_results[task_id] = TaskResult(task_id=task_id, success=success)
+    event_type = EventType.TASK_COMPLETED if success else EventType.TASK_FAILED
+    return Event(event_type=event_type, source="test", data={"task_id": task_id}, correlation_id=correlation_id)
+
+
+class TestWaitForWorkflow:
+    """Test waiting on every task of a workflow."""
+
+    def _assert_unsubscribed(self, bus):
+        assert not bus.has_subscribers(EventType.TASK_COMPLETED)
+        assert not bus.has_subscribers(EventType.TASK_FAILED)
+
+    @pytest.mark.asyncio
+    async def test_tasks_finished_before_the_call(self, bus):
+        """Test tasks that already finished are found through the event history."""
+        queue = TaskQueue(bus)
+        bus.published += [_finished(queue, "t1", "wf"), _finished(queue, "t2", "wf", success=False)]
+        bus.published.append(_finished(queue, "other", "other-wf"))
+
+        results = await queue.wait_for_workflow("wf", expected_tasks=2, timeout=1)
+
+        assert set(results) == {"t1", "t2"}
+        assert results["t2"].success is False
+        self._assert_unsubscribed(bus)
+
+    @pytest.mark.asyncio
+    async def test_live_completions(self, bus):
+        """Test completions published while waiting finish the workflow."""
+        queue = TaskQueue(bus)
+        waiter = asyncio.create_task(queue.wait_for_workflow("wf", expected_tasks=2, timeout=1))
+        await asyncio.sleep(0)
+
+        await bus.publish(_finished(queue, "t1", "wf"))
+        await bus.publish(_finished(queue, "other", "other-wf"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await bus.publish(_finished(queue, "t2", "wf", success=False))
+        results = await waiter
+
+        assert set(results) == {"t1", "t2"}
+        self._assert_unsubscribed(bus)
+
+    @pytest.mark.asyncio
+    async def test_task_seen_by_query_and_subscription_counts_once(self, bus):
+        """Test a task reported by both the history and a live event is not double counted."""
+        queue = TaskQueue(bus)
+        bus.published.append(_finished(queue, "t1", "wf"))
+        waiter = asyncio.create_task(queue.wait_for_workflow("wf", expected_tasks=2, timeout=1))
+        await asyncio.sleep(0)
+
+        await bus.publish(_finished(queue, "t1", "wf"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await bus.publish(_finished(queue, "t2", "wf"))
+        assert set(await waiter) == {"t1", "t2"}
+        self._assert_unsubscribed(bus)
+
+    @pytest.mark.asyncio
+    async def test_timeout_unsubscribes(self, bus):
+        """Test an incomplete workflow times out and leaves no handlers behind."""
+        queue = TaskQueue(bus)
+        bus.published.append(_finished(queue, "t1", "wf"))
+
+        with pytest.raises(TimeoutError) as exc_info:
+            await queue.wait_for_workflow("wf", expected_tasks=2, timeout=0.01)
+
+        assert exc_info.value.__suppress_context__
+        self._assert_unsubscribed(bus)
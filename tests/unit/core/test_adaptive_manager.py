@@ -0,0 +1,165 @@
+"""
+Tests for the batched SQLite writes in SimpleAdaptiveManager.
+"""
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+# The adaptive package imports its MongoDB-backed managers eagerly
+pytest.importorskip("motor")
+
+from core.adaptive import manager as manager_module
+from core.adaptive.manager import MAX_WRITE_ATTEMPTS, SimpleAdaptiveManager
+
+
+SCHEMA = """
+    CREATE TABLE prompt_executions (
+        execution_id TEXT PRIMARY KEY, connector_name TEXT, prompt_name TEXT, version TEXT,
+        arguments TEXT, result TEXT, timestamp TEXT, user_context TEXT, outcome TEXT
+    );
+    CREATE TABLE user_feedback (
+        feedback_id TEXT PRIMARY KEY, execution_id TEXT, feedback_type TEXT,
+        rating INTEGER CHECK (rating IS NULL OR rating BETWEEN 1 AND 5),
+        text_feedback TEXT, timestamp TEXT
+    );
+"""
+
+
+def _rows(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+class TestSimpleAdaptiveManager:
+    """Test queued executions and feedback are flushed to SQLite."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Create a database with the adaptive tables."""
+        path = str(tmp_path / "adaptive.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA)
+        conn.close()
+        return path
+
+    @pytest.fixture
+    def manager(self, db_path, monkeypatch):
+        """Create a manager whose background thread never flushes on its own."""
+        monkeypatch.setattr(SimpleAdaptiveManager, "_ensure_flush_thread", lambda self: None)
+        manager = SimpleAdaptiveManager(db_path=db_path)
+        yield manager
+        manager.close()
+
+    @pytest.mark.asyncio
+    async def test_execution_and_feedback_written_on_flush(self, manager, db_path):
+        """Test queued rows only reach the database once flushed."""
+        async def base_prompt(name, arguments):
+            return SimpleNamespace(content="answer", metadata={})
+
+        result, execution_id = await manager.execute_adaptive_prompt(
+            "shell", "greet", {"name": "x"}, {"user": "u"}, base_prompt
+        )
+        manager.record_feedback(execution_id, "rating", rating=4)
+
+        assert result.metadata["execution_id"] == execution_id
+        assert _rows(db_path, "SELECT * FROM prompt_executions") == []
+
+        manager.flush()
+
+        executions = _rows(db_path, "SELECT execution_id, result, outcome FROM prompt_executions")
+        assert executions == [(execution_id, "answer", manager_module._SUCCESS_JSON)]
+        assert _rows(db_path, "SELECT execution_id, rating FROM user_feedback") == [(execution_id, 4)]
+
+    @pytest.mark.asyncio
+    async def test_records_arguments_orjson_rejects(self, manager, db_path):
+        """Test int-keyed dicts and big ints are recorded like json.dumps would."""
+        async def base_prompt(name, arguments):
+            return SimpleNamespace(content="answer", metadata={})
+
+        await manager.execute_adaptive_prompt(
+            "shell", "greet", {"counts": {1: 2}}, {"big": 2 ** 70}, base_prompt
+        )
+        manager.flush()
+
+        [(arguments, user_context)] = _rows(db_path, "SELECT arguments, user_context FROM prompt_executions")
+        assert json.loads(arguments) == {"counts": {"1": 2}}
+        assert json.loads(user_context) == {"big": 2 ** 70}
+
+    def test_bad_row_does_not_discard_batch(self, manager, db_path):
+        """Test a constraint violation only drops the offending row."""
+        manager.record_feedback("exec-1", "rating", rating=5)
+        manager.record_feedback("exec-2", "rating", rating=99)
+        manager.record_feedback("exec-3", "thumbs_up")
+
+        manager.flush()
+
+        assert _rows(db_path, "SELECT execution_id FROM user_feedback ORDER BY execution_id") == [
+            ("exec-1",), ("exec-3",)
+        ]
+        assert not manager._pending_feedback
+        assert manager._retry_counts == {}
+
+    def test_transient_failure_requeues_rows(self, manager, db_path):
+        """Test rows hitting an operational error are retried on the next flush."""
+        manager.record_feedback("exec-1", "thumbs_up")
+        manager.record_feedback("exec-2", "thumbs_down")
+
+        manager._get_connection().execute("PRAGMA busy_timeout=0")
+        locker = sqlite3.connect(db_path, timeout=0)
+        locker.execute("BEGIN EXCLUSIVE")
+        try:
+            manager.flush()
+            assert [row[1] for row in manager._pending_feedback] == ["exec-1", "exec-2"]
+        finally:
+            locker.rollback()
+            locker.close()
+
+        manager.flush()
+
+        assert _rows(db_path, "SELECT execution_id FROM user_feedback ORDER BY execution_id") == [
+            ("exec-1",), ("exec-2",)
+        ]
+        assert not manager._pending_feedback
+        assert manager._retry_counts == {}
+
+    def test_row_dropped_after_max_attempts(self, manager):
+        """Test a row failing transiently on every flush is eventually dropped."""
+        manager.record_feedback("exec-1", "thumbs_up")
+        conn = manager._get_connection()
+        conn.execute("DROP TABLE user_feedback")
+
+        for _ in range(MAX_WRITE_ATTEMPTS):
+            manager.flush()
+
+        assert not manager._pending_feedback
+        assert manager._retry_counts == {}
+
+    def test_close_flushes_and_closes_connection(self, db_path, monkeypatch):
+        """Test close writes anything still queued and releases the connection."""
+        monkeypatch.setattr(SimpleAdaptiveManager, "_ensure_flush_thread", lambda self: None)
+        manager = SimpleAdaptiveManager(db_path=db_path)
+        manager.record_feedback("exec-1", "thumbs_up")
+        manager._get_connection()
+
+        manager.close()
+
+        assert manager._conn is None
+        assert _rows(db_path, "SELECT execution_id FROM user_feedback") == [("exec-1",)]
+
+    def test_close_stops_flush_thread(self, db_path, monkeypatch):
+        """Test close joins the background flush thread."""
+        monkeypatch.setattr(manager_module, "FLUSH_INTERVAL_SECONDS", 60)
+        manager = SimpleAdaptiveManager(db_path=db_path)
+        manager.record_feedback("exec-1", "thumbs_up")
+        thread = manager._flush_thread
+
+        manager.close()
+
+        assert not thread.is_alive()
+        assert manager._flush_thread is None
+        assert _rows(db_path, "SELECT execution_id FROM user_feedback") == [("exec-1",)]
@@ -0,0 +1,241 @@
+"""
+Tests for AuthenticationManager.
+"""
+import asyncio
+import json
+import os
+import pickle
+import socket
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import aiohttp
+from aiohttp import web
+import pytest
+
+from core import auth_manager as auth_manager_module
+from core.auth_manager import (
+    ALLOW_PICKLE_ENV, DISABLE_UVLOOP_ENV, AuthenticationManager, AuthResult, AuthStatus,
+    _error_html, _parse_callback_query, _success_html, get_auth_manager
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class TestAuthenticationManager:
+    """Test AuthenticationManager OAuth flows."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create an authentication manager storing credentials under tmp_path."""
+        return AuthenticationManager(base_path=tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_oauth_callback_resolves_wait_for_auth(self, manager):
+        """Test the callback server hands the code to wait_for_auth and the callback."""
+        port = _free_port()
+        request = manager.create_auth_request("Test", "https://example.com/auth", callback_port=port)
+        received = []
+
+        await manager.start_oauth_server("Test", port, lambda code, state: received.append((code, state)))
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{request.callback_uri}?code=abc123&state={request.state}") as response:
+                assert response.status == 200
+                assert "Authentication Successful" in await response.text()
+
+        result = await manager.wait_for_auth(request.state, timeout=5)
+
+        assert result == AuthResult(success=True, credentials={"code": "abc123", "state": request.state})
+        assert received == [("abc123", request.state)]
+        assert request.state not in manager._auth_states
+
+    @pytest.mark.asyncio
+    async def test_oauth_callback_error(self, manager):
+        """Test provider errors are reported as failed results."""
+        port = _free_port()
+        request = manager.create_auth_request("Test", "https://example.com/auth", callback_port=port)
+
+        threads = []
+
+        await manager.start_oauth_server("Test", port, lambda code, state: threads.append(threading.current_thread()))
+        async with aiohttp.ClientSession() as session:
+            url = f"{request.callback_uri}?error=access_denied&error_description=Denied&state={request.state}"
+            async with session.get(url) as response:
+                assert response.status == 400
+                assert "Denied" in await response.text()
+
+        result = await manager.wait_for_auth(request.state, timeout=5)
+
+        assert result == AuthResult(success=False, error="access_denied")
+        # The completion callback runs on the worker pool, off the event loop thread
+        assert threads[0].name.startswith("auth-io")
+
+    @pytest.mark.asyncio
+    async def test_oauth_callback_failure_still_resolves(self, manager):
+        """Test a raising completion callback fails the flow and stops the server."""
+        port = _free_port()
+        request = manager.create_auth_request("Test", "https://example.com/auth", callback_port=port)
+
+        def callback(code, state):
+            raise RuntimeError("token exchange failed")
+
+        await manager.start_oauth_server("Test", port, callback)
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{request.callback_uri}?code=abc123&state={request.state}") as response:
+                assert response.status == 500
+                assert "Could not complete authentication" in await response.text()
+
+        result = await manager.wait_for_auth(request.state, timeout=5)
+
+        assert result.success is False
+        assert "token exchange failed" in result.error
+        await asyncio.gather(*manager._background_tasks)
+        assert port not in manager._auth_servers
+
+    @pytest.mark.asyncio
+    async def test_wait_for_auth_timeout(self, manager):
+        """Test waiting on a flow that never completes times out with None."""
+        request = manager.create_auth_request("Test", "https://example.com/auth")
+
+        assert await manager.wait_for_auth(request.state, timeout=0.01) is None
+        assert await manager.wait_for_auth("unknown-state", timeout=0.01) is None
+
+    def test_credentials_round_trip_json(self, manager, tmp_path):
+        """Test credentials are stored as JSON by default."""
+        path = manager.save_credentials("Test", {"token": "abc", "expires_in": 3600})
+
+        assert path == tmp_path / "Test_token.json"
+        assert json.loads(path.read_text()) == {"token": "abc", "expires_in": 3600}
+        assert manager.load_credentials("Test") == {"token": "abc", "expires_in": 3600}
+        assert manager.load_credentials("Missing") is None
+
+    def test_legacy_pickle_requires_opt_in(self, manager, tmp_path, monkeypatch):
+        """Test legacy pickle tokens are only loaded (and migrated to JSON) when allowed."""
+        with open(tmp_path / "Test_token.pickle", "wb") as f:
+            pickle.dump({"token": "legacy"}, f)
+
+        monkeypatch.delenv(ALLOW_PICKLE_ENV, raising=False)
+        assert manager.load_credentials("Test") is None
+        assert manager.load_credentials("Test", format="pickle") is None
+
+        monkeypatch.setenv(ALLOW_PICKLE_ENV, "1")
+        assert manager.load_credentials("Test") == {"token": "legacy"}
+        assert json.loads((tmp_path / "Test_token.json").read_text()) == {"token": "legacy"}
+
+    def test_callback_pages_escape_query_values(self):
+        """Test values reflected from the callback query are HTML-escaped."""
+        page = _error_html("<script>alert(1)</script>")
+        assert b"<script>" not in page
+        assert b"&lt;script&gt;" in page
+
+        page = _success_html("Test", "<b>code</b>")
+        assert b"<b>" not in page
+        assert b"Test has been authenticated successfully." in page
+
+    def test_get_auth_manager_is_singleton(self, tmp_path, monkeypatch):
+        """Test the global manager is created once and reused."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setenv(DISABLE_UVLOOP_ENV, "1")
+        get_auth_manager.cache_clear()
+        try:
+            manager = get_auth_manager()
+            assert get_auth_manager() is manager
+            assert manager.base_path == tmp_path / ".mcp-bridge" / "auth"
+        finally:
+            get_auth_manager.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_async_credential_io(self, manager):
+        """Test the async credential helpers round-trip through the I/O pool."""
+        assert await manager.acheck_auth_status("Test") == AuthStatus.NEEDS_AUTH
+
+        await manager.asave_credentials("Test", {"token": "abc"})
+
+        assert await manager.aload_credentials("Test") == {"token": "abc"}
+        assert await manager.acheck_auth_status("Test") == AuthStatus.AUTHENTICATED
+
+    @pytest.mark.asyncio
+    async def test_wait_for_auth_wakes_on_result(self, manager):
+        """Test a waiter blocked on a state is woken by the callback result."""
+        request = manager.create_auth_request("Test", "https://example.com/auth")
+        waiter = asyncio.create_task(manager.wait_for_auth(request.state, timeout=5))
+        await asyncio.sleep(0)
+
+        manager._resolve_auth(request.state, AuthResult(success=True))
+
+        assert await waiter == AuthResult(success=True)
+        assert request.state not in manager._auth_states
+
+    def test_parse_callback_query(self):
+        """Test only the OAuth callback fields are decoded from the raw query."""
+        query = _parse_callback_query("code=a%2Fb+c&state=s1&state=s2&scope=email&error_description=")
+
+        assert query == {"code": "a/b c", "state": "s1", "error_description": ""}
+        assert _parse_callback_query("") == {}
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_reuses_session(self, manager):
+        """Test token refreshes post form data over the shared session."""
+        received = []
+
+        async def token(request):
+            received.append(dict(await request.post()))
+            return web.json_response({"access_token": f"token{len(received)}"})
+
+        app = web.Application()
+        app.router.add_post("/token", token)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        port = _free_port()
+        await web.TCPSite(runner, "localhost", port).start()
+        try:
+            url = f"http://localhost:{port}/token"
+            assert await manager.refresh_token(url, {"grant_type": "refresh_token"}) == {"access_token": "token1"}
+            session = manager._http
+            assert await manager.refresh_token(url, {"grant_type": "refresh_token"}) == {"access_token": "token2"}
+            assert manager._http is session
+        finally:
+            await manager.aclose()
+            await runner.cleanup()
+
+        assert session.closed
+        assert received == [{"grant_type": "refresh_token"}] * 2
+
+    def test_format_auth_response(self, manager):
+        """Test the expiry is formatted once when the request is created."""
+        request = manager.create_auth_request("Test", "https://example.com/auth")
+        response = manager.format_auth_response(request)
+
+        assert request.expires_at_iso == request.expires_at.isoformat()
+        assert response["expires_at"] == request.expires_at_iso
+        assert response["state"] == request.state
+        assert response["type"] == "authentication_required"
+
+    def test_new_state_uses_pooled_randomness(self, manager):
+        """Test state tokens are unique, URL-safe and share one urandom read."""
+        with patch("core.auth_manager.os.urandom", wraps=os.urandom) as mock_urandom:
+            states = [manager.create_auth_request("Test", "https://example.com/auth").state for _ in range(100)]
+
+        assert mock_urandom.call_count == 1
+        assert len(set(states)) == 100
+        assert all(len(state) == 43 and "=" not in state for state in states)
+
+    def test_install_uvloop(self, monkeypatch):
+        """Test the uvloop policy is installed only when available and not disabled."""
+        policy = Mock()
+        monkeypatch.setattr(auth_manager_module, "uvloop", Mock(EventLoopPolicy=Mock(return_value=policy)), raising=False)
+        monkeypatch.setattr(auth_manager_module, "UVLOOP_AVAILABLE", True)
+
+        with patch.object(auth_manager_module.asyncio, "set_event_loop_policy") as mock_set_policy:
+            monkeypatch.setenv(DISABLE_UVLOOP_ENV, "1")
+            assert auth_manager_module._install_uvloop() is False
+            mock_set_policy.assert_not_called()
+
+            monkeypatch.delenv(DISABLE_UVLOOP_ENV)
+            assert auth_manager_module._install_uvloop() is True
+            mock_set_policy.assert_called_once_with(policy)
@@ -2,7 +2,7 @@
 Tests for BaseConnector core component.
 """
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any, List
 
 from core.base_connector import BaseConnector
@@ -217,7 +217,89 @@ class TestBaseConnector:
         assert resource.uri == "test://config"
         assert resource.name == "Test Configuration"
         assert resource.mimeType == "application/json"
-    
+
+    @pytest.mark.asyncio
+    async def test_validate_exists_uses_cached_index(self, connector):
+        """Test tool/resource lookups are cached until the connector is re-initialized."""
+        connector.get_tools = Mock(wraps=connector.get_tools)
+
+        assert connector.validate_tool_exists("test_tool")
+        assert not connector.validate_tool_exists("missing_tool")
+        assert connector.validate_resource_exists("test://config")
+        assert not connector.validate_resource_exists("test://nonexistent")
+        assert connector.get_tools.call_count == 1
+
+        await connector.initialize()
+        assert connector.validate_tool_exists("error_tool")
+        assert connector.get_tools.call_count == 2
+
+    def test_track_usage_logging(self, connector, caplog):
+        """Test usage is always accumulated but only formatted when INFO is enabled."""
+        import logging
+        from core.models import UsageStats
+
+        usage = UsageStats(input_tokens=3, output_tokens=4, total_tokens=7, estimated_cost=0.5, api_calls=1)
+
+        with caplog.at_level(logging.WARNING, logger=connector.logger.name):
+            connector.track_usage(usage)
+        assert caplog.records == []
+
+        with caplog.at_level(logging.INFO, logger=connector.logger.name):
+            connector.track_usage(usage)
+        assert caplog.messages == [
+            "Request usage for test_connector: Tokens: 7 (in: 3, out: 4) | API calls: 1 | Cost: $0.5000"
+        ]
+        assert connector.usage_stats.total_tokens == 14
+
+    def test_usage_stats_add_and_validation(self):
+        """Test UsageStats adds field-wise and is still validated inside ToolResult."""
+        import dataclasses
+        from core.models import UsageStats
+
+        total = UsageStats(1, 2, 3, 0.25, 1).add(UsageStats(10, 20, 30, 0.5, 2))
+        assert total == UsageStats(11, 22, 33, 0.75, 3)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            total.api_calls = 0
+
+        result = ToolResult(content=[], usage={"input_tokens": 5, "total_tokens": 5})
+        assert result.usage == UsageStats(input_tokens=5, total_tokens=5)
+        assert result.model_dump()["usage"]["total_tokens"] == 5
+
+    def test_invalidate_tools_rebuilds_lookups(self, connector):
+        """Test tool lookups are cached and rebuilt after invalidate_tools."""
+        assert connector.validate_tool_exists("test_tool")
+
+        with patch.object(connector, "get_tools", return_value=[]) as get_tools:
+            assert connector.validate_tool_exists("test_tool")
+            get_tools.assert_not_called()
+
+            connector.invalidate_tools()
+            assert not connector.validate_tool_exists("test_tool")
+            get_tools.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_initialize_installs_eager_task_factory(self, connector):
+        """Test initialize switches the running loop to eager task start when available."""
+        import asyncio
+        from core import base_connector
+
+        def factory(loop, coro, **kwargs):
+            return asyncio.Task(coro, loop=loop, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        try:
+            with patch.object(base_connector, "_EAGER_TASK_FACTORY", factory):
+                await connector.initialize()
+                assert loop.get_task_factory() is factory
+
+                loop.set_task_factory(None)
+                custom = Mock()
+                loop.set_task_factory(custom)
+                await connector.initialize()
+                assert loop.get_task_factory() is custom
+        finally:
+            loop.set_task_factory(None)
+
     @pytest.mark.asyncio
     async def test_read_resource_success(self, connector):
         """Test successful resource reading."""
@@ -326,6 +408,29 @@ class TestBaseConnector:
         assert auth_result["user_info"]["role"] == "admin"
         assert "timestamp" in auth_result
     
+    def test_create_auth_required_result(self, connector):
+        """Test auth-required results reuse the cached text for a service and only swap the URL."""
+        from core.base_connector import _auth_required_prefix
+
+        _auth_required_prefix.cache_clear()
+        first = connector.create_auth_required_result("https://example.com/auth?state=1")
+        second = connector.create_auth_required_result("https://example.com/auth?state=2")
+
+        assert first.content[0].text == (
+            "🔐 Authentication Required for Test_Connector\n\n"
+            "To use Test_Connector tools, authentication is required:\n\n"
+            "1. Click the link below to authenticate\n"
+            "2. Sign in and authorize access\n"
+            "3. Return to Claude Desktop and try your request again\n"
+            "\n\n🔗 Authentication URL:\nhttps://example.com/auth?state=1"
+        )
+        assert second.content[0].text.endswith("state=2")
+        assert not first.is_error
+        assert _auth_required_prefix.cache_info().hits == 1
+
+        custom = connector.create_auth_required_result("https://x", service_name="Svc {x}", instructions="Do it")
+        assert custom.content[0].text == "🔐 Authentication Required for Svc {x}\n\nDo it\n\n🔗 Authentication URL:\nhttps://x"
+
     def test_create_auth_result_failure(self, connector):
         """Test authentication failure result."""
         auth_result = connector._create_auth_result(
@@ -0,0 +1,330 @@
+"""
+Tests for the entity indexing service.
+"""
+import asyncio
+import enum
+import importlib.util
+import signal
+import sys
+import types
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+pytest.importorskip("motor")
+pytest.importorskip("structlog")
+
+
+def _install_entities_stub():
+    """Stand in for the entities connector package when it is not installed.
+
+    The service only touches the connector through the mocks below, but
+    importing it needs the package's names to exist.
+    """
+    if importlib.util.find_spec("src.connectors.entities") is not None:
+        return
+    package = types.ModuleType("src.connectors.entities")
+    package.__path__ = []
+    connector = types.ModuleType("src.connectors.entities.enhanced_connector")
+    connector.EnhancedEntitiesConnector = type("EnhancedEntitiesConnector", (), {})
+    models = types.ModuleType("src.connectors.entities.models")
+    for name in ("BaseEntity", "Person", "Project", "Organization", "EntityRelationship"):
+        setattr(models, name, type(name, (), {}))
+    models.EntityType = enum.Enum(
+        "EntityType", {"PERSON": "person", "PROJECT": "project", "ORGANIZATION": "organization"}
+    )
+    models.PersonType = enum.Enum("PersonType", {"CONTACT": "contact"})
+    models.RelationshipType = enum.Enum("RelationshipType", {
+        "WORKS_FOR": "works_for", "LEADS_PROJECT": "leads_project",
+        "REPORTS_TO": "reports_to", "COLLABORATES_ON": "collaborates_on",
+    })
+    sys.modules.update({
+        package.__name__: package,
+        connector.__name__: connector,
+        models.__name__: models,
+    })
+
+
+_install_entities_stub()
+indexing = pytest.importorskip("src.core.entity_indexing_service")
+EntityIndexingService = indexing.EntityIndexingService
+
+
+class FakeCursor:
+    """Chainable find() cursor returning fixed documents."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def limit(self, n):
+        return self
+
+    async def to_list(self, length=None):
+        return list(self.docs)
+
+
+class FakeAggregateCursor:
+    """Async aggregate() cursor yielding fixed documents."""
+
+    def __init__(self, docs):
+        self.docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.docs)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class FakeCollection:
+    """Motor-like collection; as with PyMongo 4, truth-testing it raises."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.create_index = AsyncMock()
+        self.update_one = AsyncMock()
+        self.update_many = AsyncMock()
+        self.delete_many = AsyncMock()
+        self.bulk_write = AsyncMock()
+        self.estimated_document_count = AsyncMock(return_value=0)
+        self.find = Mock(return_value=FakeCursor([]))
+        self.aggregate = Mock(return_value=FakeAggregateCursor([]))
+
+    def __bool__(self):
+        raise NotImplementedError("Collection objects do not implement truth value testing")
+
+
+@pytest.fixture
+def service():
+    """Create a service wired to fake collections."""
+    service = EntityIndexingService({})
+    service.entities_connector = Mock(
+        entities_collection=FakeCollection("entities"),
+        embeddings_collection=FakeCollection("embeddings"),
+        relationships_collection=FakeCollection("relationships"),
+        _generate_entity_embedding=AsyncMock(),
+        update_entity_embedding=AsyncMock(),
+    )
+    service.memory_integration = Mock(
+        extract_entities_from_text=AsyncMock(return_value="extraction"),
+        create_relationships_from_extraction=AsyncMock(),
+    )
+    return service
+
+
+class TestEntityIndexingService:
+    """Test EntityIndexingService maintenance tasks."""
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes(self, service):
+        """Test the maintenance indexes are created without truth-testing collections."""
+        await service._ensure_indexes()
+
+        embeddings = service.entities_connector.embeddings_collection
+        assert [call.args[0] for call in embeddings.create_index.call_args_list] == [
+            [("indexed_at", 1)], [("entity_id", 1)]
+        ]
+        assert embeddings.create_index.call_args_list[1].kwargs["unique"] is True
+        service.entities_connector.relationships_collection.create_index.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_without_embeddings(self, service):
+        """Test only the relationship index is created when vectors are disabled."""
+        service.entities_connector.embeddings_collection = None
+
+        await service._ensure_indexes()
+
+        service.entities_connector.relationships_collection.create_index.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_index_one_stores_hash_and_extracts(self, service):
+        """Test indexing records the content hash and goes on to relationship extraction."""
+        entity = {"id": "e1", "name": "Ada", "description": "Works on engines"}
+
+        await service._index_one(entity)
+
+        service.entities_connector.embeddings_collection.update_one.assert_awaited_once_with(
+            {"entity_id": "e1"}, {"$set": {"content_hash": service._content_hash(entity)}}
+        )
+        service.memory_integration.create_relationships_from_extraction.assert_awaited_once_with(
+            "extraction", {"Ada": "e1"}
+        )
+        assert service._cycle_counts["indexed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_pass_skips_unchanged_content(self, service):
+        """Test a stale embedding whose text and model are unchanged is refreshed, not re-embedded."""
+        unchanged_id, changed_id = "a" * 24, "b" * 24
+        entities = [
+            {"_id": indexing.ObjectId(unchanged_id), "name": "Ada", "description": "Engines"},
+            {"_id": indexing.ObjectId(changed_id), "name": "Bob", "description": "New text"},
+        ]
+        stale = [
+            {"entity_id": unchanged_id, "content_hash": service._content_hash(entities[0])},
+            {"entity_id": changed_id, "content_hash": "old"},
+        ]
+        embeddings = service.entities_connector.embeddings_collection
+        embeddings.find.return_value = FakeCursor(stale)
+        service.entities_connector.entities_collection.find.return_value = FakeCursor(entities)
+
+        await service._update_stale_embeddings()
+
+        service.entities_connector.update_entity_embedding.assert_awaited_once_with(changed_id)
+        assert embeddings.update_many.await_args.args[0] == {"entity_id": {"$in": [unchanged_id]}}
+        assert service._cycle_counts["stale_reembedded"] == 1
+        assert service._cycle_counts["stale_unchanged"] == 1
+
+    @pytest.mark.asyncio
+    async def test_indexing_stats(self, service):
+        """Test stats use estimated counts from all three collections."""
+        service.entities_connector.entities_collection.estimated_document_count.return_value = 5
+        service.entities_connector.embeddings_collection.estimated_document_count.return_value = 3
+
+        stats = await service._get_indexing_stats()
+
+        assert stats["indexed_entities"] == 3
+        assert stats["pending_index"] == 2
+
+    @pytest.mark.asyncio
+    async def test_orphan_cleanup_ignores_non_object_ids(self, service):
+        """Test embeddings keyed by non-ObjectId strings are never deleted as orphans."""
+        orphan_id = "c" * 24
+        embeddings = service.entities_connector.embeddings_collection
+        embeddings.aggregate.return_value = FakeAggregateCursor([
+            {"entity_id": orphan_id}, {"entity_id": "custom-entity-id"}
+        ])
+        embeddings.delete_many.return_value = Mock(deleted_count=1)
+
+        await service._cleanup_orphaned_embeddings()
+
+        embeddings.delete_many.assert_awaited_once_with({"entity_id": {"$in": [orphan_id]}})
+        pipeline = embeddings.aggregate.call_args.args[0]
+        lookup = next(i for i, stage in enumerate(pipeline) if "$lookup" in stage)
+        # Unconvertible ids are filtered out on the server before the lookup
+        assert {"$match": {"eid": {"$ne": None}}} in pipeline[:lookup]
+        assert pipeline[lookup]["$lookup"]["let"] == {"eid": "$eid"}
+
+    @pytest.mark.asyncio
+    async def test_index_batch_is_bounded_by_concurrency(self, service):
+        """Test a batch is indexed concurrently, at most index_concurrency at a time."""
+        service.index_concurrency = 2
+        active, peak = 0, 0
+
+        async def index_one(entity):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        async def stop_after_one_run(next_run, interval):
+            service.running = False
+
+        service.entities_connector.get_unindexed_entities = AsyncMock(return_value=[{"id": i} for i in range(5)])
+        service.running = True
+        with patch.object(service, "_index_one", side_effect=index_one) as mock_index, \
+             patch.object(service, "_sleep_until_next_run", side_effect=stop_after_one_run):
+            await service._index_entities_loop()
+
+        assert mock_index.await_count == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_inferred_relationships_single_bulk_upsert(self, service):
+        """Test co-occurrences become $setOnInsert upserts sent in one unordered bulk_write."""
+        relationships = service.entities_connector.relationships_collection
+        relationships.bulk_write.return_value = Mock(upserted_count=1)
+
+        with patch.object(indexing, "datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value.isoformat.return_value = "now"
+            await service._create_inferred_relationships({("a", "b"): 1.0})
+
+        operations = relationships.bulk_write.await_args.args[0]
+        assert operations == [indexing.UpdateOne(
+            {"from_entity_id": "a", "to_entity_id": "b"},
+            {"$setOnInsert": {
+                "relationship_type": "collaborates_on",
+                "metadata": {"inferred": True, "strength": 1.0, "created_by": "indexing_service", "created_at": "now"}
+            }},
+            upsert=True
+        )]
+        assert relationships.bulk_write.await_args.kwargs == {"ordered": False}
+        assert service._cycle_counts["relationships_created"] == 1
+
+        await service._create_inferred_relationships({})
+        relationships.bulk_write.assert_awaited_once()
+
+    def test_analyze_cooccurrences(self, service):
+        """Test pairs are counted once per memory, ordered, and filtered before normalizing."""
+        def memory(*ids):
+            return {"entity_refs": [{"entity_id": entity_id} for entity_id in ids]}
+
+        memories = [memory("b", "a", "a"), memory("a", "b", "c"), memory("a", "b"), memory("c", "d")]
+
+        assert service._analyze_cooccurrences(memories) == {("a", "b"): 1.0}
+        assert service._analyze_cooccurrences([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_extract_cache_is_lru(self, service):
+        """Test extraction results are reused by text and the least recently used is evicted."""
+        service._extract_cache_max = 2
+        extract = service.memory_integration.extract_entities_from_text
+
+        await service._extract_entities("one")
+        await service._extract_entities("two")
+        await service._extract_entities("one")
+        await service._extract_entities("three")
+        await service._extract_entities("one")
+
+        assert [call.args[0] for call in extract.await_args_list] == ["one", "two", "three"]
+        assert service._cycle_counts["extract_cache_hits"] == 2
+        assert len(service._extract_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_sleep_until_next_run_is_fixed_rate(self, service):
+        """Test runs keep to their schedule and an overrun starts the next run at once."""
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "time", return_value=105.0), \
+             patch.object(indexing.asyncio, "sleep", new=AsyncMock()) as mock_sleep:
+            assert await service._sleep_until_next_run(100.0, 60) == 160.0
+            mock_sleep.assert_awaited_with(55.0)
+
+            assert await service._sleep_until_next_run(0.0, 60) == 105.0
+            mock_sleep.assert_awaited_with(0.0)
+
+    @pytest.mark.asyncio
+    async def test_health_tick_reports_and_resets_counts(self, service):
+        """Test activity counters go out in the health log line and restart each tick."""
+        service._cycle_counts["indexed"] = 3
+
+        async def stop_after_one_run(next_run, interval):
+            service.running = False
+
+        service.running = True
+        with patch.object(indexing, "logger") as mock_logger, \
+             patch.object(service, "_sleep_until_next_run", side_effect=stop_after_one_run):
+            await service._monitor_health()
+
+        assert mock_logger.info.call_args.kwargs["indexed"] == 3
+        assert not service._cycle_counts
+
+    @pytest.mark.asyncio
+    async def test_run_registers_loop_signal_handlers(self):
+        """Test SIGINT/SIGTERM are handled on the event loop and schedule a stop."""
+        loop = asyncio.get_running_loop()
+        service = Mock(initialize=AsyncMock(), start=AsyncMock(), stop=AsyncMock())
+        try:
+            with patch.object(indexing, "EntityIndexingService", return_value=service), \
+                 patch.object(loop, "add_signal_handler") as mock_add:
+                await indexing.run_indexing_service({})
+        finally:
+            loop.set_task_factory(None)
+
+        assert [call.args[0] for call in mock_add.call_args_list] == [signal.SIGINT, signal.SIGTERM]
+        handler, sig = mock_add.call_args.args[1:]
+        handler(sig)
+        await asyncio.sleep(0)
+        service.stop.assert_awaited_once()
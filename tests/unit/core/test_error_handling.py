@@ -0,0 +1,198 @@
+"""
+Tests for error handling utilities.
+"""
+import asyncio
+from collections import OrderedDict
+
+import pytest
+from unittest.mock import patch
+
+from core import error_handling
+from core.error_handling import (
+    ErrorContext, ErrorSeverity, ExternalServiceError, MCPError, ValidationError,
+    handle_errors, retry_with_backoff, validate_required_fields
+)
+
+
+class TestRetryWithBackoff:
+    """Test retry_with_backoff decorator."""
+
+    def test_sync_retry_uses_backoff_schedule(self):
+        """Test retries sleep along the capped exponential schedule."""
+        calls = []
+
+        @retry_with_backoff(max_attempts=4, base_delay=1.0, max_delay=3.0, jitter=False)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 4:
+                raise ValueError("boom")
+            return "ok"
+
+        with patch.object(error_handling.time, "sleep") as mock_sleep:
+            assert flaky() == "ok"
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_async_retry_reraises_after_max_attempts(self):
+        """Test the last error is raised once all attempts are used."""
+        @retry_with_backoff(max_attempts=2, base_delay=0.5, jitter=False)
+        async def failing():
+            raise ValueError("boom")
+
+        with patch.object(error_handling.asyncio, "sleep") as mock_sleep:
+            with pytest.raises(ValueError):
+                await failing()
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_retry_logging_uses_lazy_arguments(self, caplog):
+        """Test retry log records render their message from deferred arguments."""
+        @retry_with_backoff(max_attempts=2, base_delay=0.5, jitter=False)
+        def failing():
+            raise ValueError("boom")
+
+        with patch.object(error_handling.time, "sleep"), caplog.at_level("WARNING", logger=error_handling.__name__):
+            with pytest.raises(ValueError):
+                failing()
+
+        warning, error = caplog.records
+        assert warning.args == (1, 2, "failing", 0.5)
+        assert warning.getMessage() == "Retry 1/2 for failing after 0.50s"
+        assert warning.error == "boom"
+        assert error.getMessage() == "Max retries (2) reached for failing"
+
+    def test_full_jitter(self):
+        """Test full jitter sleeps a random time between zero and the backoff delay."""
+        @retry_with_backoff(max_attempts=2, base_delay=2.0, jitter="full")
+        def failing():
+            raise ValueError("boom")
+
+        with patch.object(error_handling.time, "sleep") as mock_sleep, \
+             patch.object(error_handling.random, "uniform", return_value=0.25) as mock_uniform:
+            with pytest.raises(ValueError):
+                failing()
+
+        mock_uniform.assert_called_once_with(0, 2.0)
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_invalid_jitter_mode(self):
+        """Test unknown jitter modes are rejected at decoration time."""
+        with pytest.raises(ValueError):
+            retry_with_backoff(jitter="quarter")
+
+
+class TestHandleErrors:
+    """Test handle_errors decorator."""
+
+    def test_sync_returns_default_and_reraises(self):
+        """Test caught errors return the default while raise_on and critical errors propagate."""
+        @handle_errors(ValueError, default_return="default", raise_on=(KeyError,))
+        def fail(exc):
+            raise exc
+
+        assert fail(ValueError("boom")) == "default"
+        with pytest.raises(TypeError):
+            fail(TypeError("not caught"))
+
+        @handle_errors(Exception, default_return="default", raise_on=(KeyError,))
+        def fail_any(exc):
+            raise exc
+
+        with pytest.raises(KeyError):
+            fail_any(KeyError("raise_on"))
+        with pytest.raises(MCPError):
+            fail_any(MCPError("critical", severity=ErrorSeverity.CRITICAL))
+
+    @pytest.mark.asyncio
+    async def test_async_returns_default(self):
+        """Test async functions get the same handling."""
+        @handle_errors(ValueError, default_return=[], log_errors=False)
+        async def fail():
+            raise ValueError("boom")
+
+        assert await fail() == []
+
+    @pytest.mark.asyncio
+    async def test_async_reraises_original_exception(self):
+        """Test raise_on and critical errors propagate unchanged from async functions."""
+        error = KeyError("raise_on")
+
+        @handle_errors(Exception, raise_on=(KeyError,), log_errors=False)
+        async def fail(exc):
+            raise exc
+
+        with pytest.raises(KeyError) as exc_info:
+            await fail(error)
+        assert exc_info.value is error
+        assert exc_info.tb.tb_next is not None  # traceback still reaches the wrapped function
+
+        with pytest.raises(MCPError):
+            await fail(MCPError("critical", severity=ErrorSeverity.CRITICAL))
+
+    def test_disabled_error_logging_skips_log_call(self):
+        """Test no record is built when ERROR logging is disabled."""
+        @handle_errors(ValueError)
+        def fail():
+            raise ValueError("boom")
+
+        with patch.object(error_handling.logger, "isEnabledFor", return_value=False), \
+             patch.object(error_handling.logger, "error") as mock_error:
+            assert fail() is None
+
+        mock_error.assert_not_called()
+
+
+class TestErrorContext:
+    """Test ErrorContext context manager."""
+
+    def test_suppresses_when_not_reraising(self):
+        """Test errors are swallowed when reraise is False."""
+        with ErrorContext("op", reraise=False) as context:
+            raise ValueError("boom")
+
+        assert not hasattr(context, "__dict__")
+
+    def test_connection_errors_become_external_service_errors(self):
+        """Test connection failures are converted to ExternalServiceError."""
+        with pytest.raises(ExternalServiceError) as exc_info:
+            with ErrorContext("fetch", service="api"):
+                raise ConnectionError("refused")
+
+        assert exc_info.value.details == {"original_error": "ConnectionError"}
+
+    @pytest.mark.parametrize("exc", [TimeoutError("slow"), asyncio.TimeoutError()])
+    def test_timeouts_become_external_service_errors(self, exc):
+        """Test built-in and asyncio timeouts are both converted."""
+        with pytest.raises(ExternalServiceError):
+            with ErrorContext("fetch"):
+                raise exc
+
+    def test_other_os_errors_pass_through(self):
+        """Test local OS errors are not reported as external service failures."""
+        with pytest.raises(FileNotFoundError):
+            with ErrorContext("read"):
+                raise FileNotFoundError("missing")
+
+
+class TestValidateRequiredFields:
+    """Test validate_required_fields."""
+
+    def test_valid_fields(self):
+        """Test non-empty values of any type pass."""
+        validate_required_fields(name="x", items=[1], data={"a": 1}, count=0, flag=False)
+
+    @pytest.mark.parametrize("value,message", [
+        (None, "is None"),
+        ("   ", "is empty"),
+        ([], "is empty"),
+        ({}, "is empty"),
+        (OrderedDict(), "is empty"),
+    ])
+    def test_missing_or_empty_fields(self, value, message):
+        """Test None, blank strings and empty containers (including subclasses) are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_required_fields(field=value)
+
+        assert message in str(exc_info.value)
+        assert exc_info.value.field == "field"
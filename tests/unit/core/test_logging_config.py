@@ -0,0 +1,240 @@
+"""
+Tests for the logging configuration.
+"""
+import json
+import logging
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# env_config loads .env files through python-dotenv
+pytest.importorskip("dotenv")
+
+from core import logging_config
+from core.logging_config import (
+    ColoredFormatter, FastRotatingFileHandler, StructuredFormatter, _RecordQueueHandler,
+    configure_module_loggers, setup_logging
+)
+
+
+def _record(msg="hello %s", args=("world",), level=logging.INFO, exc_info=None, **extra):
+    record = logging.LogRecord("test.logger", level, __file__, 42, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+def _exc_info():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        return sys.exc_info()
+
+
+def _json_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Put the root logger's handlers and level back after setup_logging."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    logging_config._stop_queue_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestStructuredFormatter:
+    """Test JSON log records."""
+
+    def test_includes_extra_fields_and_exception(self):
+        """Test extra= fields and exc_info end up in the JSON document."""
+        record = _record(exc_info=_exc_info(), request_id="abc", attempt=2)
+
+        data = json.loads(StructuredFormatter().format(record))
+
+        assert data["message"] == "hello world"
+        assert data["logger"] == "test.logger"
+        assert data["level"] == "INFO"
+        assert data["line"] == 42
+        assert data["request_id"] == "abc"
+        assert data["attempt"] == 2
+        assert "ValueError: boom" in data["exception"]
+        assert data["timestamp"].endswith("Z")
+
+    def test_skips_standard_record_attributes(self):
+        """Test regular LogRecord attributes are not repeated as extra fields."""
+        data = json.loads(StructuredFormatter().format(_record()))
+
+        for attr in ("msg", "args", "levelno", "pathname", "created", "exc_info", "thread"):
+            assert attr not in data
+
+    def test_serializes_non_json_values(self):
+        """Test values without a JSON form are stringified instead of failing."""
+        data = json.loads(StructuredFormatter().format(_record(path=logging_config.Path("/tmp/x"))))
+
+        assert data["path"] == "/tmp/x"
+
+    def test_serializes_int_keys_and_big_ints(self):
+        """Test extras the orjson fast path rejects still produce a JSON line."""
+        data = json.loads(StructuredFormatter().format(_record(counts={1: 2}, big=2 ** 70)))
+
+        assert data["counts"] == {"1": 2}
+        assert data["big"] == 2 ** 70
+
+
+class TestColoredFormatter:
+    """Test colored console output."""
+
+    def test_colors_only_its_own_output(self):
+        """Test the level name is colored for the console and restored for other handlers."""
+        record = _record(level=logging.WARNING)
+
+        output = ColoredFormatter("%(levelname)s %(message)s").format(record)
+
+        assert output == f"\033[33mWARNING{ColoredFormatter.RESET} hello world"
+        assert record.levelname == "WARNING"
+        assert json.loads(StructuredFormatter().format(record))["level"] == "WARNING"
+
+    def test_unknown_level_is_left_plain(self):
+        """Test custom level names are formatted without colors."""
+        record = _record(level=25)
+
+        assert ColoredFormatter("%(levelname)s").format(record) == "Level 25"
+
+
+class TestFastRotatingFileHandler:
+    """Test size-based rollover."""
+
+    def test_rolls_over_only_when_full(self, tmp_path):
+        """Test a rollover happens once the next record would exceed maxBytes."""
+        path = tmp_path / "app.log"
+        handler = FastRotatingFileHandler(path, maxBytes=60, backupCount=1, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.emit(_record(msg="x" * 30, args=()))
+            assert not (tmp_path / "app.log.1").exists()
+
+            handler.emit(_record(msg="y" * 30, args=()))
+            assert (tmp_path / "app.log.1").read_text() == "x" * 30 + "\n"
+            assert path.read_text() == "y" * 30 + "\n"
+        finally:
+            handler.close()
+
+    def test_never_rolls_over_without_max_bytes(self, tmp_path):
+        """Test maxBytes=0 disables rollover."""
+        handler = FastRotatingFileHandler(tmp_path / "app.log", encoding="utf-8")
+        try:
+            assert handler.shouldRollover(_record(msg="x" * 1000, args=())) is False
+        finally:
+            handler.close()
+
+
+class TestRecordQueueHandler:
+    """Test records handed to the file listener."""
+
+    def test_prepare_keeps_exc_info_and_extras(self):
+        """Test the queued copy keeps structured data and only merges the message."""
+        record = _record(exc_info=_exc_info(), request_id="abc")
+        handler = _RecordQueueHandler(None)
+
+        prepared = handler.prepare(record)
+
+        assert prepared is not record
+        assert prepared.msg == "hello world"
+        assert prepared.args is None
+        assert prepared.exc_info is record.exc_info
+        assert prepared.request_id == "abc"
+        assert record.args == ("world",)
+
+
+class TestSetupLogging:
+    """Test setup_logging wiring."""
+
+    def _log_failure(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test.setup").error("failed %s", "op", exc_info=True, extra={"request_id": "abc"})
+
+    def test_file_records_written_after_repeated_setup(self, tmp_path, restore_root_logger):
+        """Test a record with extra= and exc_info reaches the file as JSON after setup runs again."""
+        log_file = tmp_path / "logs" / "app.log"
+        setup_logging("INFO", log_file, console_enabled=False)
+        setup_logging("INFO", log_file, console_enabled=False)
+
+        assert len(logging_config._queue_listeners) == 1
+        assert sum(isinstance(h, _RecordQueueHandler) for h in restore_root_logger.handlers) == 1
+
+        self._log_failure()
+        logging_config._stop_queue_listener()
+
+        assert logging_config._queue_listeners == []
+        failure = [line for line in _json_lines(log_file) if line["logger"] == "test.setup"]
+        assert len(failure) == 1
+        assert failure[0]["message"] == "failed op"
+        assert failure[0]["request_id"] == "abc"
+        assert "ValueError: boom" in failure[0]["exception"]
+
+    def test_stopping_listener_flushes_queued_records(self, tmp_path, restore_root_logger):
+        """Test records still queued when the listener stops are written before the file closes."""
+        log_file = tmp_path / "app.log"
+        setup_logging("INFO", log_file, console_enabled=False)
+        listener = logging_config._queue_listeners[0]
+
+        for i in range(50):
+            logging.getLogger("test.flush").info("record %d", i, extra={"index": i})
+        logging_config._stop_queue_listener()
+
+        indexes = [line["index"] for line in _json_lines(log_file) if line["logger"] == "test.flush"]
+        assert indexes == list(range(50))
+        assert all(handler.stream is None for handler in listener.handlers)
+
+    def test_console_skipped_without_terminal_stdin(self, tmp_path, restore_root_logger):
+        """Test no console handler is added when running as an MCP stdio server."""
+        with patch.object(logging_config, "_STDIN_TTY", False):
+            setup_logging("INFO", tmp_path / "app.log")
+
+        assert not [h for h in restore_root_logger.handlers if type(h) is logging.StreamHandler]
+
+    def test_console_colored_on_terminal(self, tmp_path, restore_root_logger):
+        """Test the console gets colors only when stdout is a terminal."""
+        with patch.object(logging_config, "_STDIN_TTY", True), \
+             patch.object(logging_config, "_STDOUT_TTY", True):
+            setup_logging("INFO", tmp_path / "app.log", file_enabled=False)
+        console = [h for h in restore_root_logger.handlers if type(h) is logging.StreamHandler]
+        assert len(console) == 1
+        assert isinstance(console[0].formatter, ColoredFormatter)
+
+        with patch.object(logging_config, "_STDIN_TTY", True), \
+             patch.object(logging_config, "_STDOUT_TTY", False):
+            setup_logging("INFO", tmp_path / "app.log", file_enabled=False)
+        console = [h for h in restore_root_logger.handlers if type(h) is logging.StreamHandler]
+        assert not isinstance(console[0].formatter, ColoredFormatter)
+
+
+class TestConfigureModuleLoggers:
+    """Test per-module logger levels."""
+
+    def test_sets_levels_only_when_changed(self):
+        """Test a repeated call leaves logger levels (and their caches) alone."""
+        names = ("urllib3", "googleapiclient", "google.auth", "asyncio",
+                 "src.connectors", "src.core", "eva-agent", "src.mcp_server")
+        saved = {name: logging.getLogger(name).level for name in names}
+        try:
+            configure_module_loggers(logging.DEBUG)
+            assert logging.getLogger("urllib3").level == logging.WARNING
+            assert logging.getLogger("src.core").level == logging.DEBUG
+
+            with patch.object(logging.Logger, "setLevel") as set_level:
+                configure_module_loggers(logging.DEBUG)
+            set_level.assert_not_called()
+
+            with patch.object(logging.Logger, "setLevel") as set_level:
+                configure_module_loggers(logging.INFO)
+            assert set_level.call_count == 4  # only our own modules follow default_level
+        finally:
+            for name, level in saved.items():
+                logging.getLogger(name).setLevel(level)
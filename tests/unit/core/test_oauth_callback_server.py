@@ -0,0 +1,56 @@
+"""
+Tests for the OAuth callback server.
+"""
+import asyncio
+import socket
+
+import aiohttp
+import pytest
+
+from core.oauth_callback_server import _OK_HTML, run_oauth_callback_server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class TestOAuthCallbackServer:
+    """Test the temporary OAuth callback server."""
+
+    async def _call(self, port: int, query: str) -> int:
+        """Hit the callback endpoint once the server is listening."""
+        async with aiohttp.ClientSession() as session:
+            for _ in range(50):
+                try:
+                    async with session.get(f"http://localhost:{port}/callback?{query}") as response:
+                        assert response.content_type == "text/html"
+                        assert await response.read() == _OK_HTML
+                        return response.status
+                except aiohttp.ClientConnectionError:
+                    await asyncio.sleep(0.02)
+        raise AssertionError("callback server did not start")
+
+    @pytest.mark.asyncio
+    async def test_returns_code_on_callback(self):
+        """Test the authorization code is returned as soon as the callback arrives."""
+        port = _free_port()
+        server = asyncio.create_task(run_oauth_callback_server(port, timeout=5))
+
+        assert await self._call(port, "code=abc123&state=xyz") == 200
+        assert await asyncio.wait_for(server, 1) == "abc123"
+
+    @pytest.mark.asyncio
+    async def test_error_callback_returns_none(self):
+        """Test provider errors resolve the wait without a code."""
+        port = _free_port()
+        server = asyncio.create_task(run_oauth_callback_server(port, timeout=5))
+
+        await self._call(port, "error=access_denied")
+        assert await asyncio.wait_for(server, 1) is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_none(self):
+        """Test no callback within the timeout yields None."""
+        assert await run_oauth_callback_server(_free_port(), timeout=0.05) is None
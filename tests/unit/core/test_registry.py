@@ -177,7 +177,7 @@ class TestConnectorRegistry:
         """Test getting tools from empty registry."""
         tools = registry.get_all_tools()
         assert tools == []
-    
+
     @pytest.mark.asyncio
     async def test_execute_tool_success(self, registry):
         """Test successful tool execution."""
@@ -0,0 +1,29 @@
+"""
+Tests for resource models.
+"""
+import json
+from datetime import datetime
+
+from core.resource_models import ResourceContent, ResourceContentType
+
+
+class TestResourceContent:
+    """Test ResourceContent rendering."""
+
+    def test_json_content_as_text(self):
+        """Test JSON content is rendered as indented JSON, including datetimes and int keys."""
+        content = ResourceContent(
+            type=ResourceContentType.JSON,
+            data={"total": 2, "by_day": {1: "mon"}, "last_sync": datetime(2024, 1, 2, 3, 4, 5)},
+        )
+
+        text = content.as_text()
+
+        assert json.loads(text) == {"total": 2, "by_day": {"1": "mon"}, "last_sync": "2024-01-02T03:04:05"}
+        assert text.startswith('{\n  "total": 2')
+
+    def test_text_content_as_text(self):
+        """Test non-JSON content is returned as a string."""
+        content = ResourceContent(type=ResourceContentType.MARKDOWN, data="# Title")
+
+        assert content.as_text() == "# Title"
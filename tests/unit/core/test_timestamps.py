@@ -0,0 +1,43 @@
+"""
+Tests for the cached timestamp formatting.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from core import timestamps
+from core.timestamps import format_timestamp
+
+
+class TestFormatTimestamp:
+    """Test the cached ISO 8601 timestamp formatting."""
+
+    def test_formats_utc_with_microseconds(self):
+        """Test timestamps are UTC with microseconds and the requested suffix."""
+        assert format_timestamp(1700000000.25) == "2023-11-14T22:13:20.250000Z"
+        assert format_timestamp(1700000000.5, suffix="") == "2023-11-14T22:13:20.500000"
+
+    def test_reuses_prefix_within_a_second(self):
+        """Test strftime only runs when the second changes."""
+        with patch.object(timestamps.time, "strftime", wraps=timestamps.time.strftime) as strftime:
+            format_timestamp(1600000000.1)
+            format_timestamp(1600000000.9)
+            assert strftime.call_count == 1
+            assert format_timestamp(1600000001.0) == "2020-09-13T12:26:41.000000Z"
+            assert strftime.call_count == 2
+
+    def test_import_leaves_logging_alone(self):
+        """Test importing the module does not pull in (and run) the logging setup."""
+        code = (
+            "import logging, sys; import core.timestamps; "
+            "print('core.logging_config' in sys.modules, len(logging.getLogger().handlers))"
+        )
+        src = Path(timestamps.__file__).resolve().parents[1]
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": str(src)},
+        ).stdout
+
+        assert output.split() == ["False", "0"]